@@ -7,6 +7,7 @@ import asyncio
 import json
 from datetime import datetime
 from typing import Dict, Any
+from src import events
 from src.content_agents import ContentBrief, ContentEditorInChief
 
 async def generate_sample_post():
@@ -210,7 +211,9 @@ if __name__ == "__main__":
     print("Each agent output shows what needs to be generated by Claude.\n")
     
     # Generate the actual content
+    events.subscribe(events.ConsoleRenderer())
     result = asyncio.run(generate_sample_post())
+    events.flush()
     
     print("\n✅ DEMO COMPLETE!")
     print("\nThe multi-agent system has created a complete content blueprint.")
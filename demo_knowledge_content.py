@@ -7,6 +7,7 @@ Creates deeply informative content optimized for maximum learning
 import asyncio
 import json
 from datetime import datetime
+from src import events
 from src.knowledge_agents import (
     KnowledgeBrief,
     KnowledgeArchitect,
@@ -275,7 +276,9 @@ if __name__ == "__main__":
     print("The goal is maximum information transfer and deep understanding.\n")
     
     # Generate the comprehensive guide
+    events.subscribe(events.ConsoleRenderer())
     result = asyncio.run(generate_comprehensive_guide())
+    events.flush()
     
     print("\n" + "=" * 60)
     print("\n🔬 Want to generate a technical deep dive instead? Run:")
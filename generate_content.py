@@ -2,20 +2,48 @@
 """
 Content Generation Script for Dave Shapiro Blog
 Uses multi-agent system to create high-quality SEO/AI content
+
+Usage:
+    python generate_content.py                                # interactive menu
+    python generate_content.py --batch briefs.jsonl           # run a manifest of briefs
+    python generate_content.py --batch briefs.yaml --workers 8 --astro
+    python generate_content.py --batch briefs.jsonl --trace generated_content/traces.jsonl
+    python generate_content.py --batch briefs.jsonl --profile profiles/batch
+    python generate_content.py --batch briefs.jsonl --events progress --event-log generated_content/events.jsonl
+    python generate_content.py --regenerate RUN_ID --set tone=contrarian   # rerun only the phases the edit affects
+    python generate_content.py --batch briefs.jsonl --no-cache             # rerun every phase, refreshing stored ones
 """
 
+import argparse
 import asyncio
+import atexit
+import contextlib
 import json
+import sys
+import time
 from pathlib import Path
-from datetime import datetime
 from typing import Dict, List, Any
 from src.content_agents import (
     ContentBrief,
     ContentEditorInChief,
+    create_content_brief,
+    brief_from_dict,
+    breaking_news_brief,
+    case_study_brief,
+    default_editor,
+    pipeline_for,
     generate_blog_post,
-    generate_case_study,
     generate_breaking_news
 )
+from src.content_store import ContentArchive, PhaseStore
+from src import events, tracing
+from src.profiling import Profiler
+
+# Every saved run is appended here; query it with ContentArchive.find()
+ARCHIVE = ContentArchive("generated_content/archive")
+
+# Pipeline phase outputs by fingerprint, so an edited brief only reruns the phases it affects
+PHASES = PhaseStore("generated_content/phases", blobs=ARCHIVE.blobs)
 
 # Content Ideas Queue
 CONTENT_QUEUE = [
@@ -68,6 +96,9 @@ CONTENT_QUEUE = [
     }
 ]
 
+# Theme the weekly calendar's posts share, researched once per week
+WEEKLY_TOPIC_CLUSTER = "Enterprise AI adoption in marketing and SEO"
+
 # High-Performance Content Topics
 PILLAR_CONTENT = [
     "The Complete Guide to AI-Powered SEO in 2025",
@@ -149,7 +180,7 @@ async def generate_pillar_post(topic: str):
         urgency_level="high"
     )
     
-    editor = ContentEditorInChief()
+    editor = ContentEditorInChief(node_cache=PHASES)
     return await editor.create_blog_post(brief)
 
 async def generate_series(series_name: str):
@@ -164,7 +195,7 @@ async def generate_series(series_name: str):
     posts = []
     subtopics = CONTENT_SERIES[series_name]
     
-    editor = ContentEditorInChief()
+    editor = ContentEditorInChief(node_cache=PHASES)
     series_posts = await editor.create_content_series(series_name, subtopics)
     
     return series_posts
@@ -174,71 +205,90 @@ async def generate_weekly_content():
     print("\n🗓️ GENERATING WEEKLY CONTENT CALENDAR")
     print("=" * 60)
     
-    weekly_posts = []
-    
-    # Monday: Breaking News
-    print("\n📅 Monday: Breaking News Post")
-    breaking = await generate_breaking_news_post()
-    weekly_posts.append({"day": "Monday", "type": "breaking-news", "content": breaking})
-    
-    # Wednesday: How-To Guide
-    print("\n📅 Wednesday: Practical How-To")
-    howto = await generate_blog_post(
-        "How to Implement AI in Your Marketing Team (30-Day Playbook)",
-        content_type="how-to",
-        word_count=2500
-    )
-    weekly_posts.append({"day": "Wednesday", "type": "how-to", "content": howto})
+    news_item = CONTENT_QUEUE[0]
+    case_item = CONTENT_QUEUE[1]
+    calendar = [
+        # (day, type, brief, pipeline)
+        ("Monday", "breaking-news", breaking_news_brief(
+            news=news_item["topic"],
+            angle=news_item["angle"],
+            implications=news_item["implications"]
+        ), "breaking-news"),
+        ("Wednesday", "how-to", create_content_brief(
+            "How to Implement AI in Your Marketing Team (30-Day Playbook)",
+            content_type="how-to",
+            word_count=2500
+        ), "pillar"),
+        ("Friday", "case-study", case_study_brief(
+            client=case_item["client"],
+            results=case_item["results"],
+            challenge=case_item["challenge"],
+            solution=case_item["solution"]
+        ), "pillar")
+    ]
+    for day, post_type, brief, _ in calendar:
+        print(f"📅 {day}: {post_type} — {brief.topic}")
     
-    # Friday: Case Study
-    print("\n📅 Friday: Case Study")
-    case_item = CONTENT_QUEUE[1]  # Case study from queue
-    case = await generate_case_study(
-        client=case_item["client"],
-        results=case_item["results"],
-        challenge=case_item["challenge"],
-        solution=case_item["solution"]
+    # One keyword research run for the whole week, then all three posts at once
+    posts = await default_editor().create_cluster_posts(
+        WEEKLY_TOPIC_CLUSTER,
+        [brief for _, _, brief, _ in calendar],
+        [pipeline for _, _, _, pipeline in calendar]
     )
-    weekly_posts.append({"day": "Friday", "type": "case-study", "content": case})
-    
-    return weekly_posts
+    return [
+        {"day": day, "type": post_type, "content": post}
+        for (day, post_type, _, _), post in zip(calendar, posts)
+    ]
 
 def save_content(content: Dict, filename: str):
-    """Save generated content to file"""
-    output_dir = Path("generated_content")
-    output_dir.mkdir(exist_ok=True)
+    """Append generated content to the run archive"""
+    entry = ARCHIVE.append(content, kind=filename)
     
-    filepath = output_dir / f"{filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    
-    with open(filepath, 'w') as f:
-        json.dump(content, f, indent=2, default=str)
-    
-    print(f"\n💾 Content saved to: {filepath}")
-    return filepath
+    print(f"\n💾 Content archived as run {entry['run_id']} ({entry['slug']}) in {ARCHIVE.root}/{entry['segment']}")
+    return entry
+
+def _page_fields(content: Dict, slug: str) -> Dict[str, str]:
+    """Pull out the few fields an Astro page actually renders"""
+    headlines = content.get('headlines') or {}
+    final_content = content.get('final_content') or {}
+    brief = content.get('brief') or {}
+    return {
+        'title': headlines.get('primary') or brief.get('topic') or slug,
+        'description': headlines.get('meta_description') or '',
+        'html': final_content.get('html') or ''
+    }
 
 def create_astro_page(content: Dict, slug: str):
-    """Convert content to Astro page format"""
+    """Convert content to Astro page format
+
+    Only the rendered article and its title/description go into the page
+    module; the full pipeline result is written to a sidecar JSON file in
+    generated_content/pages/ so it never reaches the Astro build.
+    """
+    fields = _page_fields(content, slug)
     astro_template = f"""---
-import PageLayout from '../layouts/PageLayout.astro';
-import Section from '../components/common/Section.astro';
+import PageLayout from '../../layouts/PageLayout.astro';
+import Section from '../../components/common/Section.astro';
 
-const content = {json.dumps(content, indent=2)};
+const title = {json.dumps(fields['title'], ensure_ascii=False)};
+const description = {json.dumps(fields['description'], ensure_ascii=False)};
+const html = {json.dumps(fields['html'], ensure_ascii=False)};
 ---
 
 <PageLayout 
-  title="{{content.headlines.primary}}"
-  description="{{content.headlines.meta_description}}"
+  title={{title}}
+  description={{description}}
 >
   <article class="prose prose-lg max-w-4xl mx-auto px-4 py-12">
     <h1 class="text-4xl md:text-5xl font-bold mb-8">
-      {{content.headlines.primary}}
+      {{title}}
     </h1>
     
     <div class="text-gray-600 mb-8">
       By Dave Shapiro | {{new Date().toLocaleDateString()}}
     </div>
     
-    <div set:html={{content.final_content.html}} />
+    <div set:html={{html}} />
     
     <Section class="mt-12 p-8 bg-blue-50 rounded-lg">
       <h2 class="text-2xl font-bold mb-4">Ready to Transform Your Growth?</h2>
@@ -263,9 +313,124 @@ const content = {json.dumps(content, indent=2)};
     with open(filepath, 'w') as f:
         f.write(astro_template)
     
+    # Pipeline intermediates live outside src/ so Astro never bundles them
+    sidecar_dir = Path("generated_content/pages")
+    sidecar_dir.mkdir(parents=True, exist_ok=True)
+    
+    sidecar_path = sidecar_dir / f"{slug}.json"
+    with open(sidecar_path, 'w') as f:
+        json.dump(content, f, indent=2, default=str)
+    
     print(f"\n📄 Astro page created: {filepath}")
+    print(f"🗂️ Pipeline data saved to: {sidecar_path}")
     return filepath
 
+def load_brief_manifest(path: str) -> List[Dict[str, Any]]:
+    """Read briefs from a JSON Lines or YAML manifest"""
+    manifest_path = Path(path)
+    if manifest_path.suffix in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise SystemExit("❌ YAML manifests need PyYAML: pip install pyyaml")
+        with open(manifest_path) as f:
+            data = yaml.safe_load(f) or []
+        entries = data.get('briefs', []) if isinstance(data, dict) else data
+    else:
+        entries = []
+        with open(manifest_path) as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError as error:
+                    raise SystemExit(f"❌ {path}:{line_number}: invalid JSON ({error.msg})")
+    for number, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict) or not entry.get('topic'):
+            raise SystemExit(f"❌ {path}: brief #{number} needs at least a topic")
+    return entries
+
+async def run_batch(manifest: str, workers: int = 4, astro: bool = False) -> int:
+    """Run every brief in a manifest concurrently; returns the number of failures"""
+    entries = load_brief_manifest(manifest)
+    total = len(entries)
+    print(f"\n📦 Batch: {total} briefs from {manifest} with {workers} workers")
+    print("=" * 60)
+
+    editor = ContentEditorInChief(node_cache=PHASES)
+    semaphore = asyncio.Semaphore(workers)
+    started = time.perf_counter()
+
+    async def run_one(entry: Dict[str, Any]):
+        """Generate and save one brief; failures come back with their entry instead of raising"""
+        try:
+            brief = brief_from_dict(entry)
+            queued = time.perf_counter()
+            async with semaphore:
+                began = time.perf_counter()
+                with tracing.trace_run('content', brief.topic, queue_wait=began - queued):
+                    post = await editor.create_blog_post(brief, pipeline_for(brief))
+                elapsed = time.perf_counter() - began
+            # Write each result as soon as its brief finishes
+            saved = save_content(post, entry.get('kind', brief.content_type))
+            if astro:
+                create_astro_page(post, entry.get('slug') or saved['slug'])
+            return entry, elapsed, None
+        except Exception as error:
+            return entry, None, error
+
+    tasks = [asyncio.ensure_future(run_one(entry)) for entry in entries]
+    done, failed = 0, 0
+    for future in asyncio.as_completed(tasks):
+        done += 1
+        entry, elapsed, error = await future
+        if error is not None:
+            failed += 1
+            print(f"[{done}/{total}] ❌ {entry['topic']}: {error}")
+            continue
+        print(f"[{done}/{total}] ✅ {entry['topic']} ({elapsed:.1f}s)")
+
+    print(f"\n🏁 {done - failed}/{total} briefs completed in {time.perf_counter() - started:.1f}s")
+    if failed:
+        print(f"❌ {failed} briefs failed")
+    return failed
+
+def parse_overrides(assignments: List[str]) -> Dict[str, Any]:
+    """FIELD=VALUE pairs; values are read as JSON when they parse (lists, numbers), else as text"""
+    overrides = {}
+    for assignment in assignments:
+        name, separator, value = assignment.partition('=')
+        if not separator or name not in ContentBrief.__dataclass_fields__:
+            raise SystemExit(f"❌ --set {assignment!r}: expected FIELD=VALUE with a brief field")
+        try:
+            overrides[name] = json.loads(value)
+        except json.JSONDecodeError:
+            overrides[name] = value
+    return overrides
+
+async def regenerate(run_id: str, overrides: Dict[str, Any]) -> Dict:
+    """Rerun an archived post with an edited brief, reusing every phase the edit does not touch"""
+    matches = ARCHIVE.find(run_id=run_id)
+    if not matches:
+        raise SystemExit(f"❌ Unknown run: {run_id}")
+    entry = matches[0]
+    previous = ARCHIVE.load(entry)
+    if not isinstance(previous, dict) or 'brief' not in previous:
+        raise SystemExit(f"❌ Run {run_id} is a {entry['kind']} run, not a single post")
+    brief = brief_from_dict({**previous['brief'], **overrides})
+    
+    print(f"\n♻️ REGENERATING {entry['slug']} ({', '.join(overrides) or 'no changes'})")
+    print("=" * 60)
+    
+    pipeline = previous.get('metadata', {}).get('pipeline', 'pillar')
+    post = await ContentEditorInChief(node_cache=PHASES).create_blog_post(brief, pipeline)
+    reused = post['metadata']['reused_phases']
+    print(f"♻️ Reused {len(reused)} phases: {', '.join(reused) or 'none'}")
+    save_content(post, entry['kind'])
+    return post
+
 async def main():
     """Main execution function"""
     print("\n🚀 DAVE SHAPIRO BLOG CONTENT GENERATOR")
@@ -336,5 +501,40 @@ async def main():
         else:
             print("\n❌ Invalid choice. Please try again.")
 
+def cli():
+    parser = argparse.ArgumentParser(description="Multi-agent blog content generator")
+    parser.add_argument('--batch', metavar='MANIFEST', help='JSON Lines or YAML manifest of briefs to run without prompts')
+    parser.add_argument('--workers', type=int, default=4, help='briefs to run concurrently in batch mode')
+    parser.add_argument('--astro', action='store_true', help='also write an Astro page for each finished brief')
+    parser.add_argument('--trace', metavar='FILE', help='append phase/agent spans to FILE (JSON Lines) and print a summary')
+    parser.add_argument('--profile', metavar='DIR', help='write per-phase wall/CPU/memory and collapsed stacks to DIR')
+    parser.add_argument('--regenerate', metavar='RUN_ID', help='rerun an archived post, reusing phases its edits do not affect')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='rerun every pipeline phase instead of reusing stored ones (and overwrite them)')
+    parser.add_argument('--set', dest='overrides', metavar='FIELD=VALUE', action='append', default=[],
+                        help='brief field to change with --regenerate (repeatable)')
+    events.add_arguments(parser)
+    args = parser.parse_args()
+    if args.overrides and not args.regenerate:
+        parser.error('--set only applies with --regenerate')
+    events.subscribe_from_args(args)
+    PHASES.refresh = args.no_cache
+
+    if args.trace:
+        tracer = tracing.configure(args.trace)
+        atexit.register(lambda: tracing.print_summary([span.to_dict() for span in tracer.spans]))
+
+    profiler = Profiler(args.profile) if args.profile else contextlib.nullcontext()
+    with profiler:
+        if args.batch:
+            failures = asyncio.run(run_batch(args.batch, max(1, args.workers), args.astro))
+        elif args.regenerate:
+            asyncio.run(regenerate(args.regenerate, parse_overrides(args.overrides)))
+        else:
+            failures = asyncio.run(main())
+        events.flush()
+    if args.batch:
+        sys.exit(1 if failures else 0)
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    cli()
\ No newline at end of file
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Build the static on-site search index from generated content
+
+Every generated/*.md draft (plus the title, description and keywords from its
+.meta.json) is tokenized into an inverted index: term -> [[doc id, [positions]]].
+The index is written as small JSON shards keyed by term prefix under
+public/search-index/, so the browser only fetches the shards a query touches.
+
+Rebuilds are incremental: a state file remembers each slug's content hash and
+terms, so only changed slugs are re-tokenized and only the shards they touch
+are rewritten. If the index on disk is missing or incomplete (say
+public/search-index/ was deleted) the state is ignored and everything is
+rebuilt.
+
+Usage:
+    python scripts/build-search-index.py            # index changed slugs
+    python scripts/build-search-index.py --force    # rebuild everything
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+SOURCE_DIR = 'generated'
+INDEX_DIR = 'public/search-index'
+STATE_FILE = '.search-index-state.json'  # gitignored; only the index itself is published
+INDEX_VERSION = 1
+SHARD_PREFIX_LENGTH = 2
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:['’][a-z]+)?")
+
+STOPWORDS = frozenset("""
+a about above after again against all am an and any are as at be because been before being
+below between both but by can could did do does doing down during each few for from further
+had has have having he her here hers him his how i if in into is it its itself just me more
+most my no nor not now of off on once only or other our ours out over own same she should so
+some such than that the their theirs them then there these they this those through to too
+under until up very was we were what when where which while who whom why will with would you
+your yours
+""".split())
+
+def tokenize(text):
+    """Lowercase word tokens (stopwords are dropped at indexing but still count as positions)"""
+    return TOKEN_PATTERN.findall(text.lower().replace('’', "'"))
+
+def shard_key(term):
+    """Shard name for a term; short or non-alphanumeric prefixes share a shard"""
+    prefix = term[:SHARD_PREFIX_LENGTH]
+    return prefix if prefix.isalnum() else '_'
+
+def load_document(markdown_path):
+    """Read a draft and its metadata sidecar into a searchable document"""
+    slug = markdown_path.stem
+    body = markdown_path.read_text(encoding='utf-8')
+    meta_path = markdown_path.with_suffix('.meta.json')
+    meta = {}
+    if meta_path.exists():
+        meta = json.loads(meta_path.read_text(encoding='utf-8')).get('meta', {})
+
+    title = meta.get('title') or slug.replace('-', ' ').strip().title()
+    description = meta.get('description', '')
+    keywords = meta.get('keywords') or []
+
+    digest = hashlib.sha256(body.encode('utf-8'))
+    digest.update(json.dumps([title, description, keywords], sort_keys=True).encode('utf-8'))
+
+    return {
+        'slug': slug,
+        'title': title,
+        'description': description,
+        'hash': digest.hexdigest(),
+        'text': '\n'.join([title, description, ' '.join(keywords), body])
+    }
+
+def index_document(text):
+    """Build term -> positions for one document"""
+    postings = defaultdict(list)
+    for position, token in enumerate(tokenize(text)):
+        if token not in STOPWORDS:
+            postings[token].append(position)
+    return postings
+
+def _write_json(path, data):
+    """Write compact, key-sorted JSON only when the bytes change"""
+    content = json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False) + '\n'
+    if path.exists() and path.read_text(encoding='utf-8') == content:
+        return False
+    path.write_text(content, encoding='utf-8')
+    return True
+
+def index_intact(index_dir):
+    """Whether the manifest, docs table and every listed shard are on disk"""
+    manifest_path = index_dir / 'manifest.json'
+    if not manifest_path.exists() or not (index_dir / 'docs.json').exists():
+        return False
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    except ValueError:
+        return False
+    return all((index_dir / f'{key}.json').exists() for key in manifest.get('shards', []))
+
+def build_index(source_dir=SOURCE_DIR, index_dir=INDEX_DIR, state_path=STATE_FILE, force=False):
+    """Re-index changed slugs and rewrite only the shards they touch"""
+    index_dir = Path(index_dir)
+    state_path = Path(state_path)
+    if not force and state_path.exists() and not index_intact(index_dir):
+        print(f"⚠️ {index_dir}/ is missing or incomplete; rebuilding the whole index")
+        force = True
+    index_dir.mkdir(parents=True, exist_ok=True)
+
+    state = {'version': INDEX_VERSION, 'next_id': 0, 'docs': {}}
+    if state_path.exists() and not force:
+        saved = json.loads(state_path.read_text(encoding='utf-8'))
+        if saved.get('version') == INDEX_VERSION:
+            state = saved
+
+    documents = {path.stem: path for path in sorted(Path(source_dir).glob('*.md'))}
+    removed = [slug for slug in state['docs'] if slug not in documents]
+    changed = {}
+    for slug, path in documents.items():
+        document = load_document(path)
+        previous = state['docs'].get(slug)
+        if force or previous is None or previous['hash'] != document['hash']:
+            changed[slug] = document
+
+    print(f"🔎 {len(documents)} documents: {len(changed)} changed, {len(removed)} removed")
+    if not changed and not removed and not force:
+        return 0
+
+    # Shards that lose or gain postings
+    touched = set()
+    stale_ids = set()
+    for slug in removed + list(changed):
+        previous = state['docs'].get(slug)
+        if previous:
+            stale_ids.add(previous['id'])
+            touched.update(shard_key(term) for term in previous['terms'])
+
+    new_postings = {}
+    for slug, document in changed.items():
+        previous = state['docs'].get(slug)
+        doc_id = previous['id'] if previous else state['next_id']
+        if not previous:
+            state['next_id'] += 1
+        postings = index_document(document['text'])
+        new_postings[doc_id] = postings
+        touched.update(shard_key(term) for term in postings)
+        state['docs'][slug] = {
+            'id': doc_id,
+            'hash': document['hash'],
+            'title': document['title'],
+            'description': document['description'],
+            'terms': sorted(postings)
+        }
+    for slug in removed:
+        del state['docs'][slug]
+
+    if force:
+        touched.update(path.stem for path in index_dir.glob('*.json')
+                       if path.stem not in ('manifest', 'docs'))
+
+    # Merge: drop stale postings, add fresh ones, per touched shard
+    written = 0
+    for key in sorted(touched):
+        shard_path = index_dir / f'{key}.json'
+        shard = {}
+        if shard_path.exists() and not force:
+            shard = json.loads(shard_path.read_text(encoding='utf-8'))
+        for term in list(shard):
+            shard[term] = [entry for entry in shard[term] if entry[0] not in stale_ids]
+        for doc_id, postings in new_postings.items():
+            for term, positions in postings.items():
+                if shard_key(term) == key:
+                    shard.setdefault(term, []).append([doc_id, positions])
+        shard = {term: sorted(entries) for term, entries in shard.items() if entries}
+        if shard:
+            written += _write_json(shard_path, shard)
+        elif shard_path.exists():
+            shard_path.unlink()
+            written += 1
+
+    shards = sorted(path.stem for path in index_dir.glob('*.json') if path.stem not in ('manifest', 'docs'))
+    docs = {
+        str(entry['id']): {'slug': slug, 'title': entry['title'], 'description': entry['description']}
+        for slug, entry in state['docs'].items()
+    }
+    _write_json(index_dir / 'docs.json', docs)
+    _write_json(index_dir / 'manifest.json', {
+        'version': INDEX_VERSION,
+        'shardPrefixLength': SHARD_PREFIX_LENGTH,
+        'stopwords': sorted(STOPWORDS),
+        'shards': shards
+    })
+    state_path.write_text(json.dumps(state, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+
+    print(f"✅ Rewrote {written} of {len(shards)} shards in {index_dir}/")
+    return written
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the sharded static search index')
+    parser.add_argument('--source', default=SOURCE_DIR, help='directory of generated drafts')
+    parser.add_argument('--output', default=INDEX_DIR, help='where index shards are written')
+    parser.add_argument('--state', default=STATE_FILE, help='incremental build state file')
+    parser.add_argument('--force', action='store_true', help='re-index every document')
+    args = parser.parse_args()
+
+    if not Path(args.source).is_dir():
+        print(f"❌ Source directory not found: {args.source}")
+        sys.exit(1)
+
+    build_index(args.source, args.output, args.state, args.force)
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,8 @@
 
 import { CompletePipeline } from '../src/lib/content-pipeline/complete-pipeline';
 import type { ResearchRequest } from '../src/lib/content-pipeline/config';
+import { buildArtifacts } from '../src/lib/content-pipeline/build-manifest';
+import { FORMATTER_VERSION } from '../src/lib/content-pipeline/formatter';
 import * as fs from 'fs';
 import * as path from 'path';
 
@@ -109,39 +111,45 @@ Output: ${options.output}
 
     const baseName = slugify(keyword);
 
-    // Generate all output formats
+    // Generate all output formats (only those whose inputs changed)
     const outputs = [
       {
         name: 'Astro Component',
         path: path.join(outputDir, `${baseName}.astro`),
-        content: await pipeline.generateAstroPage(result)
+        templateVersion: FORMATTER_VERSION,
+        render: () => pipeline.generateAstroPage(result)
       },
       {
         name: 'Markdown Report',
         path: path.join(outputDir, `${baseName}.md`),
-        content: await pipeline.generateMarkdown(result)
+        templateVersion: FORMATTER_VERSION,
+        render: () => pipeline.generateMarkdown(result)
       },
       {
         name: 'HTML Document',
         path: path.join(outputDir, `${baseName}.html`),
-        content: await pipeline.generateHTML(result)
+        templateVersion: FORMATTER_VERSION,
+        render: () => pipeline.generateHTML(result)
       },
       {
         name: 'Research Metadata',
         path: path.join(outputDir, `${baseName}.meta.json`),
-        content: JSON.stringify(result, null, 2)
+        templateVersion: 'json-1',
+        render: () => JSON.stringify(result, null, 2)
       },
       {
         name: 'Quality Score',
         path: path.join(outputDir, `${baseName}.score.json`),
-        content: JSON.stringify(qualityScore, null, 2)
+        templateVersion: 'json-1',
+        render: () => JSON.stringify(qualityScore, null, 2)
       }
     ];
 
     // Save all files
-    outputs.forEach(output => {
-      fs.writeFileSync(output.path, output.content);
-      console.log(`✅ ${output.name}: ${output.path}`);
+    const built = await buildArtifacts(outputDir, [request, result, qualityScore], outputs);
+    built.forEach(output => {
+      const marker = output.status === 'built' ? '✅' : '⏭️ ';
+      console.log(`${marker} ${output.name}: ${output.path}${output.status === 'unchanged' ? ' (unchanged)' : ''}`);
     });
 
     const elapsedTime = Math.round((Date.now() - startTime) / 1000);
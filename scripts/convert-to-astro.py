@@ -1,154 +1,349 @@
 #!/usr/bin/env python3
 """
 Convert AI ROI markdown draft to Astro page with premium styling
+
+Usage:
+    python scripts/convert-to-astro.py                 # AI ROI draft -> src/pages/ai-roi-analysis.astro
+    python scripts/convert-to-astro.py --bulk          # every draft in workshop-output/, generated/, real-test/
+    python scripts/convert-to-astro.py --bulk DIR ...  # every draft in the given directories
 """
 
+import argparse
+import hashlib
+import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+
+BULK_SOURCE_DIRS = ['workshop-output', 'generated', 'real-test']
+BULK_OUTPUT_DIR = 'converted'
+BULK_MANIFEST = '.convert-manifest.json'  # kept inside the output directory
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PAGES_DIR = REPO_ROOT / 'src' / 'pages'
+PAGE_LAYOUT = REPO_ROOT / 'src' / 'layouts' / 'PageLayout.astro'
+AI_ROI_PAGE = PAGES_DIR / 'ai-roi-analysis.astro'
+
+# Block-level syntax, matched once per line. Order matters: rules before bullets
+# (so "***" isn't read as a list item) and fences before everything else.
+BLOCK_PATTERN = re.compile(r"""
+    (?P<fence>^\s*(?P<fence_marker>```|~~~)\s*(?P<lang>[\w+-]*)\s*$)
+  | (?P<heading>^(?P<hashes>\#{1,6})\s+(?P<heading_text>.*?)\s*\#*\s*$)
+  | (?P<rule>^\s*(?:-{3,}|\*{3,}|_{3,})\s*$)
+  | (?P<quote>^\s*>\s?(?P<quote_text>.*)$)
+  | (?P<bullet>^\s*[-*+]\s+(?P<bullet_text>.*)$)
+  | (?P<ordered>^\s*(?P<number>\d+)[.)]\s+(?P<ordered_text>.*)$)
+  | (?P<table>^\s*\|.*\|\s*$)
+  | (?P<blank>^\s*$)
+""", re.VERBOSE)
+
+# Inline syntax as a single alternation so each line is scanned once
+INLINE_PATTERN = re.compile(
+    r'(?P<code_marker>`+)(?P<code>.+?)(?P=code_marker)'
+    r'|\[(?P<link_text>[^\]]+)\]\((?P<link_href>[^)\s]+)(?:\s+"[^"]*")?\)'
+    r'|\*\*(?P<strong>.+?)\*\*'
+    r'|__(?P<strong_alt>.+?)__'
+    # Emphasis stops at the first closing marker and may only contain its own marker as a
+    # nested strong span, so a line of unclosed markers is scanned in linear time
+    r'|\*(?P<em>[^*\s](?:(?:[^*]|\*\*[^*]+\*\*)*?[^*\s])??)\*'
+    r'|(?<!\w)_(?P<em_alt>[^_\s](?:(?:[^_]|__[^_]+__)*?[^_\s])??)_(?!\w)'
+)
+
+TABLE_SEPARATOR_PATTERN = re.compile(r'^\s*\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?\s*$')
+
+METADATA_PREFIXES = ('**By', '*Former', 'Reading time')
+
+CODE_ESCAPES = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '{': '&#123;',
+    '}': '&#125;'
+})
+
+def escape_code(text):
+    """Escape code so neither HTML nor Astro expressions are interpreted"""
+    return text.translate(CODE_ESCAPES)
+
+def _render_inline_match(match):
+    kind = match.lastgroup
+    if kind == 'code':
+        return f'<code>{escape_code(match.group("code").strip())}</code>'
+    if kind == 'link_href':
+        text = process_inline_markdown(match.group('link_text'))
+        return f'<a href="{match.group("link_href")}" class="text-accent hover:text-primary-glow underline">{text}</a>'
+    if kind in ('strong', 'strong_alt'):
+        return f'<strong class="text-accent">{process_inline_markdown(match.group(kind))}</strong>'
+    return f'<em>{process_inline_markdown(match.group(kind))}</em>'
 
-def markdown_to_astro_html(markdown_text):
+def process_inline_markdown(text):
+    """Process inline markdown (code, links, bold, italic) in a single pass"""
+    return INLINE_PATTERN.sub(_render_inline_match, text)
+
+def _split_table_row(line):
+    return [cell.strip() for cell in line.strip().strip('|').split('|')]
+
+class AstroMarkdownRenderer:
+    """
+    Single-pass Markdown renderer for workshop drafts.
+
+    Lines are fed one at a time; each completed H2 section is rendered with
+    process_section and handed to on_section, so callers can either collect
+    the sections or write them out as they finish.
+    """
+
+    def __init__(self, on_section, rules=None):
+        self.on_section = on_section
+        self.rules = rules
+        self.line_number = 0
+        self.section_title = None
+        self.section_parts = []
+        self.block = None  # 'bullet', 'ordered', 'quote', 'table', 'code'
+        self.block_lines = []
+        self.fence_marker = None
+        self.code_lang = ''
+        self.list_start = 1
+
+    def feed(self, line):
+        line = line.rstrip('\r\n')
+        self.line_number += 1
+
+        if self.block == 'code':
+            if line.strip().startswith(self.fence_marker):
+                self._close_block()
+            else:
+                self.block_lines.append(line)
+            return
+
+        # Skip byline metadata at top
+        if self.line_number <= 10 and line.startswith(METADATA_PREFIXES):
+            return
+
+        match = BLOCK_PATTERN.match(line)
+        kind = match.lastgroup if match else None
+
+        if kind == 'fence':
+            self._close_block()
+            self.block = 'code'
+            self.fence_marker = match.group('fence_marker')
+            self.code_lang = match.group('lang')
+        elif kind == 'heading':
+            self._close_block()
+            self._add_heading(len(match.group('hashes')), match.group('heading_text'))
+        elif kind in ('rule', 'blank'):
+            self._close_block()
+        elif kind == 'quote':
+            self._append_block('quote', match.group('quote_text'))
+        elif kind == 'bullet':
+            self._append_block('bullet', match.group('bullet_text'))
+        elif kind == 'ordered':
+            if self.block != 'ordered':
+                self._close_block()
+                self.list_start = int(match.group('number'))
+            self._append_block('ordered', match.group('ordered_text'))
+        elif kind == 'table':
+            self._append_block('table', line)
+        elif self.block in ('bullet', 'ordered') and line[:1].isspace():
+            # Indented continuation of the previous list item
+            self.block_lines[-1] += ' ' + line.strip()
+        else:
+            # Drafts put one paragraph per line, so each line stands alone
+            self._close_block()
+            self.section_parts.append(f'<p>{process_inline_markdown(line.strip())}</p>')
+
+    def finish(self):
+        self._close_block()
+        self._close_section()
+
+    def _append_block(self, block, text):
+        if self.block != block:
+            self._close_block()
+            self.block = block
+        self.block_lines.append(text)
+
+    def _add_heading(self, level, text):
+        if level == 1:
+            return  # The page template renders its own H1
+        if level == 2:
+            self._close_section()
+            self.section_title = text
+            return
+        level = min(level, 4)
+        self.section_parts.append(f'<h{level}>{process_inline_markdown(text)}</h{level}>')
+
+    def _close_block(self):
+        block, lines = self.block, self.block_lines
+        self.block, self.block_lines = None, []
+        if not lines and block != 'code':
+            return
+        if block == 'bullet':
+            items = ' '.join(f'<li>{process_inline_markdown(item)}</li>' for item in lines)
+            self.section_parts.append(f'<ul class="space-y-2 ml-4 text-white/90">{items}</ul>')
+        elif block == 'ordered':
+            items = ' '.join(f'<li>{process_inline_markdown(item)}</li>' for item in lines)
+            start = f' start="{self.list_start}"' if self.list_start != 1 else ''
+            self.section_parts.append(f'<ol class="list-decimal space-y-2 ml-6 text-white/90"{start}>{items}</ol>')
+        elif block == 'quote':
+            self.section_parts.append(self._render_quote(lines))
+        elif block == 'table':
+            self.section_parts.append(self._render_table(lines))
+        elif block == 'code':
+            lang = f' class="language-{self.code_lang}"' if self.code_lang else ''
+            code = escape_code('\n'.join(lines))
+            self.section_parts.append(f'<pre class="glass-morphism p-6 rounded-xl overflow-x-auto"><code{lang}>{code}</code></pre>')
+
+    def _render_quote(self, lines):
+        paragraphs, current = [], []
+        for text in lines:
+            if text.strip():
+                current.append(text.strip())
+            elif current:
+                paragraphs.append(current)
+                current = []
+        if current:
+            paragraphs.append(current)
+        body = ''.join(f'<p>{process_inline_markdown(" ".join(p))}</p>' for p in paragraphs)
+        return f'<blockquote class="border-l-4 border-accent pl-6 italic text-white/80">{body}</blockquote>'
+
+    def _render_table(self, lines):
+        header = None
+        rows = [_split_table_row(line) for line in lines]
+        if len(lines) > 1 and TABLE_SEPARATOR_PATTERN.match(lines[1]):
+            header, rows = rows[0], rows[2:]
+        html = ['<div class="overflow-x-auto"><table class="w-full text-left text-white/90">']
+        if header:
+            cells = ''.join(f'<th class="p-3 border-b border-white/20">{process_inline_markdown(c)}</th>' for c in header)
+            html.append(f'<thead><tr>{cells}</tr></thead>')
+        html.append('<tbody>')
+        for row in rows:
+            cells = ''.join(f'<td class="p-3 border-b border-white/10">{process_inline_markdown(c)}</td>' for c in row)
+            html.append(f'<tr>{cells}</tr>')
+        html.append('</tbody></table></div>')
+        return ''.join(html)
+
+    def _close_section(self):
+        if self.section_title is not None or self.section_parts:
+            self.on_section(process_section(self.section_title, '\n'.join(self.section_parts), self.rules))
+        self.section_title = None
+        self.section_parts = []
+
+def markdown_to_astro_html(markdown_text, rules=None):
     """Convert markdown to Astro-compatible HTML with premium styling"""
-
-    # Split into sections
-    lines = markdown_text.split('\n')
     html_parts = []
-    in_section = False
-    section_content = []
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # Skip metadata at top
-        if i < 10 and (line.startswith('**By') or line.startswith('*Former') or line.startswith('Reading time')):
-            i += 1
-            continue
-
-        # H2 Headers - Section titles
-        if line.startswith('## '):
-            # Close previous section if exists
-            if section_content:
-                html_parts.append(process_section('\n'.join(section_content)))
-                section_content = []
-
-            title = line.replace('## ', '').strip()
-            section_content.append(f'<h2>{title}</h2>')
-            in_section = True
-
-        # H3 Headers - Subsections
-        elif line.startswith('### '):
-            title = line.replace('### ', '').strip()
-            section_content.append(f'<h3>{title}</h3>')
-
-        # H4 Headers
-        elif line.startswith('#### '):
-            title = line.replace('#### ', '').strip()
-            section_content.append(f'<h4>{title}</h4>')
-
-        # Bullet points
-        elif line.strip().startswith('- ') or line.strip().startswith('* '):
-            # Collect all bullets
-            bullets = []
-            while i < len(lines) and (lines[i].strip().startswith('- ') or lines[i].strip().startswith('* ')):
-                bullet = lines[i].strip()[2:]  # Remove '- ' or '* '
-                bullets.append(f'<li>{process_inline_markdown(bullet)}</li>')
-                i += 1
-            section_content.append(f'<ul class="space-y-2 ml-4 text-white/90">{" ".join(bullets)}</ul>')
-            continue
-
-        # Paragraphs
-        elif line.strip() and not line.startswith('#') and not line.startswith('---'):
-            section_content.append(f'<p>{process_inline_markdown(line)}</p>')
-
-        # Empty lines
-        elif not line.strip():
-            pass  # Skip empty lines
-
-        i += 1
-
-    # Add final section
-    if section_content:
-        html_parts.append(process_section('\n'.join(section_content)))
-
+    renderer = AstroMarkdownRenderer(html_parts.append, rules)
+    for line in markdown_text.split('\n'):
+        renderer.feed(line)
+    renderer.finish()
     return '\n\n'.join(html_parts)
 
-def process_inline_markdown(text):
-    """Process inline markdown (bold, italic, links)"""
-    # Bold
-    text = re.sub(r'\*\*(.+?)\*\*', r'<strong class="text-accent">\1</strong>', text)
-    text = re.sub(r'__(.+?)__', r'<strong class="text-accent">\1</strong>', text)
-
-    # Italic
-    text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
-    text = re.sub(r'_(.+?)_', r'<em>\1</em>', text)
-
-    # Links
-    text = re.sub(r'\[(.+?)\]\((.+?)\)', r'<a href="\2" class="text-accent hover:text-primary-glow underline">\1</a>', text)
-
-    return text
-
-def process_section(content):
-    """Wrap section content in styled container"""
-    # Detect section type by header
-    if '<h2>The Hook</h2>' in content or '<h2>## The Hook</h2>' in content:
-        return f'''
+SECTION_TEMPLATES = {
+    # Boxed intro with no visible heading
+    'callout': '''
 <div class="prose prose-lg prose-invert max-w-none mb-16">
   <div class="glass-morphism p-8 rounded-2xl border border-white/10 shadow-xl mb-8">
-    {content.replace('<h2>The Hook</h2>', '').replace('<h2>## The Hook</h2>', '')}
+    {content}
   </div>
-</div>'''
-
-    elif 'The Stakes' in content or 'The 95/5 Divide' in content or 'The Proof' in content or 'The Playbook' in content or 'The Ammunition' in content or 'Take Action' in content:
-        # Extract title
-        title_match = re.search(r'<h2>(.+?)</h2>', content)
-        title = title_match.group(1) if title_match else 'Section'
-
-        # Add gradient to title
-        if 'Stakes' in title:
-            title_html = '<span class="bg-gradient-to-r from-accent to-primary-glow bg-clip-text text-transparent">The Stakes:</span> Why Internal Champions Must Act Now'
-        elif '95/5' in title:
-            title_html = 'The 95/5 Divide: What Separates Winners from Losers'
-        elif 'Proof' in title:
-            title_html = 'The Proof: Real Companies, Real Numbers'
-        elif 'Playbook' in title:
-            title_html = 'The Playbook: 5 Things the Winners Do'
-        elif 'Ammunition' in title:
-            title_html = 'The Ammunition: What to Tell Your Boss'
-        elif 'Take Action' in title:
-            title_html = 'Take Action: Your Next 30 Days'
-        else:
-            title_html = title
-
-        # Remove the h2 from content
-        content_without_h2 = re.sub(r'<h2>.+?</h2>', '', content, count=1)
-
-        return f'''
+</div>''',
+    # Large display heading above the prose
+    'feature': '''
 <section class="mb-16">
   <h2 class="text-3xl md:text-4xl font-black text-white mb-6">
     {title_html}
   </h2>
   <div class="prose prose-lg prose-invert max-w-none">
-    {content_without_h2}
+    {content}
   </div>
-</section>'''
-
-    else:
-        # Generic section
-        return f'''
+</section>''',
+    # Heading styled by the prose typography
+    'section': '''
 <section class="mb-16">
   <div class="prose prose-lg prose-invert max-w-none">
-    {content}
+    {heading}{content}
   </div>
 </section>'''
+}
+
+class SectionRules:
+    """
+    Declarative section styling loaded from a JSON config.
+
+    Each rule has a regex "match" tested against the H2 text, a "style" from
+    SECTION_TEMPLATES and an optional "title_html" rewrite. The rule whose
+    match starts earliest in the heading wins, and earlier rules win ties.
+    Rules are compiled separately, so their own groups and backreferences
+    work as written.
+    """
+
+    def __init__(self, rules, default_style='section'):
+        patterns = []
+        for rule in rules:
+            if rule['style'] not in SECTION_TEMPLATES:
+                raise ValueError(f"Unknown section style '{rule['style']}' for rule '{rule['match']}'")
+            try:
+                patterns.append(re.compile(rule['match']))
+            except re.error as error:
+                raise ValueError(f"Invalid match pattern '{rule['match']}': {error}")
+        if default_style not in SECTION_TEMPLATES:
+            raise ValueError(f"Unknown default section style '{default_style}'")
+        self.rules = rules
+        self.default_style = default_style
+        self.patterns = patterns
+
+    @classmethod
+    def load(cls, path):
+        config = json.loads(Path(path).read_text(encoding='utf-8'))
+        return cls(config.get('rules', []), config.get('default_style', 'section'))
+
+    def classify(self, title):
+        """Return the matching rule for a heading, or None"""
+        if title is None:
+            return None
+        best = None
+        for index, pattern in enumerate(self.patterns):
+            match = pattern.search(title)
+            if match and (best is None or match.start() < best[0]):
+                best = (match.start(), index)
+        return self.rules[best[1]] if best else None
+
+DEFAULT_SECTION_STYLES = Path(__file__).with_name('section-styles.json')
+AI_ROI_SECTION_STYLES = Path(__file__).with_name('section-styles.ai-roi.json')
+
+@lru_cache(maxsize=None)
+def load_section_rules(path=DEFAULT_SECTION_STYLES):
+    """Load (and cache per process) the section rule table"""
+    return SectionRules.load(path)
+
+def process_section(title, content, rules=None):
+    """Wrap section content in styled container"""
+    rules = rules or load_section_rules()
+    rule = rules.classify(title)
+    style = rule['style'] if rule else rules.default_style
+    title_html = rule.get('title_html') if rule else None
+    if title_html is None and title is not None:
+        title_html = process_inline_markdown(title)
+
+    if style == 'section' and title_html is not None:
+        heading = f'<h2>{title_html}</h2>\n'
+    else:
+        heading = ''
+    return SECTION_TEMPLATES[style].format(content=content, title_html=title_html or '', heading=heading)
 
-def create_astro_page(markdown_content):
-    """Create complete Astro page"""
+CONTENT_MARKER = '<!-- GENERATED CONTENT WILL BE INSERTED HERE -->'
+LAYOUT_IMPORT_MARKER = '__LAYOUT_IMPORT__'
 
-    # Convert markdown body
-    html_body = markdown_to_astro_html(markdown_content)
+def layout_import_path(output_path):
+    """Relative import of PageLayout.astro from a page written to output_path"""
+    relative = Path(os.path.relpath(PAGE_LAYOUT, Path(output_path).resolve().parent)).as_posix()
+    return relative if relative.startswith('.') else f'./{relative}'
+
+def with_layout_import(template, output_path):
+    return template.replace(LAYOUT_IMPORT_MARKER, layout_import_path(output_path))
 
-    astro_template = '''---
-import PageLayout from '../layouts/PageLayout.astro';
+AI_ROI_PAGE_TEMPLATE = '''---
+import PageLayout from '__LAYOUT_IMPORT__';
 
 const title = "95% of Enterprise AI Projects Fail—Here's What the 5% Do Differently | Dave Shapiro";
 const description = "MIT study reveals 95% of AI pilots fail, but the 5% that succeed save $300M+ annually. Get the playbook internal champions use to beat the odds. Real data, zero fluff.";
@@ -241,22 +436,226 @@ const faqSchema = {
   </div>
 </PageLayout>'''
 
+def create_astro_page(markdown_content, rules=None, output_path=AI_ROI_PAGE):
+    """Create complete Astro page"""
+
+    # Convert markdown body
+    html_body = markdown_to_astro_html(markdown_content, rules)
+
     # Insert the body
-    final_astro = astro_template.replace('<!-- GENERATED CONTENT WILL BE INSERTED HERE -->', html_body)
+    template = with_layout_import(AI_ROI_PAGE_TEMPLATE, output_path)
+    final_astro = template.replace(CONTENT_MARKER, html_body)
 
     return final_astro
 
-def main():
-    # Read the markdown draft
-    with open('workshop-output/AI-ROI-COMPLETE-DRAFT.md', 'r') as f:
-        markdown = f.read()
+def stream_astro_page(source_path, output_path, template, rules=None):
+    """
+    Render a draft straight to disk without holding the page in memory.
+
+    Writes the template header, then each section as soon as the renderer
+    completes it, then the footer. Output goes to a temporary file that
+    replaces output_path only once the page is complete.
+    """
+    output_path = Path(output_path)
+    header, footer = with_layout_import(template, output_path).split(CONTENT_MARKER, 1)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = output_path.with_name(output_path.name + '.partial')
+
+    with open(source_path, 'r', encoding='utf-8') as source, \
+            open(partial_path, 'w', encoding='utf-8') as output:
+        output.write(header)
+        first = True
+
+        def write_section(html):
+            nonlocal first
+            if not first:
+                output.write('\n\n')
+            output.write(html)
+            first = False
+
+        renderer = AstroMarkdownRenderer(write_section, rules)
+        for line in source:
+            renderer.feed(line)
+        renderer.finish()
+        output.write(footer)
+
+    os.replace(partial_path, output_path)
+    return output_path
+
+GENERIC_PAGE_TEMPLATE = '''---
+import PageLayout from '__LAYOUT_IMPORT__';
+
+const title = __TITLE__;
+const description = __DESCRIPTION__;
+---
+
+<PageLayout
+  title={title}
+  description={description}
+  showHeader={true}
+  showCTA={false}
+>
+  <div class="min-h-screen relative overflow-hidden">
+    <!-- Hero Section -->
+    <div class="relative bg-gradient-hero noise-bg">
+      <div class="pt-32 pb-20 relative z-10">
+        <div class="max-w-4xl mx-auto px-6">
+          <h1 class="text-4xl md:text-5xl lg:text-6xl font-black text-white mb-6 leading-tight text-center">
+            {title}
+          </h1>
+          <p class="text-xl md:text-2xl text-white/90 mb-8 text-center max-w-3xl mx-auto">
+            {description}
+          </p>
+        </div>
+      </div>
+    </div>
 
-    # Generate Astro page
-    astro_content = create_astro_page(markdown)
+    <!-- Main Content -->
+    <div class="relative bg-gradient-to-b from-secondary to-secondary/95 py-16">
+      <div class="max-w-4xl mx-auto px-6">
+        <!-- GENERATED CONTENT WILL BE INSERTED HERE -->
+      </div>
+    </div>
+  </div>
+</PageLayout>'''
+
+MARKUP_PATTERN = re.compile(r'[*_`>#]+|\[([^\]]*)\]\([^)]*\)')
+
+def _plain_text(text):
+    """Strip inline markdown so text can be used in titles and meta tags"""
+    return MARKUP_PATTERN.sub(lambda m: m.group(1) or '', text).strip()
+
+def extract_page_metadata(lines, fallback_title):
+    """Use the draft's H1 as title and its first prose line as description"""
+    title, description = None, None
+    for line in lines:
+        stripped = line.strip()
+        if title is None and stripped.startswith('# '):
+            title = _plain_text(stripped[2:])
+        elif (description is None and stripped
+              and not stripped.startswith(('#', '-', '|', '**Reading') + METADATA_PREFIXES)
+              and not BLOCK_PATTERN.match(stripped)):
+            description = _plain_text(stripped)
+        if title is not None and description is not None:
+            break
+    description = description or title or fallback_title
+    if len(description) > 155:
+        description = description[:152].rsplit(' ', 1)[0] + '...'
+    return title or fallback_title, description
+
+def generic_page_template(title, description):
+    """Fill the generic page template, leaving the content marker in place"""
+    return (GENERIC_PAGE_TEMPLATE
+            .replace('__TITLE__', json.dumps(title, ensure_ascii=False))
+            .replace('__DESCRIPTION__', json.dumps(description, ensure_ascii=False)))
+
+def create_generic_astro_page(markdown_content, fallback_title, rules=None, output_path=None):
+    """Create an Astro page for any draft, titled from its own content"""
+    title, description = extract_page_metadata(markdown_content.split('\n'), fallback_title)
+    page = with_layout_import(generic_page_template(title, description), output_path or PAGES_DIR / 'page.astro')
+    return page.replace(CONTENT_MARKER, markdown_to_astro_html(markdown_content, rules))
+
+def converter_fingerprint(styles_path=DEFAULT_SECTION_STYLES):
+    """Hash of this script and its style rules, so template or rule changes invalidate the manifest"""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(Path(styles_path).read_bytes())
+    return digest.hexdigest()
+
+def convert_draft(source, output, styles_path=DEFAULT_SECTION_STYLES):
+    """Convert one draft; runs inside a worker process"""
+    fallback_title = Path(source).stem.replace('-', ' ').strip().title()
+    # Metadata only needs the top of the draft; the body is streamed afterwards
+    with open(source, 'r', encoding='utf-8') as draft:
+        title, description = extract_page_metadata(draft, fallback_title)
+    template = generic_page_template(title, description)
+    stream_astro_page(source, output, template, load_section_rules(styles_path))
+    return source
+
+def _content_hash(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+def bulk_convert(source_dirs, output_dir, manifest_path=None, workers=None, force=False,
+                 styles_path=DEFAULT_SECTION_STYLES):
+    """Convert every draft under source_dirs, skipping drafts unchanged since the last run"""
+    manifest_path = Path(manifest_path or Path(output_dir) / BULK_MANIFEST)
+    manifest = {}
+    if manifest_path.exists() and not force:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+
+    fingerprint = converter_fingerprint(styles_path)
+    previous = manifest.get('drafts', {}) if manifest.get('converter') == fingerprint else {}
+    drafts, pending = {}, []
+
+    for source_dir in source_dirs:
+        for source in sorted(Path(source_dir).rglob('*.md')):
+            # <output_dir>/<source dir name>/<path inside it>, even for absolute source dirs
+            relative = source.relative_to(source_dir).with_suffix('.astro')
+            output = Path(output_dir) / Path(source_dir).resolve().name / relative
+            key = source.as_posix()
+            drafts[key] = {'hash': _content_hash(source), 'output': output.as_posix()}
+            if previous.get(key) == drafts[key] and output.exists():
+                continue
+            pending.append((key, output.as_posix()))
+
+    print(f"📂 {len(drafts)} drafts found, {len(pending)} to convert, {len(drafts) - len(pending)} unchanged")
+
+    failed = []
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(convert_draft, source, output, styles_path): source for source, output in pending}
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    future.result()
+                    print(f"✅ {source} -> {drafts[source]['output']}")
+                except Exception as error:
+                    failed.append(source)
+                    print(f"❌ {source}: {error}")
+
+    # Failed drafts are left out of the manifest so the next run retries them
+    for source in failed:
+        drafts.pop(source)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(
+        json.dumps({'converter': fingerprint, 'drafts': drafts}, indent=2, sort_keys=True) + '\n',
+        encoding='utf-8'
+    )
+    return len(pending) - len(failed), failed
 
-    # Write to the page file
-    with open('src/pages/ai-roi-analysis.astro', 'w') as f:
-        f.write(astro_content)
+def main():
+    parser = argparse.ArgumentParser(description='Convert markdown drafts to Astro pages')
+    parser.add_argument('--bulk', nargs='*', metavar='DIR',
+                        help=f"convert whole directories (default: {', '.join(BULK_SOURCE_DIRS)})")
+    parser.add_argument('--output-dir', default=BULK_OUTPUT_DIR, help='where bulk pages are written')
+    parser.add_argument('--manifest', help=f'content-hash manifest for incremental rebuilds '
+                                           f'(default: OUTPUT_DIR/{BULK_MANIFEST})')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='number of worker processes')
+    parser.add_argument('--force', action='store_true', help='ignore the manifest and rebuild everything')
+    parser.add_argument('--styles', help='JSON section styling rules (default: section-styles.json)')
+    args = parser.parse_args()
+
+    if args.bulk is not None:
+        converted, failed = bulk_convert(
+            args.bulk or BULK_SOURCE_DIRS,
+            args.output_dir,
+            args.manifest,
+            workers=args.workers,
+            force=args.force,
+            styles_path=args.styles or DEFAULT_SECTION_STYLES
+        )
+        print(f"\n✅ Converted {converted} drafts into {args.output_dir}/")
+        if failed:
+            print(f"❌ {len(failed)} drafts failed")
+            sys.exit(1)
+        return
+
+    # Stream the markdown draft into the page file
+    stream_astro_page(
+        'workshop-output/AI-ROI-COMPLETE-DRAFT.md',
+        AI_ROI_PAGE,
+        AI_ROI_PAGE_TEMPLATE,
+        load_section_rules(args.styles or AI_ROI_SECTION_STYLES)
+    )
 
     print("✅ Successfully converted to Astro!")
     print("📄 Updated: src/pages/ai-roi-analysis.astro")
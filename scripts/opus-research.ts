@@ -7,6 +7,8 @@
 
 import { OpusPipeline } from '../src/lib/content-pipeline/opus-pipeline';
 import type { ResearchRequest } from '../src/lib/content-pipeline/config';
+import { buildArtifacts } from '../src/lib/content-pipeline/build-manifest';
+import { FORMATTER_VERSION } from '../src/lib/content-pipeline/formatter';
 import * as fs from 'fs';
 import * as path from 'path';
 
@@ -95,25 +97,39 @@ Features:
 
     const baseName = slugify(keyword);
 
-    // Generate all formats
-    const astroPath = path.join(outputDir, `${baseName}.astro`);
-    const astroContent = await pipeline.generateAstroPage(result);
-    fs.writeFileSync(astroPath, astroContent);
-    console.log(`✅ Astro page: ${astroPath}`);
-
-    const mdPath = path.join(outputDir, `${baseName}.md`);
-    const mdContent = await pipeline.generateMarkdown(result);
-    fs.writeFileSync(mdPath, mdContent);
-    console.log(`✅ Markdown: ${mdPath}`);
-
-    const htmlPath = path.join(outputDir, `${baseName}.html`);
-    const htmlContent = await pipeline.generateHTML(result);
-    fs.writeFileSync(htmlPath, htmlContent);
-    console.log(`✅ HTML: ${htmlPath}`);
-
-    const metaPath = path.join(outputDir, `${baseName}.meta.json`);
-    fs.writeFileSync(metaPath, JSON.stringify(result, null, 2));
-    console.log(`✅ Metadata: ${metaPath}`);
+    // Generate all formats (only those whose inputs changed)
+    const outputs = [
+      {
+        name: 'Astro page',
+        path: path.join(outputDir, `${baseName}.astro`),
+        templateVersion: FORMATTER_VERSION,
+        render: () => pipeline.generateAstroPage(result)
+      },
+      {
+        name: 'Markdown',
+        path: path.join(outputDir, `${baseName}.md`),
+        templateVersion: FORMATTER_VERSION,
+        render: () => pipeline.generateMarkdown(result)
+      },
+      {
+        name: 'HTML',
+        path: path.join(outputDir, `${baseName}.html`),
+        templateVersion: FORMATTER_VERSION,
+        render: () => pipeline.generateHTML(result)
+      },
+      {
+        name: 'Metadata',
+        path: path.join(outputDir, `${baseName}.meta.json`),
+        templateVersion: 'json-1',
+        render: () => JSON.stringify(result, null, 2)
+      }
+    ];
+
+    const built = await buildArtifacts(outputDir, [request, result], outputs);
+    built.forEach(output => {
+      const marker = output.status === 'built' ? '✅' : '⏭️ ';
+      console.log(`${marker} ${output.name}: ${output.path}${output.status === 'unchanged' ? ' (unchanged)' : ''}`);
+    });
 
     console.log(`
 ╔════════════════════════════════════════════╗
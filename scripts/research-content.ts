@@ -2,6 +2,8 @@
 
 import { ClaudeResearchAgent } from '../src/lib/content-pipeline/claude-research-agent';
 import type { ResearchRequest } from '../src/lib/content-pipeline/config';
+import { buildArtifacts } from '../src/lib/content-pipeline/build-manifest';
+import { FORMATTER_VERSION } from '../src/lib/content-pipeline/formatter';
 import * as fs from 'fs';
 import * as path from 'path';
 
@@ -58,28 +60,23 @@ Examples:
 
     console.log('\n📝 Generating output formats...');
 
-    // Generate Astro page
-    const astroContent = await agent.generateAstroPage(result);
-    const astroPath = path.join(options.output, `${slugify(keyword)}.astro`);
-    await saveFile(astroPath, astroContent);
-    console.log(`✅ Astro page saved to: ${astroPath}`);
-
-    // Generate Markdown
-    const markdownContent = await agent.generateMarkdown(result);
-    const markdownPath = path.join(options.output, `${slugify(keyword)}.md`);
-    await saveFile(markdownPath, markdownContent);
-    console.log(`✅ Markdown saved to: ${markdownPath}`);
-
-    // Generate HTML
-    const htmlContent = await agent.generateHTML(result);
-    const htmlPath = path.join(options.output, `${slugify(keyword)}.html`);
-    await saveFile(htmlPath, htmlContent);
-    console.log(`✅ HTML saved to: ${htmlPath}`);
-
-    // Save metadata
-    const metaPath = path.join(options.output, `${slugify(keyword)}.meta.json`);
-    await saveFile(metaPath, JSON.stringify(result, null, 2));
-    console.log(`✅ Metadata saved to: ${metaPath}`);
+    const baseName = slugify(keyword);
+    const astroPath = path.join(options.output, `${baseName}.astro`);
+    const markdownPath = path.join(options.output, `${baseName}.md`);
+    const htmlPath = path.join(options.output, `${baseName}.html`);
+    const metaPath = path.join(options.output, `${baseName}.meta.json`);
+
+    // Only regenerate outputs whose inputs changed since the last run
+    const built = await buildArtifacts(options.output, [request, result], [
+      { name: 'Astro page', path: astroPath, templateVersion: FORMATTER_VERSION, render: () => agent.generateAstroPage(result) },
+      { name: 'Markdown', path: markdownPath, templateVersion: FORMATTER_VERSION, render: () => agent.generateMarkdown(result) },
+      { name: 'HTML', path: htmlPath, templateVersion: FORMATTER_VERSION, render: () => agent.generateHTML(result) },
+      { name: 'Metadata', path: metaPath, templateVersion: 'json-1', render: () => JSON.stringify(result, null, 2) }
+    ]);
+    built.forEach(output => {
+      const detail = output.status === 'built' ? 'saved to' : 'unchanged at';
+      console.log(`${output.status === 'built' ? '✅' : '⏭️ '} ${output.name} ${detail}: ${output.path}`);
+    });
 
     console.log('\n🎉 Research complete! Generated files:');
     console.log(`   - ${astroPath} (ready for site integration)`);
@@ -167,16 +164,5 @@ function slugify(text: string): string {
     .trim();
 }
 
-async function saveFile(filepath: string, content: string): Promise<void> {
-  const dir = path.dirname(filepath);
-
-  // Create directory if it doesn't exist
-  if (!fs.existsSync(dir)) {
-    fs.mkdirSync(dir, { recursive: true });
-  }
-
-  fs.writeFileSync(filepath, content, 'utf-8');
-}
-
 // Run if executed directly
 main().catch(console.error);
\ No newline at end of file
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Process-wide registry of role agents
+Agents are stateless apart from their role and expert list, so one instance
+per (agent class, role) serves every editor and architect in the process.
+Orchestrators describe their agents in a role table (key -> class and role)
+and get an AgentRoster: a read-only mapping that builds each agent the first
+time a phase asks for it. Creating an orchestrator costs a dict, not ten or
+fifteen agent constructions.
+
+Usage:
+    AGENT_TABLE = {'seo_researcher': (SEOResearchAgent, ContentAgentRole.SEO_RESEARCHER)}
+    agents = AgentRoster(AGENT_TABLE)
+    agents['seo_researcher']   # built on first access, then shared process-wide
+"""
+
+import threading
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator, List, Tuple
+
+class AgentRegistry:
+    """One shared agent per (class, role), built on first use"""
+
+    def __init__(self):
+        self._agents: Dict[Tuple[type, Any], Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, agent_class: type, role) -> Any:
+        agent = self._agents.get((agent_class, role))
+        if agent is None:
+            with self._lock:
+                agent = self._agents.get((agent_class, role))
+                if agent is None:
+                    agent = self._agents[(agent_class, role)] = agent_class(role)
+        return agent
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def clear(self):
+        with self._lock:
+            self._agents.clear()
+
+REGISTRY = AgentRegistry()
+
+class AgentRoster(Mapping):
+    """Lazy key -> agent view of a role table over the shared registry"""
+
+    def __init__(self, table: Dict[str, Tuple[type, Any]], registry: AgentRegistry = REGISTRY):
+        self.table = table
+        self.registry = registry
+        self.used: List[str] = []
+
+    def __getitem__(self, key: str) -> Any:
+        agent_class, role = self.table[key]
+        if key not in self.used:
+            self.used.append(key)
+        return self.registry.get(agent_class, role)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.table)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+__all__ = [
+    'AgentRegistry',
+    'AgentRoster',
+    'REGISTRY'
+]
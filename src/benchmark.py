@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the content and knowledge orchestrators
+Drives ContentEditorInChief, KnowledgeArchitect and create_content_series
+against SimulatedBackend (configurable latency, error rate and response size)
+and reports throughput, p50/p95/p99 latency and peak memory per scenario.
+Results can be saved as JSON baselines and compared to catch regressions.
+
+Usage:
+    python -m src.benchmark run --posts 50 --concurrency 8 --save benchmarks/baselines/main.json
+    python -m src.benchmark run --scenarios knowledge --latency-ms 50 --error-rate 0.02
+    python -m src.benchmark compare benchmarks/baselines/main.json             # rerun with its config
+    python -m src.benchmark compare benchmarks/baselines/main.json current.json --threshold 0.05
+    python -m src.benchmark run --record cassettes/bench.jsonl          # capture agent I/O
+    python -m src.benchmark run --replay cassettes/bench.jsonl          # orchestration overhead only
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Callable, Awaitable, Optional
+
+from src.content_agents import ContentEditorInChief, create_content_brief
+from src.knowledge_agents import KnowledgeArchitect, create_knowledge_brief
+from src.cassettes import RecordingBackend, ReplayBackend
+from src.llm_backend import SimulatedBackend, use_backend
+
+SCENARIOS = ('content', 'knowledge', 'series')
+DEFAULT_CONFIG = {
+    'scenarios': list(SCENARIOS),
+    'posts': 20,
+    'concurrency': 4,
+    'series_length': 5,
+    'latency_ms': 100.0,
+    'jitter': 0.5,
+    'error_rate': 0.0,
+    'response_bytes': 2000,
+    'seed': 42
+}
+
+# Relative change that counts as a regression; CPU-heavy scenarios vary ~10% run to run
+REGRESSION_THRESHOLD = 0.20
+
+# metric -> True when higher is better
+METRICS = {
+    'throughput': True,
+    'p50': False,
+    'p95': False,
+    'p99': False,
+    'peak_memory_mb': False,
+    'error_rate': False
+}
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+async def _run_units(units: List[Callable[[], Awaitable[Any]]], concurrency: int) -> Dict[str, Any]:
+    """Run units with bounded concurrency, timing each one"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def timed(unit):
+        nonlocal errors
+        async with semaphore:
+            began = time.perf_counter()
+            try:
+                await unit()
+            except Exception:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - began)
+
+    began = time.perf_counter()
+    await asyncio.gather(*(timed(unit) for unit in units))
+    return {'wall': time.perf_counter() - began, 'latencies': latencies, 'errors': errors}
+
+def _units(scenario: str, config: Dict[str, Any]) -> tuple:
+    """Work items for a scenario and how many posts each produces"""
+    if scenario == 'content':
+        editor = ContentEditorInChief()
+        return [
+            lambda i=i: editor.create_blog_post(create_content_brief(f"Benchmark post {i}"))
+            for i in range(config['posts'])
+        ], 1
+    if scenario == 'knowledge':
+        architect = KnowledgeArchitect()
+        return [
+            lambda i=i: architect.create_knowledge_content(create_knowledge_brief(f"Benchmark topic {i}"))
+            for i in range(config['posts'])
+        ], 1
+    if scenario == 'series':
+        length = config['series_length']
+        editor = ContentEditorInChief()
+        return [
+            lambda i=i: editor.create_content_series(
+                f"Benchmark cluster {i}", [f"Cluster {i} part {n}" for n in range(length)]
+            )
+            for i in range(max(1, config['posts'] // length))
+        ], length
+    raise ValueError(f"Unknown scenario: {scenario}")
+
+def simulated_backend(config: Dict[str, Any]) -> SimulatedBackend:
+    return SimulatedBackend(
+        latency_ms=config['latency_ms'],
+        jitter=config['jitter'],
+        error_rate=config['error_rate'],
+        response_bytes=config['response_bytes'],
+        seed=config['seed']
+    )
+
+async def run_scenario(scenario: str, config: Dict[str, Any], backend=None) -> Dict[str, Any]:
+    """Run one scenario on backend (a fresh SimulatedBackend by default)"""
+    backend = backend or simulated_backend(config)
+    calls_before = getattr(backend, 'calls', 0)
+    units, posts_per_unit = _units(scenario, config)
+
+    tracemalloc.start()
+    try:
+        # Nothing subscribes to pipeline events here, so progress reporting costs nothing
+        with use_backend(backend):
+            outcome = await _run_units(units, config['concurrency'])
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies = outcome['latencies']
+    completed = len(latencies)
+    return {
+        'unit': 'series' if scenario == 'series' else 'post',
+        'units': len(units),
+        'completed': completed,
+        'errors': outcome['errors'],
+        'error_rate': round(outcome['errors'] / len(units), 4) if units else 0.0,
+        'llm_calls': getattr(backend, 'calls', calls_before) - calls_before,
+        'wall_seconds': round(outcome['wall'], 4),
+        'throughput': round(completed * posts_per_unit / outcome['wall'], 4) if outcome['wall'] else 0.0,
+        'p50': round(percentile(latencies, 0.50), 4),
+        'p95': round(percentile(latencies, 0.95), 4),
+        'p99': round(percentile(latencies, 0.99), 4),
+        'peak_memory_mb': round(peak / 1024 / 1024, 3)
+    }
+
+async def run_benchmarks(
+    config: Dict[str, Any],
+    record: Optional[str] = None,
+    replay: Optional[str] = None,
+    replay_speed: float = 0.0
+) -> Dict[str, Any]:
+    """Run every configured scenario, optionally recording to or replaying from a cassette"""
+    results = {}
+    recorder = RecordingBackend(record, simulated_backend(config), meta={'benchmark': config}) if record else None
+    player = ReplayBackend(replay, speed=replay_speed) if replay else None
+    source = f"replay of {replay} at {replay_speed}x" if player else f"{config['latency_ms']}ms simulated latency"
+    try:
+        for scenario in config['scenarios']:
+            print(f"⏱️ {scenario}: {config['posts']} posts, concurrency {config['concurrency']}, {source}",
+                  file=sys.stderr)
+            results[scenario] = await run_scenario(scenario, config, player or recorder)
+    finally:
+        if recorder:
+            recorder.close()
+            print(f"📼 Recorded {recorder.recorded} agent calls to {record}", file=sys.stderr)
+    if player:
+        config = {**config, 'replay': replay, 'replay_speed': replay_speed}
+    return {
+        'created': datetime.now().isoformat(),
+        'environment': {'python': platform.python_version(), 'platform': platform.platform()},
+        'config': config,
+        'results': results
+    }
+
+def format_results(report: Dict[str, Any]) -> str:
+    header = (f"{'scenario':<10} {'done':>9} {'errors':>6} {'posts/s':>9} {'p50 s':>8} {'p95 s':>8} "
+              f"{'p99 s':>8} {'peak MB':>8}")
+    lines = [header, '-' * len(header)]
+    for scenario, result in report['results'].items():
+        lines.append(
+            f"{scenario:<10} {result['completed']:>4}/{result['units']:<4} {result['errors']:>6} "
+            f"{result['throughput']:>9.2f} {result['p50']:>8.3f} {result['p95']:>8.3f} {result['p99']:>8.3f} "
+            f"{result['peak_memory_mb']:>8.2f}"
+        )
+    return '\n'.join(lines)
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = REGRESSION_THRESHOLD) -> List[str]:
+    """Regressions beyond threshold (relative) for every scenario both reports ran"""
+    regressions = []
+    for scenario, before in baseline['results'].items():
+        after = current['results'].get(scenario)
+        if after is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old, new = before.get(metric, 0.0), after.get(metric, 0.0)
+            if metric == 'error_rate':
+                # Rates near zero make relative change meaningless
+                worse = new - old > threshold / 10
+            elif old == 0:
+                worse = False
+            else:
+                change = (new - old) / old
+                worse = -change > threshold if higher_is_better else change > threshold
+            if worse:
+                regressions.append(f"{scenario}.{metric}: {old} -> {new}")
+    return regressions
+
+def save_report(report: Dict[str, Any], path: str):
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+    print(f"💾 Saved results to {target}")
+
+def _config_from_args(args) -> Dict[str, Any]:
+    return {
+        'scenarios': args.scenarios,
+        'posts': args.posts,
+        'concurrency': max(1, args.concurrency),
+        'series_length': max(1, args.series_length),
+        'latency_ms': args.latency_ms,
+        'jitter': args.jitter,
+        'error_rate': args.error_rate,
+        'response_bytes': args.response_bytes,
+        'seed': args.seed
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the orchestrators against a simulated LLM")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='run benchmarks')
+    run.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=DEFAULT_CONFIG['scenarios'])
+    run.add_argument('--posts', type=int, default=DEFAULT_CONFIG['posts'])
+    run.add_argument('--concurrency', type=int, default=DEFAULT_CONFIG['concurrency'])
+    run.add_argument('--series-length', type=int, default=DEFAULT_CONFIG['series_length'])
+    run.add_argument('--latency-ms', type=float, default=DEFAULT_CONFIG['latency_ms'])
+    run.add_argument('--jitter', type=float, default=DEFAULT_CONFIG['jitter'], help='lognormal sigma (0 = fixed)')
+    run.add_argument('--error-rate', type=float, default=DEFAULT_CONFIG['error_rate'])
+    run.add_argument('--response-bytes', type=int, default=DEFAULT_CONFIG['response_bytes'])
+    run.add_argument('--seed', type=int, default=DEFAULT_CONFIG['seed'])
+    run.add_argument('--save', metavar='FILE', help='write results as a JSON baseline')
+    run.add_argument('--record', metavar='CASSETTE', help='record every simulated agent call to a cassette')
+    run.add_argument('--replay', metavar='CASSETTE', help='serve agent calls from a recorded cassette')
+    run.add_argument('--replay-speed', type=float, default=0.0,
+                     help='multiple of recorded latency to wait on replay (0 = instant)')
+
+    check = commands.add_parser('compare', help='compare results against a baseline')
+    check.add_argument('baseline')
+    check.add_argument('current', nargs='?', help="results file (default: rerun with the baseline's config)")
+    check.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD, help='relative change that counts as a regression')
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        if args.record and args.replay:
+            parser.error("--record and --replay cannot be combined")
+        report = asyncio.run(run_benchmarks(_config_from_args(args), args.record, args.replay, args.replay_speed))
+        print(format_results(report))
+        if args.save:
+            save_report(report, args.save)
+        return
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+    if args.current:
+        current = json.loads(Path(args.current).read_text(encoding='utf-8'))
+    else:
+        config = {**DEFAULT_CONFIG, **baseline['config']}
+        replay = config.pop('replay', None)
+        current = asyncio.run(run_benchmarks(config, replay=replay, replay_speed=config.pop('replay_speed', 0.0)))
+    print(format_results(current))
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regressions beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"   {regression}")
+        sys.exit(1)
+    print(f"\n✅ No regressions beyond {args.threshold:.0%}")
+
+__all__ = [
+    'compare',
+    'percentile',
+    'run_benchmarks',
+    'run_scenario'
+]
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Record/replay cassettes for agent I/O
+RecordingBackend wraps another backend and appends every agent call (role,
+prompt, response or error, latency) to a JSON Lines cassette. ReplayBackend
+serves a cassette back deterministically, instantly or at a multiple of the
+recorded latency, so full pipeline runs are reproducible without model
+calls and replay with speed 0 measures orchestration overhead alone.
+
+Usage:
+    with use_backend(RecordingBackend('cassettes/run.jsonl', SimulatedBackend(seed=1))):
+        await editor.create_blog_post(brief)
+    with use_backend(ReplayBackend('cassettes/run.jsonl', speed=0)):
+        await editor.create_blog_post(brief)
+
+    python -m src.benchmark run --record cassettes/bench.jsonl
+    python -m src.benchmark run --replay cassettes/bench.jsonl --replay-speed 0
+"""
+
+import asyncio
+import json
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from src.llm_backend import backend_identity, prompt_key
+
+CASSETTE_VERSION = 1
+
+class CassetteMiss(LookupError):
+    """A replayed agent call has no recording"""
+
+class ReplayedError(RuntimeError):
+    """An agent call that failed while recording fails again on replay"""
+
+class RecordingBackend:
+    """Pass calls through to inner and append each one to the cassette"""
+
+    def __init__(self, path: str, inner, meta: Optional[Dict[str, Any]] = None):
+        self.path = Path(path)
+        self.inner = inner
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self.recorded = 0
+        self.identity = backend_identity(inner)
+        self._write({
+            'cassette': CASSETTE_VERSION,
+            'created': datetime.now().isoformat(),
+            'meta': {'backend': self.identity, **(meta or {})}
+        })
+
+    async def complete(self, role: str, prompt: str) -> Dict[str, Any]:
+        record = {'key': prompt_key(role, prompt), 'role': role, 'prompt': prompt}
+        began = time.perf_counter()
+        try:
+            response = await self.inner.complete(role, prompt)
+        except Exception as error:
+            record.update(latency=round(time.perf_counter() - began, 6), error=f"{type(error).__name__}: {error}")
+            self._write(record)
+            raise
+        record.update(latency=round(time.perf_counter() - began, 6), response=response)
+        self._write(record)
+        return response
+
+    def _write(self, record: Dict[str, Any]):
+        # One flushed line per call so an interrupted run still leaves a usable cassette
+        self._file.write(json.dumps(record, default=str) + '\n')
+        self._file.flush()
+        self.recorded += 'key' in record
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class ReplayBackend:
+    """
+    Serve recorded responses by (role, prompt) key.
+
+    Repeated identical calls are served in recorded order. With
+    on_miss='role' an unknown prompt gets the next unused recording for
+    the same role instead of raising CassetteMiss, which keeps replays
+    working after small prompt edits.
+    """
+
+    def __init__(self, path: str, speed: float = 0.0, on_miss: str = 'error'):
+        self.path = Path(path)
+        self.speed = speed
+        self.on_miss = on_miss
+        self.meta: Dict[str, Any] = {}
+        self.by_key: Dict[str, deque] = defaultdict(deque)
+        self.by_role: Dict[str, deque] = defaultdict(deque)
+        self.hits = 0
+        self.misses = 0
+        self._used = set()
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if 'cassette' in record:
+                    if record['cassette'] != CASSETTE_VERSION:
+                        raise ValueError(f"{path}: unsupported cassette version {record['cassette']}")
+                    self.meta = record.get('meta', {})
+                    continue
+                self.by_key[record['key']].append(record)
+                self.by_role[record['role']].append(record)
+        # A replay reproduces the recorded backend's output, so it shares its identity
+        self.identity = self.meta.get('backend') or f"replay:{self.path.name}"
+
+    def _take(self, role: str, prompt: str) -> Dict[str, Any]:
+        record = self._next(self.by_key.get(prompt_key(role, prompt)))
+        if record is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            if self.on_miss == 'role':
+                record = self._next(self.by_role.get(role))
+            if record is None:
+                raise CassetteMiss(f"No recording for {role} call ({prompt[:80]!r}...) in {self.path}")
+        self._used.add(id(record))
+        return record
+
+    def _next(self, recordings: Optional[deque]) -> Optional[Dict[str, Any]]:
+        """First recording in the queue not already served through the other index"""
+        while recordings:
+            record = recordings.popleft()
+            if id(record) not in self._used:
+                return record
+        return None
+
+    async def complete(self, role: str, prompt: str) -> Dict[str, Any]:
+        record = self._take(role, prompt)
+        if self.speed:
+            await asyncio.sleep(record['latency'] * self.speed)
+        else:
+            # Still yield to the loop so concurrent runs interleave as they would live
+            await asyncio.sleep(0)
+        if 'error' in record:
+            raise ReplayedError(record['error'])
+        return record['response']
+
+__all__ = [
+    'CassetteMiss',
+    'RecordingBackend',
+    'ReplayBackend',
+    'ReplayedError'
+]
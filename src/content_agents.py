@@ -6,14 +6,22 @@ Adapted from marketing_agent framework for SEO/AI content generation
 
 import json
 import asyncio
+import re
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields, replace
 from enum import Enum
 import hashlib
 import pickle
 from pathlib import Path
 
+from src.llm_backend import current_backend
+from src.agent_registry import AgentRoster
+from src.content_patches import EDIT_INSTRUCTIONS, apply_edits
+from src.events import emit, pipeline_run
+from src.pipeline_dag import NodeCache, NodeLedger, PipelineDefinition, brief_lines, load_pipeline, run_pipeline
+from src.tracing import agent_call, span
+
 # Content Agent Roles
 class ContentAgentRole(Enum):
     EDITOR_IN_CHIEF = "Editor in Chief"
@@ -54,6 +62,21 @@ class ContentBrief:
     internal_links: List[str] = None
     tone: str = "expert-guide"  # "expert-guide", "contrarian", "analytical", "conversational"
     urgency_level: str = "medium"  # "low", "medium", "high", "breaking-news"
+    topic_cluster: Optional[str] = None  # briefs in the same cluster share one keyword research run
+
+# Brief fields shown in agent prompts (only a pipeline node's brief_fields while it runs)
+BRIEF_PROMPT_LABELS = {
+    'topic': 'Topic',
+    'target_audience': 'Target Audience',
+    'primary_keyword': 'Primary Keyword',
+    'secondary_keywords': 'Secondary Keywords',
+    'content_type': 'Content Type',
+    'business_goal': 'Business Goal',
+    'pain_points': 'Pain Points',
+    'desired_outcomes': 'Desired Outcomes',
+    'tone': 'Tone',
+    'word_count': 'Word Count Target'
+}
 
 # Content Creation Experts Knowledge Base
 CONTENT_EXPERTS = {
@@ -166,7 +189,7 @@ class ContentKnowledgeGraph:
 
 class ContentAgent:
     """Base content agent with specialized expertise"""
-    def __init__(self, role: ContentAgentRole, knowledge_graph: ContentKnowledgeGraph):
+    def __init__(self, role: ContentAgentRole, knowledge_graph: Optional[ContentKnowledgeGraph] = None):
         self.role = role
         self.knowledge_graph = knowledge_graph
         self.experts = self._get_role_experts()
@@ -191,6 +214,27 @@ class ContentAgent:
         output = await self._call_claude(prompt)
         return output
     
+    async def revise(self, task: str, brief: ContentBrief, draft: Any) -> Dict[str, Any]:
+        """
+        Editing pass that returns edit operations instead of a rewrite.
+
+        The edits are validated and applied locally (see content_patches), so
+        output tokens pay only for what changed; rejected edits are kept in
+        the result for review.
+        """
+        document = _output_text(draft)
+        response = await self.generate(task + "\n" + EDIT_INSTRUCTIONS, brief, {'draft': document})
+        edits = response.get('edits') if isinstance(response, dict) else None
+        patched = apply_edits(document, edits if isinstance(edits, list) else [])
+        return {
+            'role': self.role.value,
+            'output': patched.text,
+            'edits': patched.applied,
+            'rejected_edits': patched.rejected,
+            'mode': 'patch',
+            'timestamp': datetime.now().isoformat()
+        }
+    
     def _build_prompt(self, task: str, brief: ContentBrief, context: Dict) -> str:
         """Build role-specific prompt"""
         expert_knowledge = self._build_expert_context()
@@ -198,16 +242,7 @@ class ContentAgent:
         prompt = f"""You are an expert {self.role.value} creating informative, educational content.
 
 Content Brief:
-- Topic: {brief.topic}
-- Target Audience: {brief.target_audience}
-- Primary Keyword: {brief.primary_keyword}
-- Secondary Keywords: {', '.join(brief.secondary_keywords)}
-- Content Type: {brief.content_type}
-- Business Goal: {brief.business_goal}
-- Pain Points: {', '.join(brief.pain_points)}
-- Desired Outcomes: {', '.join(brief.desired_outcomes)}
-- Tone: {brief.tone}
-- Word Count Target: {brief.word_count}
+{brief_lines(brief, BRIEF_PROMPT_LABELS)}
 
 Expert Frameworks to Apply:
 {expert_knowledge}
@@ -245,10 +280,14 @@ Return a JSON object with your specialized output based on your role.
                 context += f"\n- Principle: {info['principle']}\n"
         return context
     
+    @agent_call
     async def _call_claude(self, prompt: str) -> Dict[str, Any]:
         """Placeholder for Claude integration"""
-        print(f"\n🤖 {self.role.value} working...")
-        print(f"Prompt preview: {prompt[:200]}...")
+        emit('agent.call', role=self.role.value, icon='🤖', activity='working', prompt_preview=prompt[:200])
+        
+        backend = current_backend()
+        if backend is not None:
+            return await backend.complete(self.role.value, prompt)
         
         # This will be replaced with actual Claude Task tool call
         return {
@@ -368,9 +407,28 @@ class DataStorytellerAgent(ContentAgent):
         
         return await self.generate(task, brief, {'structure': structure})
 
+# Section-parallel drafting: used for posts at least this long with at least this many sections
+SECTION_DRAFT_MIN_WORDS = 2500
+SECTION_DRAFT_MIN_SECTIONS = 3
+SEAM_CHARS = 300  # text either side of a section boundary sent to the stitching pass
+
 class ContentCreatorAgent(ContentAgent):
     """Main content writing agent"""
-    async def write_content(self, brief: ContentBrief, structure: Dict, data: Dict, headlines: Dict) -> Dict[str, Any]:
+    async def write_content(
+        self,
+        brief: ContentBrief,
+        structure: Dict,
+        data: Dict,
+        headlines: Dict,
+        parallel_sections: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        Draft the post in one call, or section by section in parallel.
+
+        Long-form briefs (SECTION_DRAFT_MIN_WORDS and up) whose structure has
+        enough sections are drafted per section, so latency follows the
+        longest section instead of the whole article.
+        """
         task = f"""Write the complete blog post following the structure and incorporating all elements:
         
         Requirements:
@@ -395,88 +453,223 @@ class ContentCreatorAgent(ContentAgent):
         
         Remember: Dave Shapiro's voice is expert guide, not guru."""
         
+        if parallel_sections is None:
+            parallel_sections = brief.word_count >= SECTION_DRAFT_MIN_WORDS
+        sections = outline_sections(structure) if parallel_sections else []
+        if len(sections) >= SECTION_DRAFT_MIN_SECTIONS:
+            return await self.write_sections(brief, sections, data, headlines)
+        
         return await self.generate(task, brief, {
             'structure': structure,
             'data': data,
             'headlines': headlines
         })
 
-class ContentEditorInChief:
-    """Chief editor orchestrating all content agents"""
-    def __init__(self):
-        self.knowledge_graph = ContentKnowledgeGraph()
-        self.agents = self._initialize_agents()
-        
-    def _initialize_agents(self) -> Dict[str, ContentAgent]:
-        """Initialize all specialized agents"""
-        return {
-            'seo_researcher': SEOResearchAgent(ContentAgentRole.SEO_RESEARCHER, self.knowledge_graph),
-            'headline_optimizer': HeadlineOptimizerAgent(ContentAgentRole.HEADLINE_OPTIMIZER, self.knowledge_graph),
-            'narrative_architect': NarrativeArchitectAgent(ContentAgentRole.NARRATIVE_ARCHITECT, self.knowledge_graph),
-            'data_storyteller': DataStorytellerAgent(ContentAgentRole.DATA_STORYTELLER, self.knowledge_graph),
-            'content_creator': ContentCreatorAgent(ContentAgentRole.TECHNICAL_WRITER, self.knowledge_graph),
-            'seo_optimizer': ContentAgent(ContentAgentRole.SEO_OPTIMIZER, self.knowledge_graph),
-            'readability_editor': ContentAgent(ContentAgentRole.READABILITY_EDITOR, self.knowledge_graph),
-            'fact_checker': ContentAgent(ContentAgentRole.FACT_CHECKER, self.knowledge_graph),
-            'cta_specialist': ContentAgent(ContentAgentRole.CTA_SPECIALIST, self.knowledge_graph),
-            'quality_auditor': ContentAgent(ContentAgentRole.QUALITY_AUDITOR, self.knowledge_graph)
-        }
-    
-    async def create_blog_post(self, brief: ContentBrief) -> Dict[str, Any]:
-        """Orchestrate full blog post creation"""
-        print(f"\n📝 Creating blog post: {brief.topic}")
-        print(f"   Target: {brief.target_audience}")
-        print(f"   Goal: {brief.business_goal}")
-        print("=" * 50)
-        
-        # Phase 1: Research
-        print("\n🔍 Phase 1: Research & Analysis")
-        seo_data = await self.agents['seo_researcher'].research_keywords(brief.topic)
-        
-        # Phase 2: Planning
-        print("\n📋 Phase 2: Strategic Planning")
-        headlines = await self.agents['headline_optimizer'].generate_headlines(brief, seo_data)
-        structure = await self.agents['narrative_architect'].design_structure(brief, headlines, seo_data)
-        
-        # Phase 3: Evidence Gathering
-        print("\n📊 Phase 3: Data & Evidence Collection")
-        data = await self.agents['data_storyteller'].gather_evidence(brief, structure)
-        
-        # Phase 4: Content Creation
-        print("\n✍️ Phase 4: Content Writing")
-        content = await self.agents['content_creator'].write_content(brief, structure, data, headlines)
-        
-        # Phase 5: Optimization
-        print("\n🎯 Phase 5: SEO Optimization")
-        optimized = await self.agents['seo_optimizer'].generate(
-            "Optimize content for SEO without losing readability",
-            brief,
-            {'content': content}
-        )
-        
-        # Phase 6: Polish
-        print("\n✨ Phase 6: Editorial Polish")
-        edited = await self.agents['readability_editor'].generate(
-            "Edit for flow, clarity, and engagement",
-            brief,
-            {'content': optimized}
-        )
+    async def write_sections(
+        self,
+        brief: ContentBrief,
+        sections: List[Dict[str, Any]],
+        data: Dict,
+        headlines: Dict
+    ) -> Dict[str, Any]:
+        """Draft every section concurrently, then stitch them with generated transitions"""
+        outline = [section['heading'] for section in sections]
+        data_points = _evidence_items(data)
+        keywords = _assign_keywords(brief.secondary_keywords, sections)
+        default_words = max(1, brief.word_count // len(sections))
+        title = (headlines or {}).get('primary') if isinstance(headlines, dict) else None
+
+        async def draft(index: int, section: Dict[str, Any]) -> Dict[str, Any]:
+            words = section.get('word_count') or default_words
+            task = f"""Write section {index + 1} of {len(sections)} of the blog post: "{section['heading']}"
         
-        # Phase 7: CTAs
-        print("\n🎯 Phase 7: Call-to-Action Optimization")
-        with_ctas = await self.agents['cta_specialist'].generate(
-            "Add compelling CTAs throughout the content",
+        Requirements:
+        1. About {words} words, starting with the section heading
+        2. Cover the key points listed for this section and nothing that belongs to the others
+        3. Use the data points provided; do not invent statistics
+        4. Work in the section's keywords naturally
+        5. Short paragraphs, active voice, scannable formatting
+        
+        Do not write an introduction or conclusion for the whole post unless this section is one."""
+            return await self.generate(task, brief, {
+                'title': title,
+                'outline': outline,
+                'section': section,
+                'data_points': _relevant_items(data_points, section),
+                'keywords': [brief.primary_keyword] + keywords[index]
+            })
+
+        drafts = await asyncio.gather(*(draft(index, section) for index, section in enumerate(sections)))
+        bodies = [_output_text(output) for output in drafts]
+
+        # Only the seams go back to the model, so stitching costs a few sentences, not a rewrite
+        stitched = await self.generate(
+            "Write one or two transition sentences for each boundary between adjacent sections. "
+            "Return JSON with a 'transitions' list, one entry per boundary, in order.",
             brief,
-            {'content': edited}
+            {'boundaries': [
+                {
+                    'from': sections[index]['heading'],
+                    'ending': bodies[index][-SEAM_CHARS:],
+                    'to': sections[index + 1]['heading'],
+                    'opening': bodies[index + 1][:SEAM_CHARS]
+                }
+                for index in range(len(sections) - 1)
+            ]}
         )
+        transitions = stitched.get('transitions') if isinstance(stitched, dict) else None
+        if not isinstance(transitions, list) or len(transitions) != len(sections) - 1:
+            transitions = [''] * (len(sections) - 1)
+
+        parts = []
+        for index, body in enumerate(bodies):
+            if index:
+                parts.append(str(transitions[index - 1] or '').strip())
+            parts.append(body.strip())
+        return {
+            'role': self.role.value,
+            'output': '\n\n'.join(part for part in parts if part),
+            'sections': [
+                {'heading': section['heading'], 'draft': output}
+                for section, output in zip(sections, drafts)
+            ],
+            'transitions': transitions,
+            'mode': 'sections',
+            'timestamp': datetime.now().isoformat()
+        }
+
+def outline_sections(structure: Any) -> List[Dict[str, Any]]:
+    """
+    Sections from a narrative structure.
+
+    Accepts a 'sections' list (strings, or dicts with heading/title/name) or
+    markdown headings in the structure's outline/output text.
+    """
+    if not isinstance(structure, dict):
+        return []
+    sections = []
+    for item in structure.get('sections') or []:
+        if isinstance(item, str):
+            sections.append({'heading': item})
+        elif isinstance(item, dict):
+            heading = item.get('heading') or item.get('title') or item.get('name')
+            if heading:
+                sections.append({**item, 'heading': str(heading)})
+    if sections:
+        return sections
+    text = structure.get('outline') or structure.get('output')
+    if isinstance(text, str):
+        for line in text.splitlines():
+            match = re.match(r'\s*#{2,3}\s+(.+)', line)
+            if match:
+                sections.append({'heading': match.group(1).strip()})
+    return sections
+
+def _output_text(output: Any) -> str:
+    if isinstance(output, dict):
+        for key in ('content', 'output', 'text'):
+            if isinstance(output.get(key), str):
+                return output[key]
+        return json.dumps(output, default=str)
+    return str(output)
+
+def _terms(value: Any) -> set:
+    return set(re.findall(r'[a-z0-9]{4,}', json.dumps(value, default=str).lower()))
+
+def _evidence_items(data: Any) -> List[Any]:
+    if not isinstance(data, dict):
+        return []
+    for key in ('data_points', 'statistics', 'evidence', 'data'):
+        if isinstance(data.get(key), list):
+            return data[key]
+    return []
+
+def _relevant_items(items: List[Any], section: Dict[str, Any]) -> List[Any]:
+    """Data points sharing vocabulary with the section, or any it names explicitly"""
+    wanted = section.get('data_points')
+    if isinstance(wanted, list) and wanted:
+        return wanted
+    terms = _terms(section)
+    return [item for item in items if _terms(item) & terms]
+
+def _assign_keywords(keywords: List[str], sections: List[Dict[str, Any]]) -> List[List[str]]:
+    """Each secondary keyword to its best-matching section, round-robin when nothing matches"""
+    assigned: List[List[str]] = [[] for _ in sections]
+    section_terms = [_terms(section) for section in sections]
+    for position, keyword in enumerate(keywords or []):
+        overlap = [len(_terms(keyword) & terms) for terms in section_terms]
+        best = max(range(len(sections)), key=lambda index: overlap[index])
+        assigned[best if overlap[best] else position % len(sections)].append(keyword)
+    return assigned
+
+# Pipeline node whose output briefs in the same topic cluster share
+RESEARCH_NODE = 'seo_research'
+
+# Pipeline a brief runs by urgency_level; anything else gets the full pillar pipeline
+URGENCY_PIPELINES = {
+    'breaking-news': 'breaking-news',
+    'critical': 'breaking-news'
+}
+
+def pipeline_for(brief: ContentBrief) -> str:
+    return URGENCY_PIPELINES.get(brief.urgency_level, 'pillar')
+
+# Role table: agent key -> (agent class, role); agents are built on first use and shared
+CONTENT_AGENT_TABLE = {
+    'seo_researcher': (SEOResearchAgent, ContentAgentRole.SEO_RESEARCHER),
+    'headline_optimizer': (HeadlineOptimizerAgent, ContentAgentRole.HEADLINE_OPTIMIZER),
+    'narrative_architect': (NarrativeArchitectAgent, ContentAgentRole.NARRATIVE_ARCHITECT),
+    'data_storyteller': (DataStorytellerAgent, ContentAgentRole.DATA_STORYTELLER),
+    'content_creator': (ContentCreatorAgent, ContentAgentRole.TECHNICAL_WRITER),
+    'seo_optimizer': (ContentAgent, ContentAgentRole.SEO_OPTIMIZER),
+    'readability_editor': (ContentAgent, ContentAgentRole.READABILITY_EDITOR),
+    'fact_checker': (ContentAgent, ContentAgentRole.FACT_CHECKER),
+    'cta_specialist': (ContentAgent, ContentAgentRole.CTA_SPECIALIST),
+    'quality_auditor': (ContentAgent, ContentAgentRole.QUALITY_AUDITOR)
+}
+
+class ContentEditorInChief:
+    """Chief editor orchestrating all content agents"""
+    def __init__(self, node_cache=None):
+        self.knowledge_graph = ContentKnowledgeGraph()
+        self.agents = AgentRoster(CONTENT_AGENT_TABLE)
+        # Any get/put store keyed by node fingerprint; a PhaseStore keeps phases across runs
+        self.node_cache = node_cache if node_cache is not None else NodeCache()
+        self.cluster_research: Dict[str, asyncio.Future] = {}
+        
+    async def research_cluster(self, cluster: str) -> Dict[str, Any]:
+        """Keyword research for a topic cluster, run once and shared by every brief in it"""
+        research = self.cluster_research.get(cluster)
+        if research is None:
+            research = asyncio.ensure_future(self.agents['seo_researcher'].research_keywords(cluster))
+            self.cluster_research[cluster] = research
+        else:
+            emit('cache.hit', what=f"research for {cluster}")
+        try:
+            # Shielded: one waiting post being cancelled must not cancel research others share
+            return await asyncio.shield(research)
+        except Exception:
+            if self.cluster_research.get(cluster) is research and research.done():
+                del self.cluster_research[cluster]  # Let the next brief retry
+            raise
+
+    async def create_blog_post(self, brief: ContentBrief, pipeline: str = 'pillar') -> Dict[str, Any]:
+        """Orchestrate blog post creation through a pipeline definition (see pipelines/)"""
+        with pipeline_run('content', brief.topic):
+            return await self._create_blog_post(brief, load_pipeline(pipeline))
+
+    async def _create_blog_post(self, brief: ContentBrief, definition: PipelineDefinition) -> Dict[str, Any]:
+        emit('run.started', title='📝 Creating blog post', details={
+            'Target': brief.target_audience,
+            'Goal': brief.business_goal
+        })
         
-        # Phase 8: Quality Check
-        print("\n✅ Phase 8: Final Quality Audit")
-        final = await self.agents['quality_auditor'].generate(
-            "Perform final quality check and scoring",
-            brief,
-            {'content': with_ctas}
-        )
+        given = {}
+        if brief.topic_cluster:
+            with span('Shared research', cluster=brief.topic_cluster):
+                given[RESEARCH_NODE] = await self.research_cluster(brief.topic_cluster)
+        ledger = NodeLedger()
+        outputs = await run_pipeline(definition, brief, self.agents, cache=self.node_cache, given=given, ledger=ledger)
         
         # Register in knowledge graph
         self.knowledge_graph.register_topic(
@@ -485,26 +678,41 @@ class ContentEditorInChief:
             {'status': 'completed', 'score': 0}
         )
         
-        print("\n🎉 Blog post creation complete!")
+        emit('run.finished', title='🎉 Blog post creation complete!')
         
         return {
             'brief': asdict(brief),
-            'seo_research': seo_data,
-            'headlines': headlines,
-            'structure': structure,
-            'data': data,
-            'final_content': final,
+            **outputs,
             'metadata': {
                 'created': datetime.now().isoformat(),
-                'agents_used': list(self.agents.keys()),
-                'word_count': brief.word_count
+                'pipeline': definition.name,
+                'agents_used': list(dict.fromkeys(node.agent for node in definition.nodes if node.agent)),
+                'word_count': brief.word_count,
+                'fingerprints': ledger.fingerprints,
+                'reused_phases': ledger.reused
             }
         }
     
+    async def create_cluster_posts(
+        self,
+        cluster: str,
+        briefs: List[ContentBrief],
+        pipelines: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """Create several posts on one topic cluster concurrently from a single research run"""
+        emit('series.started', title='🧭 Creating cluster posts', name=cluster,
+             details={'Posts': len(briefs)})
+        pipelines = pipelines or ['pillar'] * len(briefs)
+        # Copies, so the caller's briefs are left as they were passed in
+        briefs = [replace(brief, topic_cluster=brief.topic_cluster or cluster) for brief in briefs]
+        return list(await asyncio.gather(*(
+            self.create_blog_post(brief, pipeline) for brief, pipeline in zip(briefs, pipelines)
+        )))
+    
     async def create_content_series(self, topic_cluster: str, subtopics: List[str]) -> List[Dict]:
         """Create a series of related blog posts"""
-        print(f"\n📚 Creating content series: {topic_cluster}")
-        print(f"   Subtopics: {len(subtopics)}")
+        emit('series.started', title='📚 Creating content series', name=topic_cluster,
+             details={'Subtopics': len(subtopics)})
         
         posts = []
         for subtopic in subtopics:
@@ -532,6 +740,15 @@ class ContentEditorInChief:
         return posts
 
 # Helper Functions
+_default_editor: Optional[ContentEditorInChief] = None
+
+def default_editor() -> ContentEditorInChief:
+    """Editor shared by the generate_* helpers, so consecutive posts see each other's topics"""
+    global _default_editor
+    if _default_editor is None:
+        _default_editor = ContentEditorInChief()
+    return _default_editor
+
 def create_content_brief(
     topic: str,
     audience: str = "Enterprise SEO/AI teams",
@@ -560,21 +777,33 @@ def create_content_brief(
         tone="expert-guide"
     )
 
-async def generate_blog_post(topic: str, **kwargs) -> Dict[str, Any]:
+def brief_from_dict(data: Dict[str, Any]) -> ContentBrief:
+    """Build a brief from a plain dict, filling gaps with the quick-brief defaults"""
+    brief = create_content_brief(
+        data['topic'],
+        audience=data.get('target_audience', "Enterprise SEO/AI teams"),
+        content_type=data.get('content_type', "how-to"),
+        word_count=data.get('word_count', 2000)
+    )
+    for field in fields(ContentBrief):
+        if field.name in data:
+            setattr(brief, field.name, data[field.name])
+    return brief
+
+async def generate_blog_post(
+    topic: str,
+    editor: Optional[ContentEditorInChief] = None,
+    **kwargs
+) -> Dict[str, Any]:
     """Simple interface to generate a blog post"""
     brief = create_content_brief(topic, **kwargs)
-    editor = ContentEditorInChief()
+    editor = editor or default_editor()
     return await editor.create_blog_post(brief)
 
-# Specialized content generators
-async def generate_case_study(
-    client: str,
-    results: str,
-    challenge: str,
-    solution: str
-) -> Dict[str, Any]:
-    """Generate a case study blog post"""
-    brief = ContentBrief(
+# Specialized content briefs
+def case_study_brief(client: str, results: str, challenge: str, solution: str) -> ContentBrief:
+    """Brief for a case study blog post"""
+    return ContentBrief(
         topic=f"How {client} Achieved {results}",
         target_audience="Enterprise marketing leaders",
         primary_keyword=f"{client.lower()}-case-study",
@@ -586,17 +815,10 @@ async def generate_case_study(
         desired_outcomes=[results],
         tone="analytical"
     )
-    
-    editor = ContentEditorInChief()
-    return await editor.create_blog_post(brief)
 
-async def generate_breaking_news(
-    news: str,
-    angle: str,
-    implications: List[str]
-) -> Dict[str, Any]:
-    """Generate breaking news/trending topic post"""
-    brief = ContentBrief(
+def breaking_news_brief(news: str, angle: str, implications: List[str]) -> ContentBrief:
+    """Brief for a breaking news/trending topic post"""
+    return ContentBrief(
         topic=news,
         target_audience="Tech-savvy marketers and AI enthusiasts",
         primary_keyword=news.lower().replace(' ', '-'),
@@ -607,16 +829,45 @@ async def generate_breaking_news(
         pain_points=["Missing important updates", "Not understanding implications"],
         desired_outcomes=implications,
         tone="conversational",
-        urgency_level="high"
+        urgency_level="breaking-news"
     )
-    
-    editor = ContentEditorInChief()
+
+# Specialized content generators
+async def generate_case_study(
+    client: str,
+    results: str,
+    challenge: str,
+    solution: str,
+    editor: Optional[ContentEditorInChief] = None
+) -> Dict[str, Any]:
+    """Generate a case study blog post"""
+    brief = case_study_brief(client, results, challenge, solution)
+    editor = editor or default_editor()
     return await editor.create_blog_post(brief)
 
+async def generate_breaking_news(
+    news: str,
+    angle: str,
+    implications: List[str],
+    editor: Optional[ContentEditorInChief] = None
+) -> Dict[str, Any]:
+    """Generate breaking news/trending topic post"""
+    brief = breaking_news_brief(news, angle, implications)
+    editor = editor or default_editor()
+    return await editor.create_blog_post(brief, pipeline='breaking-news')
+
 # Export main components
 __all__ = [
     'ContentBrief',
     'ContentEditorInChief',
+    'CONTENT_AGENT_TABLE',
+    'URGENCY_PIPELINES',
+    'pipeline_for',
+    'default_editor',
+    'create_content_brief',
+    'brief_from_dict',
+    'case_study_brief',
+    'breaking_news_brief',
     'generate_blog_post',
     'generate_case_study',
     'generate_breaking_news',
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Structured edit operations for editing passes
+Editing agents return a list of edits instead of rewriting the whole post;
+edits are validated against the current draft and applied locally in one
+pass, so unchanged text is never regenerated.
+
+Edit operations:
+    {"op": "replace", "find": "exact text", "replace": "new text"}       add "occurrence": n when find repeats
+    {"op": "delete", "find": "exact text"}
+    {"op": "insert_after_heading", "heading": "Why it matters", "text": "..."}
+    {"op": "insert_before_heading", "heading": "Next steps", "text": "..."}
+    {"op": "append", "text": "..."}
+
+Usage:
+    result = apply_edits(document, response['edits'])
+    result.text, result.applied, result.rejected
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Tuple
+
+OPERATIONS = ('replace', 'delete', 'insert_after_heading', 'insert_before_heading', 'append')
+HEADING = re.compile(r'^(#{1,6})[ \t]+(.+?)[ \t#]*$', re.MULTILINE)
+
+EDIT_INSTRUCTIONS = """
+Do NOT return the rewritten post. Return JSON with an "edits" list of operations against the draft in context:
+- {"op": "replace", "find": "<exact text from the draft>", "replace": "<new text>"}
+- {"op": "delete", "find": "<exact text from the draft>"}
+- {"op": "insert_after_heading", "heading": "<heading text>", "text": "<new paragraphs>"}
+- {"op": "insert_before_heading", "heading": "<heading text>", "text": "<new paragraphs>"}
+- {"op": "append", "text": "<new text at the end>"}
+"find" must match the draft exactly and should be long enough to be unique. Leave everything else untouched."""
+
+class EditError(ValueError):
+    """An edit that cannot be applied to the document"""
+
+@dataclass
+class PatchResult:
+    text: str
+    applied: List[Dict[str, Any]] = field(default_factory=list)
+    rejected: List[Dict[str, Any]] = field(default_factory=list)  # edit plus 'reason'
+
+def _heading_line(document: str, heading: str) -> Tuple[int, int]:
+    """Start and end offsets of the line holding heading (case and markup insensitive)"""
+    wanted = heading.strip().lstrip('#').strip().lower()
+    for match in HEADING.finditer(document):
+        if match.group(2).strip().lower() == wanted:
+            return match.start(), match.end()
+    raise EditError(f"heading not found: {heading!r}")
+
+def _find(document: str, text: str, occurrence: Any) -> int:
+    if not text:
+        raise EditError("empty find text")
+    starts = []
+    position = document.find(text)
+    while position != -1:
+        starts.append(position)
+        position = document.find(text, position + 1)
+    if not starts:
+        raise EditError("find text not in document")
+    if occurrence is None:
+        if len(starts) > 1:
+            raise EditError(f"find text is ambiguous ({len(starts)} matches); give occurrence")
+        return starts[0]
+    if not isinstance(occurrence, int) or not 1 <= occurrence <= len(starts):
+        raise EditError(f"occurrence {occurrence!r} out of range (1-{len(starts)})")
+    return starts[occurrence - 1]
+
+def locate(document: str, edit: Dict[str, Any]) -> Tuple[int, int, str]:
+    """(start, end, replacement) for one edit against the original document"""
+    if not isinstance(edit, dict):
+        raise EditError("edit is not an object")
+    op = edit.get('op')
+    if op not in OPERATIONS:
+        raise EditError(f"unknown op {op!r}")
+    if op in ('replace', 'delete'):
+        find = edit.get('find')
+        if not isinstance(find, str):
+            raise EditError("find must be a string")
+        start = _find(document, find, edit.get('occurrence'))
+        replacement = '' if op == 'delete' else edit.get('replace')
+        if not isinstance(replacement, str):
+            raise EditError("replace must be a string")
+        return start, start + len(find), replacement
+
+    text = edit.get('text')
+    if not isinstance(text, str) or not text.strip():
+        raise EditError("text must be a non-empty string")
+    block = text.strip('\n')
+    if op == 'append':
+        end = len(document.rstrip('\n'))
+        return end, end, '\n\n' + block
+    heading = edit.get('heading')
+    if not isinstance(heading, str):
+        raise EditError("heading must be a string")
+    start, end = _heading_line(document, heading)
+    if op == 'insert_after_heading':
+        return end, end, '\n\n' + block
+    return start, start, block + '\n\n'
+
+def apply_edits(document: str, edits: List[Dict[str, Any]]) -> PatchResult:
+    """
+    Apply every valid edit in a single pass over document.
+
+    All edits are located against the original text, so their order does
+    not shift offsets; an edit overlapping an earlier accepted one is
+    rejected rather than guessed at.
+    """
+    result = PatchResult(text=document)
+    located: List[Tuple[int, int, int, str]] = []  # start, end, order, replacement
+    for order, edit in enumerate(edits or []):
+        try:
+            start, end, replacement = locate(document, edit)
+        except EditError as error:
+            result.rejected.append({**edit, 'reason': str(error)} if isinstance(edit, dict)
+                                   else {'edit': edit, 'reason': str(error)})
+            continue
+        overlaps = any(
+            start < other_end and other_start < end or (start == end and other_start < start < other_end)
+            for other_start, other_end, _, _ in located
+        )
+        if overlaps:
+            result.rejected.append({**edit, 'reason': 'overlaps an earlier edit'})
+            continue
+        located.append((start, end, order, replacement))
+        result.applied.append(edit)
+
+    if not located:
+        return result
+    parts = []
+    cursor = 0
+    for start, end, _, replacement in sorted(located):
+        parts.append(document[cursor:start])
+        parts.append(replacement)
+        cursor = end
+    parts.append(document[cursor:])
+    result.text = ''.join(parts)
+    return result
+
+__all__ = [
+    'EDIT_INSTRUCTIONS',
+    'EditError',
+    'PatchResult',
+    'apply_edits',
+    'locate'
+]
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Long-running content generation service
+Keeps one editor-in-chief (agents + knowledge graph) warm across requests
+and serves jobs over a small local HTTP API:
+
+    POST /jobs               submit a brief   -> 202 {"job_id": ..., "status": "queued"}
+    GET  /jobs/<id>          job status (and result once completed)
+    GET  /jobs/<id>/stream   job events as JSON Lines until the job finishes
+    GET  /health             uptime, job counts and cache stats
+
+Finished jobs are kept for JOB_TTL_SECONDS (at most MAX_FINISHED_JOBS of
+them) and then forgotten; their posts stay in the result cache.
+
+Usage:
+    python -m src.content_service --port 8765 --workers 4
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from src.content_agents import (
+    ContentBrief,
+    ContentEditorInChief,
+    brief_from_dict,
+    case_study_brief,
+    breaking_news_brief,
+    pipeline_for
+)
+from src import events
+from src.events import emit
+from src.tracing import trace_run
+
+JOB_KINDS = ('blog', 'case-study', 'breaking-news')
+FINISHED = ('completed', 'failed')
+MAX_BODY_BYTES = 1024 * 1024
+JOB_TTL_SECONDS = 3600.0
+MAX_FINISHED_JOBS = 1000
+
+STATUS_TEXT = {
+    200: 'OK',
+    202: 'Accepted',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large'
+}
+
+def build_brief(request: Dict[str, Any]) -> ContentBrief:
+    """Turn a submit request into a brief for its job kind"""
+    kind = request.get('kind', 'blog')
+    if kind == 'case-study':
+        return case_study_brief(request['client'], request['results'], request['challenge'], request.get('solution', ''))
+    if kind == 'breaking-news':
+        return breaking_news_brief(request['news'], request.get('angle', ''), request.get('implications', []))
+    if kind == 'blog':
+        return brief_from_dict(request)
+    raise ValueError(f"Unknown job kind '{kind}', expected one of {', '.join(JOB_KINDS)}")
+
+class Job:
+    """One submitted brief and the events it has produced so far"""
+
+    def __init__(self, kind: str, brief: ContentBrief):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.brief = brief
+        self.status = 'queued'
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.cached = False
+        self.submitted = time.time()
+        self.finished: Optional[float] = None
+        self.events: List[Dict[str, Any]] = []
+        self._changed = asyncio.Condition()
+
+    async def emit(self, status: str, **details):
+        self.status = status
+        if status in FINISHED:
+            self.finished = time.time()
+        self.events.append({'event': status, 'time': datetime.now().isoformat(), **details})
+        async with self._changed:
+            self._changed.notify_all()
+
+    async def follow(self):
+        """Yield every event, past and future, until the job finishes"""
+        seen = 0
+        while True:
+            while seen < len(self.events):
+                seen += 1
+                yield self.events[seen - 1]
+            if self.status in FINISHED:
+                return
+            async with self._changed:
+                await self._changed.wait_for(lambda: len(self.events) > seen)
+
+    def summary(self) -> Dict[str, Any]:
+        summary = {
+            'job_id': self.id,
+            'kind': self.kind,
+            'topic': self.brief.topic,
+            'status': self.status,
+            'cached': self.cached,
+            'events': self.events
+        }
+        if self.status == 'completed':
+            summary['result'] = self.result
+        if self.error:
+            summary['error'] = self.error
+        return summary
+
+class ResultCache:
+    """LRU cache of finished posts keyed by the canonical brief"""
+
+    def __init__(self, size: int = 128):
+        self.size = size
+        self.entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(brief: ContentBrief) -> str:
+        return hashlib.sha256(json.dumps(asdict(brief), sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: str, result: Dict[str, Any]):
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+class ContentService:
+    """Warm editor-in-chief plus a job table, a result cache and a worker limit"""
+
+    def __init__(self, workers: int = 4, cache_size: int = 128, job_ttl: float = JOB_TTL_SECONDS):
+        self.editor = ContentEditorInChief()
+        self.cache = ResultCache(cache_size)
+        self.jobs: Dict[str, Job] = {}
+        self.job_ttl = job_ttl
+        self.tasks: Set[asyncio.Task] = set()
+        self.semaphore = asyncio.Semaphore(workers)
+        self.workers = workers
+        self.started = time.time()
+
+    def submit(self, request: Dict[str, Any]) -> Job:
+        job = Job(request.get('kind', 'blog'), build_brief(request))
+        self.evict_finished()
+        self.jobs[job.id] = job
+        job.events.append({'event': 'queued', 'time': datetime.now().isoformat()})
+        # Hold a reference until the job is done so the task is not garbage-collected mid-run
+        task = asyncio.ensure_future(self._run(job))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return job
+
+    def evict_finished(self) -> int:
+        """Forget finished jobs past their TTL, and the oldest beyond MAX_FINISHED_JOBS"""
+        cutoff = time.time() - self.job_ttl
+        finished = [job for job in self.jobs.values() if job.finished is not None]
+        expired = [job for job in finished if job.finished < cutoff]
+        expired += sorted(
+            (job for job in finished if job.finished >= cutoff), key=lambda job: job.finished
+        )[:max(0, len(finished) - len(expired) - MAX_FINISHED_JOBS)]
+        for job in expired:
+            del self.jobs[job.id]
+        return len(expired)
+
+    async def _run(self, job: Job):
+        key = self.cache.key(job.brief)
+        cached = self.cache.get(key)
+        if cached is not None:
+            job.result, job.cached = cached, True
+            emit('cache.hit', what=job.brief.topic, job_id=job.id)
+            await job.emit('completed', cached=True)
+            return
+
+        async with self.semaphore:
+            await job.emit('running')
+            began = time.perf_counter()
+            try:
+                with trace_run('content', job.brief.topic, queue_wait=time.time() - job.submitted, job_id=job.id):
+                    job.result = await self.editor.create_blog_post(job.brief, pipeline_for(job.brief))
+            except Exception as error:
+                job.error = str(error)
+                await job.emit('failed', error=job.error)
+                return
+        self.cache.put(key, job.result)
+        await job.emit('completed', seconds=round(time.perf_counter() - began, 3))
+
+    def health(self) -> Dict[str, Any]:
+        counts: Dict[str, int] = {}
+        for job in self.jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            'uptime': round(time.time() - self.started, 1),
+            'workers': self.workers,
+            'jobs': counts,
+            'cache': {'size': len(self.cache.entries), 'hits': self.cache.hits, 'misses': self.cache.misses},
+            'topics_covered': len(self.editor.knowledge_graph.topics_covered)
+        }
+
+    # HTTP
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            try:
+                request = await _read_request(reader)
+            except ValueError:
+                return await _respond(writer, 400, {'error': 'Malformed HTTP request'})
+            if request is None:
+                return
+            method, path, body = request
+            await self._route(method, path, body, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, body: bytes, writer: asyncio.StreamWriter):
+        parts = [part for part in path.split('?')[0].split('/') if part]
+
+        if parts == ['health'] and method == 'GET':
+            return await _respond(writer, 200, self.health())
+
+        if parts == ['jobs']:
+            if method != 'POST':
+                return await _respond(writer, 405, {'error': 'Use POST to submit a job'})
+            if len(body) > MAX_BODY_BYTES:
+                return await _respond(writer, 413, {'error': 'Request body too large'})
+            try:
+                job = self.submit(json.loads(body or b'{}'))
+            except (ValueError, KeyError, TypeError) as error:
+                message = f"Missing field {error}" if isinstance(error, KeyError) else str(error)
+                return await _respond(writer, 400, {'error': message})
+            return await _respond(writer, 202, {'job_id': job.id, 'status': job.status})
+
+        if len(parts) in (2, 3) and parts[0] == 'jobs' and method == 'GET':
+            job = self.jobs.get(parts[1])
+            if job is None:
+                return await _respond(writer, 404, {'error': f"Unknown job: {parts[1]}"})
+            if len(parts) == 2:
+                return await _respond(writer, 200, job.summary())
+            if parts[2] == 'stream':
+                return await self._stream(job, writer)
+
+        await _respond(writer, 404, {'error': f"No route for {method} {path}"})
+
+    async def _stream(self, job: Job, writer: asyncio.StreamWriter):
+        """Chunked JSON Lines: one line per event, then the final job summary"""
+        writer.write(_head(200, 'application/x-ndjson', chunked=True))
+        async for event in job.follow():
+            await _write_chunk(writer, json.dumps(event) + '\n')
+        await _write_chunk(writer, json.dumps({'event': 'result', **job.summary()}, default=str) + '\n')
+        writer.write(b'0\r\n\r\n')
+        await writer.drain()
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, bytes]]:
+    """(method, path, body), None on an empty connection; ValueError if malformed"""
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    method, path, _ = request_line.decode('latin-1').split(' ', 2)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    length = min(int(headers.get('content-length', 0)), MAX_BODY_BYTES + 1)
+    if length < 0:
+        raise ValueError(f"Negative Content-Length: {length}")
+    body = await reader.readexactly(length) if length else b''
+    return method.upper(), path, body
+
+def _head(status: int, content_type: str, length: Optional[int] = None, chunked: bool = False) -> bytes:
+    lines = [f"HTTP/1.1 {status} {STATUS_TEXT[status]}", f"Content-Type: {content_type}", "Connection: close"]
+    if chunked:
+        lines.append("Transfer-Encoding: chunked")
+    elif length is not None:
+        lines.append(f"Content-Length: {length}")
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+async def _respond(writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any]):
+    body = json.dumps(payload, default=str).encode('utf-8')
+    writer.write(_head(status, 'application/json', len(body)) + body)
+    await writer.drain()
+
+async def _write_chunk(writer: asyncio.StreamWriter, text: str):
+    data = text.encode('utf-8')
+    writer.write(f"{len(data):x}\r\n".encode('latin-1') + data + b'\r\n')
+    await writer.drain()
+
+async def serve(
+    host: str = '127.0.0.1',
+    port: int = 8765,
+    workers: int = 4,
+    cache_size: int = 128,
+    job_ttl: float = JOB_TTL_SECONDS
+):
+    service = ContentService(workers, cache_size, job_ttl)
+    server = await asyncio.start_server(service.handle, host, port)
+    print(f"🚀 Content service listening on http://{host}:{port} ({workers} workers)")
+    async with server:
+        await server.serve_forever()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the content pipeline over local HTTP")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=4, help='pipeline runs allowed at once')
+    parser.add_argument('--cache-size', type=int, default=128, help='finished posts kept in memory')
+    parser.add_argument('--job-ttl', type=float, default=JOB_TTL_SECONDS, help='seconds finished jobs stay queryable')
+    events.add_arguments(parser)
+    args = parser.parse_args()
+    events.subscribe_from_args(args)
+    try:
+        asyncio.run(serve(args.host, args.port, max(1, args.workers), args.cache_size, args.job_ttl))
+    except KeyboardInterrupt:
+        print("\n👋 Content service stopped")
+
+__all__ = [
+    'ContentService',
+    'Job',
+    'ResultCache',
+    'build_brief',
+    'serve'
+]
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Storage for generated content runs
+Append-only compressed JSON Lines archive with a queryable sidecar index,
+backed by a content-addressed blob store for pipeline intermediates, and a
+persistent phase store so edited briefs only regenerate affected phases
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are still atomic per process
+    fcntl = None
+
+def slugify(text: str) -> str:
+    """URL-style slug used to index runs"""
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+BLOB_REF = '$blob'
+
+class BlobStore:
+    """
+    Content-addressed storage: sha256 of canonical JSON -> gzip payload.
+
+    Identical values (the same brief, research or draft saved by several
+    runs) are stored once, under blobs/<first two hex chars>/<hash>.json.gz.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def put(self, value: Any) -> str:
+        """Store a value if it is new and return its hash"""
+        canonical = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+        digest = hashlib.sha256(canonical).hexdigest()
+        path = self._path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.partial")
+            partial.write_bytes(gzip.compress(canonical, mtime=0))
+            os.replace(partial, path)
+        return digest
+
+    def get(self, digest: str) -> Any:
+        return json.loads(gzip.decompress(self._path(digest).read_bytes()))
+
+    def __contains__(self, digest: str) -> bool:
+        return self._path(digest).exists()
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.json.gz"
+
+class PhaseStore:
+    """
+    Pipeline node outputs keyed by node fingerprint, kept across processes.
+
+    Drop-in for pipeline_dag.NodeCache: refs/<fingerprint> names the blob
+    holding that node's output, so regenerating an edited brief reuses
+    every phase whose fingerprint did not change. With refresh set nothing
+    is reused: every phase reruns and overwrites its stored output.
+    """
+
+    def __init__(self, root: str, blobs: Optional[BlobStore] = None, refresh: bool = False):
+        self.root = Path(root)
+        self.blobs = blobs or BlobStore(str(self.root / 'blobs'))  # share the archive's to store drafts once
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, fingerprint: str) -> Optional[Any]:
+        ref = self._ref(fingerprint)
+        if self.refresh or not ref.exists():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self.blobs.get(ref.read_text().strip())
+
+    def put(self, fingerprint: str, value: Any):
+        ref = self._ref(fingerprint)
+        ref.parent.mkdir(parents=True, exist_ok=True)
+        partial = ref.with_name(f"{ref.name}.{uuid.uuid4().hex[:8]}.partial")
+        partial.write_text(self.blobs.put(value))
+        os.replace(partial, ref)
+
+    def _ref(self, fingerprint: str) -> Path:
+        return self.root / 'refs' / fingerprint[:2] / fingerprint
+
+class ContentArchive:
+    """
+    Append-only archive of pipeline runs.
+
+    Each run is appended to the current segment (runs-NNNNNN.jsonl.gz) as its
+    own gzip member holding one JSON line, so a run can be read back with a
+    single seek and the segment is still a valid gzip JSON Lines file.
+    index.jsonl records run id, kind, slug, topic, date and the byte range of
+    every run; it is also append-only.
+
+    With dedupe on, each field of a pipeline result (brief, research,
+    headlines, drafts...) is stored in the BlobStore and the run record keeps
+    only {"$blob": hash} references, so repeated intermediates cost nothing.
+    """
+
+    SEGMENT_LIMIT = 64 * 1024 * 1024  # Start a new segment past 64MB
+
+    def __init__(self, root: str = "generated_content/archive", dedupe: bool = True):
+        self.root = Path(root)
+        self.index_path = self.root / "index.jsonl"
+        self.blobs = BlobStore(self.root / "blobs")
+        self.dedupe = dedupe
+
+    def append(self, content: Any, kind: str, topic: Optional[str] = None) -> Dict[str, Any]:
+        """Stream one run into the archive and return its index entry"""
+        topic = topic or _infer_topic(content) or kind
+        created = datetime.now()
+        entry = {
+            'run_id': f"{created.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}",
+            'kind': kind,
+            'slug': slugify(topic),
+            'topic': topic,
+            'date': created.isoformat()
+        }
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        if self.dedupe:
+            content = self._to_refs(content)
+        with self._locked():
+            segment = self._current_segment()
+            with open(segment, 'ab') as raw:
+                offset = raw.tell()
+                with gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as compressed:
+                    # iterencode streams the JSON so large runs are never held as one string
+                    for chunk in json.JSONEncoder(default=str).iterencode({**entry, 'content': content}):
+                        compressed.write(chunk.encode('utf-8'))
+                    compressed.write(b'\n')
+                length = raw.tell() - offset
+
+            entry.update({'segment': segment.name, 'offset': offset, 'length': length})
+            with open(self.index_path, 'a', encoding='utf-8') as index:
+                index.write(json.dumps(entry) + '\n')
+
+        return entry
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        """Iterate index entries in append order"""
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, 'r', encoding='utf-8') as index:
+            for line in index:
+                if line.strip():
+                    yield json.loads(line)
+
+    def find(
+        self,
+        run_id: Optional[str] = None,
+        slug: Optional[str] = None,
+        topic: Optional[str] = None,
+        kind: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Find runs by id, slug, topic, kind and ISO date range"""
+        matches = []
+        for entry in self.entries():
+            if run_id and entry['run_id'] != run_id:
+                continue
+            if slug and entry['slug'] != slug:
+                continue
+            if topic and entry['topic'] != topic:
+                continue
+            if kind and entry['kind'] != kind:
+                continue
+            if since and entry['date'] < since:
+                continue
+            if until and entry['date'] > until:
+                continue
+            matches.append(entry)
+        return matches
+
+    def load(self, entry: Dict[str, Any]) -> Any:
+        """Read one run back using its index entry"""
+        with open(self.root / entry['segment'], 'rb') as raw:
+            raw.seek(entry['offset'])
+            record = json.loads(gzip.decompress(raw.read(entry['length'])))
+        return self._from_refs(record['content'])
+
+    def get(self, run_id: str) -> Any:
+        """Load a run by id"""
+        matches = self.find(run_id=run_id)
+        if not matches:
+            raise KeyError(f"Unknown run: {run_id}")
+        return self.load(matches[0])
+
+    def latest(self, slug: str) -> Optional[Any]:
+        """Most recent run for a slug, if any"""
+        matches = self.find(slug=slug)
+        return self.load(matches[-1]) if matches else None
+
+    def _to_refs(self, content: Any) -> Any:
+        """Swap each field of every pipeline result for a blob reference"""
+        if isinstance(content, list):
+            return [self._to_refs(item) for item in content]
+        if isinstance(content, dict):
+            if 'brief' in content:
+                return {key: {BLOB_REF: self.blobs.put(value)} for key, value in content.items()}
+            # Wrappers such as the weekly calendar's {"day", "type", "content"}
+            return {key: self._to_refs(value) for key, value in content.items()}
+        return content
+
+    def _from_refs(self, content: Any) -> Any:
+        if isinstance(content, list):
+            return [self._from_refs(item) for item in content]
+        if isinstance(content, dict):
+            if len(content) == 1 and BLOB_REF in content:
+                return self.blobs.get(content[BLOB_REF])
+            return {key: self._from_refs(value) for key, value in content.items()}
+        return content
+
+    def _current_segment(self) -> Path:
+        segments = sorted(self.root.glob('runs-*.jsonl.gz'))
+        if segments and segments[-1].stat().st_size < self.SEGMENT_LIMIT:
+            return segments[-1]
+        number = int(segments[-1].name[5:11]) + 1 if segments else 1
+        return self.root / f"runs-{number:06d}.jsonl.gz"
+
+    @contextmanager
+    def _locked(self):
+        """Serialize appends across processes where the platform allows it"""
+        with open(self.root / '.lock', 'w') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+def _infer_topic(content: Any) -> Optional[str]:
+    """Pull the brief topic out of a single post or the first post of a batch"""
+    if isinstance(content, list) and content:
+        content = content[0]
+        if isinstance(content, dict) and 'content' in content:
+            content = content['content']
+    if isinstance(content, dict):
+        brief = content.get('brief')
+        if isinstance(brief, dict):
+            return brief.get('topic')
+    return None
+
+__all__ = [
+    'BlobStore',
+    'ContentArchive',
+    'PhaseStore',
+    'slugify'
+]
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Structured progress events for the content and knowledge pipelines
+The orchestrators and agents emit events (run/phase started and finished,
+agent calls, cache hits, errors) instead of printing. Each subscriber gets
+its own queue drained on a background thread, so emitting never blocks the
+event loop on terminal or file I/O, and concurrent runs don't interleave
+half-written lines. With no subscribers, emit() returns immediately.
+
+Subscribers:
+    ConsoleRenderer   the familiar emoji progress lines (prefixed by topic when runs overlap)
+    JsonlLogger       one JSON object per event
+    ProgressView      a live status line per running brief
+
+Usage:
+    from src import events
+    events.subscribe(events.ConsoleRenderer())
+    events.subscribe(events.JsonlLogger('generated_content/events.jsonl'))
+"""
+
+import atexit
+import json
+import queue
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, List, Optional, Iterator
+
+from src.tracing import trace_run
+
+@dataclass
+class Event:
+    type: str  # run.started, run.finished, phase.started, phase.finished, agent.call, cache.hit, error...
+    time: float
+    pipeline: Optional[str] = None
+    topic: Optional[str] = None
+    run_id: Optional[str] = None
+    fields: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+class Subscriber:
+    """Base subscriber: handle() runs on the subscriber's own thread"""
+
+    def handle(self, event: Event):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+class _Channel:
+    """Queue plus drain thread for one subscriber"""
+
+    def __init__(self, subscriber: Subscriber):
+        self.subscriber = subscriber
+        self.queue: queue.Queue = queue.Queue()
+        self.thread = threading.Thread(target=self._drain, name=f"events-{type(subscriber).__name__}", daemon=True)
+        self.thread.start()
+
+    def _drain(self):
+        while True:
+            event = self.queue.get()
+            try:
+                if event is None:
+                    return
+                self.subscriber.handle(event)
+            except Exception as error:  # A broken subscriber must not take the pipeline down
+                print(f"⚠️ Event subscriber {type(self.subscriber).__name__} failed: {error}", file=sys.stderr)
+            finally:
+                self.queue.task_done()
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+        self.subscriber.close()
+
+_channels: List[_Channel] = []
+_run: ContextVar[Optional[Dict[str, str]]] = ContextVar('event_run', default=None)
+
+def subscribe(subscriber: Subscriber) -> Subscriber:
+    _channels.append(_Channel(subscriber))
+    return subscriber
+
+def unsubscribe(subscriber: Subscriber):
+    for channel in list(_channels):
+        if channel.subscriber is subscriber:
+            _channels.remove(channel)
+            channel.close()
+
+def listening() -> bool:
+    return bool(_channels)
+
+def emit(event_type: str, **fields):
+    """Publish an event to every subscriber; free when nobody is subscribed"""
+    if not _channels:
+        return
+    run = _run.get() or {}
+    event = Event(event_type, time.time(), run.get('pipeline'), run.get('topic'), run.get('run_id'), fields)
+    for channel in _channels:
+        channel.queue.put_nowait(event)
+
+def flush():
+    """Block until every queued event has been handled"""
+    for channel in list(_channels):
+        channel.queue.join()
+
+@atexit.register
+def close_all():
+    while _channels:
+        _channels.pop().close()
+
+@contextmanager
+def pipeline_run(pipeline: str, topic: str) -> Iterator[None]:
+    """Trace a pipeline run and tag the events emitted inside it"""
+    token = _run.set({'pipeline': pipeline, 'topic': topic, 'run_id': uuid.uuid4().hex[:8]})
+    try:
+        with trace_run(pipeline, topic):
+            yield
+    except Exception as error:
+        emit('error', error=f"{type(error).__name__}: {error}")
+        raise
+    finally:
+        _run.reset(token)
+
+# Subscribers
+
+class ConsoleRenderer(Subscriber):
+    """Emoji progress lines as the pipelines used to print them"""
+
+    def __init__(self, stream=None, prompt_preview: bool = True):
+        self.stream = stream or sys.stdout
+        self.prompt_preview = prompt_preview
+        self.active: Dict[str, str] = {}
+
+    def handle(self, event: Event):
+        if event.type == 'run.started':
+            self.active[event.run_id] = event.topic
+        # With several runs in flight, say which one each line belongs to
+        prefix = f"[{event.topic}] " if len(self.active) > 1 and event.topic else ''
+        lines = self.render(event)
+        if event.type in ('run.finished', 'error'):
+            self.active.pop(event.run_id, None)
+        if lines:
+            self.stream.write(''.join(f"{prefix}{line}\n" if line else '\n' for line in lines))
+            self.stream.flush()
+
+    def render(self, event: Event) -> List[str]:
+        data = event.fields
+        if event.type in ('run.started', 'series.started'):
+            lines = ['', f"{data['title']}: {event.topic or data.get('name', '')}"]
+            lines += [f"   {label}: {value}" for label, value in data.get('details', {}).items()]
+            return lines + ['=' * 50]
+        if event.type == 'phase.started':
+            return ['', data['title']]
+        if event.type == 'agent.call':
+            lines = ['', f"{data['icon']} {data['role']} {data['activity']}..."]
+            if self.prompt_preview and data.get('prompt_preview'):
+                lines.append(f"Prompt preview: {data['prompt_preview']}...")
+            return lines
+        if event.type == 'run.finished':
+            return ['', data['title']]
+        if event.type == 'cache.hit':
+            return [f"♻️ Cache hit: {data.get('what', event.topic)}"]
+        if event.type == 'error':
+            return [f"❌ {data['error']}"]
+        return []
+
+class JsonlLogger(Subscriber):
+    """Append every event to a JSON Lines file"""
+
+    def __init__(self, path: str):
+        self.file = open(path, 'a', encoding='utf-8')
+
+    def handle(self, event: Event):
+        # Flushed per line: this runs on the logger's own thread, and a crashed run keeps its log
+        self.file.write(json.dumps(event.to_dict(), default=str) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+class ProgressView(Subscriber):
+    """
+    One status line per running brief: current phase and agent calls so far.
+
+    Redraws in place on a terminal; elsewhere prints a line per phase change.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stderr
+        self.live = hasattr(self.stream, 'isatty') and self.stream.isatty()
+        self.runs: Dict[str, Dict[str, Any]] = {}
+        self.finished = 0
+        self.drawn = 0
+
+    def handle(self, event: Event):
+        if event.run_id is None:
+            return
+        run = self.runs.setdefault(event.run_id, {'topic': event.topic, 'phase': 'starting', 'calls': 0,
+                                                   'started': event.time})
+        if event.type == 'phase.started':
+            run['phase'] = event.fields['phase']
+        elif event.type == 'agent.call':
+            run['calls'] += 1
+        elif event.type in ('run.finished', 'error'):
+            self.runs.pop(event.run_id, None)
+            self.finished += 1
+        else:
+            return
+        if self.live:
+            self._redraw()
+        elif event.type == 'phase.started':
+            self.stream.write(f"⏳ {run['topic']}: {run['phase']}\n")
+            self.stream.flush()
+
+    def _redraw(self):
+        lines = [f"⏳ {len(self.runs)} running, {self.finished} finished"]
+        now = time.time()
+        for run in self.runs.values():
+            lines.append(f"   {run['topic'][:40]:<40} {run['phase'][:32]:<32} "
+                         f"{run['calls']:>3} calls {now - run['started']:>6.1f}s")
+        # Move up over the previous frame and clear it before drawing the new one
+        output = '\x1b[F\x1b[2K' * self.drawn + '\n'.join(lines) + '\n'
+        self.stream.write(output)
+        self.stream.flush()
+        self.drawn = len(lines)
+
+def add_arguments(parser, default: str = 'console'):
+    """--events/--event-log options shared by the command-line entry points"""
+    parser.add_argument('--events', choices=['console', 'progress', 'none'], default=default,
+                        help='how to show pipeline progress (default: %(default)s)')
+    parser.add_argument('--event-log', metavar='FILE', help='append every pipeline event to FILE (JSON Lines)')
+
+def subscribe_from_args(args):
+    if args.events == 'console':
+        subscribe(ConsoleRenderer())
+    elif args.events == 'progress':
+        subscribe(ProgressView())
+    if args.event_log:
+        subscribe(JsonlLogger(args.event_log))
+
+__all__ = [
+    'ConsoleRenderer',
+    'Event',
+    'JsonlLogger',
+    'ProgressView',
+    'Subscriber',
+    'add_arguments',
+    'emit',
+    'flush',
+    'listening',
+    'pipeline_run',
+    'subscribe',
+    'subscribe_from_args',
+    'unsubscribe'
+]
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+Persistent priority job queue for pipeline runs
+Schedules briefs by ContentBrief.urgency_level: urgent posts jump the queue,
+pre-empt running batch work when every worker is busy, and waiting batch
+jobs age upwards so a steady stream of urgent work cannot starve them.
+
+Claimed jobs are leased to their worker and kept alive by heartbeats; a job
+whose lease runs out (the worker died or hung) is handed to another worker,
+up to MAX_ATTEMPTS times. See src/worker_pool.py for running several
+worker processes against one queue.
+
+Usage:
+    python -m src.job_queue enqueue briefs.jsonl          # add briefs (JSON Lines)
+    python -m src.job_queue enqueue --topic "..." --urgency breaking-news
+    python -m src.job_queue enqueue --topic "..." --kind knowledge
+    python -m src.job_queue run --workers 4               # process jobs until stopped
+    python -m src.job_queue status
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable
+
+from src.content_agents import ContentEditorInChief, brief_from_dict, pipeline_for
+from src.knowledge_agents import KnowledgeArchitect, KnowledgeBrief, create_knowledge_brief
+from src.content_store import ContentArchive
+from src import events
+from src.tracing import trace_run
+
+# Lower runs sooner
+URGENCY_PRIORITY = {
+    'breaking-news': 0,
+    'critical': 0,
+    'high': 1,
+    'medium': 2,
+    'low': 3,
+    'batch': 4
+}
+DEFAULT_PRIORITY = URGENCY_PRIORITY['medium']
+# Jobs at or below this urgency may be interrupted and requeued for urgent work
+PREEMPTIBLE_PRIORITY = URGENCY_PRIORITY['medium']
+# A waiting job gains one priority level per interval
+AGING_SECONDS = 300.0
+# ...but never ages past this level, so urgent posts always go first
+AGING_FLOOR = URGENCY_PRIORITY['high']
+POLL_SECONDS = 1.0
+# Workers heartbeat every poll; a lease not renewed for this long is abandoned
+LEASE_SECONDS = 60.0
+MAX_ATTEMPTS = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    urgency TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    brief TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    enqueued_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    preemptions INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    run_id TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_queued ON jobs (status, priority, enqueued_at);
+"""
+LEASE_COLUMNS = {
+    'attempts': "INTEGER NOT NULL DEFAULT 0",
+    'lease_owner': "TEXT",
+    'lease_expires': "REAL"
+}
+
+def urgency_priority(urgency: str) -> int:
+    return URGENCY_PRIORITY.get(urgency, DEFAULT_PRIORITY)
+
+def worker_id() -> str:
+    """Lease owner name for this process"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+def brief_for_job(kind: str, data: Dict[str, Any]):
+    """Rebuild a ContentBrief, or a KnowledgeBrief for knowledge jobs, from stored fields"""
+    if kind == 'knowledge':
+        brief = create_knowledge_brief(data['topic'])
+        for key, value in data.items():
+            if hasattr(brief, key):
+                setattr(brief, key, value)
+        return brief
+    return brief_from_dict(data)
+
+class JobQueue:
+    """
+    SQLite-backed queue of briefs.
+
+    claim() hands out the queued job with the best aged priority:
+    priority - waiting time / AGING_SECONDS, never below AGING_FLOOR for
+    jobs that started above it, ties broken by age, and leases it to the
+    claiming worker. Claims and reaps run inside BEGIN IMMEDIATE
+    so several processes can share one database.
+    """
+
+    def __init__(self, path: str = "generated_content/jobs.db", aging_seconds: float = AGING_SECONDS):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.aging_seconds = aging_seconds
+        self.db = sqlite3.connect(str(self.path), isolation_level=None, timeout=30)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """Add lease columns to queues created before leases existed"""
+        existing = {row['name'] for row in self.db.execute("PRAGMA table_info(jobs)")}
+        for column, definition in LEASE_COLUMNS.items():
+            if column not in existing:
+                self.db.execute(f"ALTER TABLE jobs ADD COLUMN {column} {definition}")
+
+    @contextmanager
+    def _transaction(self):
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        self.db.execute("COMMIT")
+
+    def enqueue(self, brief, kind: str = 'blog') -> int:
+        """Queue a ContentBrief, or a KnowledgeBrief (which has no urgency, so runs at medium)"""
+        urgency = getattr(brief, 'urgency_level', 'medium')
+        cursor = self.db.execute(
+            "INSERT INTO jobs (kind, topic, urgency, priority, brief, enqueued_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (kind, brief.topic, urgency, urgency_priority(urgency), json.dumps(asdict(brief)), time.time())
+        )
+        return cursor.lastrowid
+
+    def _aged_priority(self) -> str:
+        """SQL for a job's aged priority at time ? (urgent jobs are already at the top)"""
+        return (f"MAX(priority - (? - enqueued_at) / {float(self.aging_seconds)}, "
+                f"MIN(priority, {AGING_FLOOR}))")
+
+    def peek(self) -> Optional[sqlite3.Row]:
+        """Best queued job without claiming it, with its aged_priority"""
+        return self.db.execute(
+            f"SELECT *, {self._aged_priority()} AS aged_priority FROM jobs WHERE status = 'queued' "
+            "ORDER BY aged_priority, enqueued_at, id LIMIT 1",
+            (time.time(),)
+        ).fetchone()
+
+    def claim(self, owner: Optional[str] = None, lease_seconds: float = LEASE_SECONDS) -> Optional[sqlite3.Row]:
+        """Lease the best queued job to owner and return it"""
+        now = time.time()
+        with self._transaction():
+            job = self.peek()
+            if job is None:
+                return None
+            self.db.execute(
+                "UPDATE jobs SET status = 'running', started_at = ?, attempts = attempts + 1, "
+                "lease_owner = ?, lease_expires = ? WHERE id = ?",
+                (now, owner or worker_id(), now + lease_seconds, job['id'])
+            )
+        return job
+
+    def heartbeat(self, job_ids: Iterable[int], owner: str, lease_seconds: float = LEASE_SECONDS) -> List[int]:
+        """Extend the owner's leases; returns the ids it still holds"""
+        held = []
+        expires = time.time() + lease_seconds
+        for job_id in job_ids:
+            updated = self.db.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE id = ? AND status = 'running' AND lease_owner = ?",
+                (expires, job_id, owner)
+            ).rowcount
+            if updated:
+                held.append(job_id)
+        return held
+
+    def reap_expired(self, max_attempts: int = MAX_ATTEMPTS) -> int:
+        """Requeue running jobs whose lease ran out, failing those out of attempts"""
+        now = time.time()
+        with self._transaction():
+            self.db.execute(
+                "UPDATE jobs SET status = 'failed', finished_at = ?, lease_owner = NULL, "
+                "error = 'lease expired after ' || attempts || ' attempts' "
+                "WHERE status = 'running' AND lease_expires < ? AND attempts >= ?",
+                (now, now, max_attempts)
+            )
+            return self.db.execute(
+                "UPDATE jobs SET status = 'queued', started_at = NULL, lease_owner = NULL "
+                "WHERE status = 'running' AND lease_expires < ?",
+                (now,)
+            ).rowcount
+
+    def complete(self, job_id: int, run_id: Optional[str] = None, owner: Optional[str] = None) -> bool:
+        """Mark a job done; with an owner, only if that worker still holds the lease"""
+        return self._finish(job_id, owner, "status = 'completed', run_id = ?", run_id)
+
+    def fail(self, job_id: int, error: str, owner: Optional[str] = None) -> bool:
+        return self._finish(job_id, owner, "status = 'failed', error = ?", error)
+
+    def _finish(self, job_id: int, owner: Optional[str], assignment: str, value: Any) -> bool:
+        query = f"UPDATE jobs SET {assignment}, finished_at = ?, lease_owner = NULL WHERE id = ?"
+        params = [value, time.time(), job_id]
+        if owner:
+            query += " AND status = 'running' AND lease_owner = ?"
+            params.append(owner)
+        return self.db.execute(query, params).rowcount > 0
+
+    def requeue(self, job_id: int, preempted: bool = False):
+        """Put a job back in line; it keeps its original enqueue time, and so its aging"""
+        self.db.execute(
+            "UPDATE jobs SET status = 'queued', started_at = NULL, lease_owner = NULL, "
+            "preemptions = preemptions + ?, attempts = MAX(attempts - ?, 0) WHERE id = ?",
+            (int(preempted), int(preempted), job_id)
+        )
+
+    def pending(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued'").fetchone()[0]
+
+    def counts(self) -> Dict[str, int]:
+        return {row['status']: row['n'] for row in self.db.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status")}
+
+    def jobs(self, status: Optional[str] = None, limit: int = 50) -> List[sqlite3.Row]:
+        if status:
+            return self.db.execute(
+                f"SELECT *, {self._aged_priority()} AS aged_priority FROM jobs WHERE status = ? "
+                "ORDER BY aged_priority, enqueued_at, id LIMIT ?", (time.time(), status, limit)
+            ).fetchall()
+        return self.db.execute("SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+
+class PriorityScheduler:
+    """
+    Runs queued briefs on a warm editor with a fixed number of slots,
+    renewing the lease on every running job each poll.
+
+    When every slot is busy and the best queued job is of a strictly more
+    urgent tier than a running pre-emptible job, the least urgent running
+    job is cancelled and requeued so the urgent post starts on the next
+    poll. Aging only changes claim order, never pre-emption.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        workers: int = 4,
+        editor: Optional[ContentEditorInChief] = None,
+        archive: Optional[ContentArchive] = None,
+        poll_seconds: float = POLL_SECONDS,
+        lease_seconds: float = LEASE_SECONDS
+    ):
+        self.queue = queue
+        self.workers = workers
+        self.editor = editor or ContentEditorInChief()
+        self.archive = archive or ContentArchive()
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.owner = worker_id()
+        self.running: Dict[int, Dict[str, Any]] = {}
+        self._architect: Optional[KnowledgeArchitect] = None
+
+    @property
+    def architect(self) -> KnowledgeArchitect:
+        """Knowledge pipeline, built on the first knowledge job"""
+        if self._architect is None:
+            self._architect = KnowledgeArchitect()
+        return self._architect
+
+    async def run(self, until_idle: bool = False):
+        print(f"🗂️ Scheduler {self.owner} started with {self.workers} workers ({self.queue.pending()} jobs queued)")
+
+        while True:
+            self._renew_leases()
+            reaped = self.queue.reap_expired()
+            if reaped:
+                print(f"♻️ Requeued {reaped} jobs whose worker stopped heartbeating")
+            self._fill_slots()
+            self._preempt()
+            if until_idle and not self.running and not self.queue.pending() and not self.queue.counts().get('running'):
+                break
+            tasks = [slot['task'] for slot in self.running.values()]
+            if tasks:
+                await asyncio.wait(tasks, timeout=self.poll_seconds, return_when=asyncio.FIRST_COMPLETED)
+            else:
+                await asyncio.sleep(self.poll_seconds)
+
+    def _renew_leases(self):
+        held = set(self.queue.heartbeat(list(self.running), self.owner, self.lease_seconds))
+        for job_id in [job_id for job_id in self.running if job_id not in held]:
+            # Another worker took over after our lease lapsed; stop duplicating its work
+            print(f"⚠️ Lost lease on job {job_id}, abandoning it")
+            self.running.pop(job_id)['task'].cancel()
+
+    def _fill_slots(self):
+        while len(self.running) < self.workers:
+            job = self.queue.claim(self.owner, self.lease_seconds)
+            if job is None:
+                return
+            self._start(job)
+
+    def _preempt(self):
+        if len(self.running) < self.workers:
+            return
+        waiting = self.queue.peek()
+        if waiting is None:
+            return
+        # Compare base tiers: aging orders claims but never pre-empts a job of the same tier
+        candidates = [
+            slot for slot in self.running.values()
+            if slot['job']['priority'] >= PREEMPTIBLE_PRIORITY
+            and slot['job']['priority'] > waiting['priority']
+            and not slot['task'].done()
+        ]
+        if not candidates:
+            return
+        # Interrupt the least urgent, most recently started job: it has the least work to lose
+        victim = max(candidates, key=lambda slot: (slot['job']['priority'], slot['started']))
+        print(f"⏸️ Pre-empting job {victim['job']['id']} ({victim['job']['urgency']}) "
+              f"for job {waiting['id']} ({waiting['urgency']})")
+        victim['task'].cancel()
+        self.running.pop(victim['job']['id'])
+        self.queue.requeue(victim['job']['id'], preempted=True)
+        self._fill_slots()
+
+    def _start(self, job: sqlite3.Row):
+        print(f"▶️ Job {job['id']} [{job['urgency']}] {job['topic']}")
+        task = asyncio.ensure_future(self._execute(job))
+        self.running[job['id']] = {'job': job, 'task': task, 'started': time.monotonic()}
+
+    async def _execute(self, job: sqlite3.Row):
+        try:
+            brief = brief_for_job(job['kind'], json.loads(job['brief']))
+            pipeline = 'knowledge' if isinstance(brief, KnowledgeBrief) else 'content'
+            with trace_run(pipeline, brief.topic, queue_wait=time.time() - job['enqueued_at'], job_id=job['id']):
+                if pipeline == 'knowledge':
+                    post = await self.architect.create_knowledge_content(brief)
+                else:
+                    post = await self.editor.create_blog_post(brief, pipeline_for(brief))
+            entry = self.archive.append(post, kind=job['kind'], topic=brief.topic)
+            if self.queue.complete(job['id'], entry['run_id'], owner=self.owner):
+                print(f"✅ Job {job['id']} done ({entry['run_id']})")
+            else:
+                print(f"⚠️ Job {job['id']} finished after its lease moved on; kept run {entry['run_id']}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            self.queue.fail(job['id'], str(error), owner=self.owner)
+            print(f"❌ Job {job['id']} failed: {error}")
+        finally:
+            if self.running.get(job['id'], {}).get('job') is job:
+                del self.running[job['id']]
+
+def _enqueue_command(args):
+    queue = JobQueue(args.db)
+    briefs = []
+    if args.manifest:
+        with open(args.manifest) as f:
+            briefs = [json.loads(line) for line in f if line.strip() and not line.lstrip().startswith('#')]
+    if args.topic:
+        briefs.append({'topic': args.topic})
+    for data in briefs:
+        if args.urgency:
+            data['urgency_level'] = args.urgency
+        kind = data.get('kind', args.kind)
+        brief = brief_for_job(kind, data)
+        job_id = queue.enqueue(brief, kind)
+        print(f"➕ Job {job_id} [{getattr(brief, 'urgency_level', 'medium')}] {brief.topic}")
+
+def _status_command(args):
+    queue = JobQueue(args.db)
+    print(json.dumps(queue.counts()))
+    for job in queue.jobs('running') + queue.jobs('queued', limit=args.limit):
+        print(f"  {job['id']:>5}  {job['status']:<8} {job['urgency']:<14} {job['topic']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Priority job queue for pipeline runs")
+    parser.add_argument('--db', default="generated_content/jobs.db", help='queue database')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    enqueue = commands.add_parser('enqueue', help='add briefs to the queue')
+    enqueue.add_argument('manifest', nargs='?', help='JSON Lines file of briefs')
+    enqueue.add_argument('--topic', help='enqueue a single quick brief')
+    enqueue.add_argument('--urgency', choices=sorted(URGENCY_PRIORITY), help='override urgency_level')
+    enqueue.add_argument('--kind', default='blog', help="job kind; 'knowledge' runs the knowledge pipeline")
+
+    run = commands.add_parser('run', help='process queued jobs')
+    run.add_argument('--workers', type=int, default=4)
+    run.add_argument('--until-idle', action='store_true', help='exit once no jobs are queued or running')
+    events.add_arguments(run)
+
+    status = commands.add_parser('status', help='show queue contents')
+    status.add_argument('--limit', type=int, default=20)
+
+    args = parser.parse_args()
+    if args.command == 'enqueue':
+        if not args.manifest and not args.topic:
+            parser.error("enqueue needs a manifest or --topic")
+        _enqueue_command(args)
+    elif args.command == 'status':
+        _status_command(args)
+    else:
+        events.subscribe_from_args(args)
+        scheduler = PriorityScheduler(JobQueue(args.db), workers=max(1, args.workers))
+        try:
+            asyncio.run(scheduler.run(until_idle=args.until_idle))
+        except KeyboardInterrupt:
+            print("\n👋 Scheduler stopped; its running jobs are requeued once their leases expire")
+
+__all__ = [
+    'AGING_FLOOR',
+    'JobQueue',
+    'PriorityScheduler',
+    'URGENCY_PRIORITY',
+    'brief_for_job',
+    'urgency_priority',
+    'worker_id'
+]
+
+if __name__ == "__main__":
+    main()
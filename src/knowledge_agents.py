@@ -6,13 +6,23 @@ Optimized for maximum information value and comprehensive understanding
 
 import json
 import asyncio
+import heapq
+import re
 from datetime import datetime
+from difflib import get_close_matches
+from contextvars import ContextVar
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import hashlib
 from pathlib import Path
 
+from src.llm_backend import current_backend
+from src.agent_registry import AgentRoster
+from src.events import emit, pipeline_run
+from src.pipeline_dag import NodeCache, brief_lines, load_pipeline, run_pipeline
+from src.tracing import agent_call
+
 # Knowledge Agent Roles - Focused on Information Excellence
 class KnowledgeAgentRole(Enum):
     KNOWLEDGE_ARCHITECT = "Knowledge Architect"
@@ -65,6 +75,19 @@ class KnowledgeBrief:
     data_requirements: List[str]  # Types of data/evidence needed
     visual_requirements: List[str]  # Charts, diagrams, etc needed
 
+# Brief fields shown in research prompts (only a pipeline node's brief_fields while it runs)
+BRIEF_PROMPT_LABELS = {
+    'topic': 'Topic',
+    'depth_level': 'Depth Level',
+    'scope': 'Scope',
+    'target_expertise': 'Reader Starting Point',
+    'desired_expertise': 'Goal Expertise Level',
+    'knowledge_goals': 'Knowledge Goals',
+    'misconceptions_to_address': 'Misconceptions to Correct',
+    'information_density': 'Information Density',
+    'primary_sources_required': 'Primary Sources Required'
+}
+
 # Knowledge Expert Frameworks
 KNOWLEDGE_EXPERTS = {
     "Richard Feynman": {
@@ -117,6 +140,17 @@ KNOWLEDGE_EXPERTS = {
     }
 }
 
+# Similarity ratio above which two canonical concept names are treated as the same concept
+CONCEPT_MATCH_CUTOFF = 0.9
+
+def _canonical_concept(name: str) -> str:
+    """Normalize a concept name for deduplication (case, punctuation, plurals)"""
+    words = re.findall(r"[\w'-]+", name.casefold())
+    return ' '.join(
+        word[:-1] if len(word) > 3 and word.endswith('s') and not word.endswith('ss') else word
+        for word in words
+    )
+
 class KnowledgeGraph:
     """Advanced knowledge graph for information relationships"""
     def __init__(self):
@@ -161,12 +195,22 @@ class KnowledgeGraph:
         # through the knowledge graph
         return []
 
+# Graph of the architect whose run is in progress (agents are shared across architects)
+_active_graph: ContextVar[Optional[KnowledgeGraph]] = ContextVar('knowledge_graph', default=None)
+
 class ResearchAgent:
     """Base research agent focused on information excellence"""
-    def __init__(self, role: KnowledgeAgentRole, knowledge_graph: KnowledgeGraph):
+    def __init__(self, role: KnowledgeAgentRole, knowledge_graph: Optional[KnowledgeGraph] = None):
         self.role = role
-        self.knowledge_graph = knowledge_graph
+        self._knowledge_graph = knowledge_graph
         self.experts = self._get_role_experts()
+
+    @property
+    def knowledge_graph(self) -> Optional[KnowledgeGraph]:
+        """The graph given at construction, else that of the architect running this call"""
+        if self._knowledge_graph is not None:
+            return self._knowledge_graph
+        return _active_graph.get()
         
     def _get_role_experts(self) -> List[str]:
         """Map experts to agent roles"""
@@ -186,9 +230,10 @@ class ResearchAgent:
         output = await self._call_claude(prompt)
         
         # Add findings to knowledge graph
-        if 'concepts' in output:
+        graph = self.knowledge_graph
+        if graph is not None and 'concepts' in output:
             for concept in output['concepts']:
-                self.knowledge_graph.add_concept(
+                graph.add_concept(
                     concept['name'],
                     concept['definition'],
                     concept.get('evidence_level', 0.5)
@@ -203,15 +248,7 @@ class ResearchAgent:
         prompt = f"""You are an expert {self.role.value} focused on creating the most informative and comprehensive content possible.
 
 Research Brief:
-- Topic: {brief.topic}
-- Depth Level: {brief.depth_level}
-- Scope: {brief.scope}
-- Reader Starting Point: {brief.target_expertise}
-- Goal Expertise Level: {brief.desired_expertise}
-- Knowledge Goals: {', '.join(brief.knowledge_goals)}
-- Misconceptions to Correct: {', '.join(brief.misconceptions_to_address)}
-- Information Density: {brief.information_density}
-- Primary Sources Required: {brief.primary_sources_required}
+{brief_lines(brief, BRIEF_PROMPT_LABELS)}
 
 Expert Frameworks to Apply:
 {expert_knowledge}
@@ -248,9 +285,13 @@ Return comprehensive findings in structured JSON format.
                 context += f"\n- Principle: {info['principle']}\n"
         return context
     
+    @agent_call
     async def _call_claude(self, prompt: str) -> Dict[str, Any]:
         """Placeholder for Claude integration"""
-        print(f"\n🔬 {self.role.value} researching...")
+        emit('agent.call', role=self.role.value, icon='🔬', activity='researching')
+        backend = current_backend()
+        if backend is not None:
+            return await backend.complete(self.role.value, prompt)
         return {
             "role": self.role.value,
             "findings": f"[Deep research by {self.role.value}]",
@@ -353,6 +394,9 @@ class ConceptMapper(ResearchAgent):
     async def map_concepts(self, topic: str, concepts: List[str]) -> Dict[str, Any]:
         task = f"""Create comprehensive concept map for: {topic}
         
+        Key Concepts From Research (ranked by frequency and evidence):
+        {', '.join(concepts) if concepts else 'None identified yet'}
+        
         Mapping Requirements:
         1. Identify all key concepts and sub-concepts
         2. Map hierarchical relationships (is-a, part-of)
@@ -451,157 +495,68 @@ class ComplexityTranslator(ResearchAgent):
             visual_requirements=[]
         ))
 
+# Role table: agent key -> (agent class, role); agents are built on first use and shared
+KNOWLEDGE_AGENT_TABLE = {
+    'primary_researcher': (PrimaryResearcher, KnowledgeAgentRole.PRIMARY_RESEARCHER),
+    'data_scientist': (DataScientist, KnowledgeAgentRole.DATA_SCIENTIST),
+    'concept_mapper': (ConceptMapper, KnowledgeAgentRole.CONCEPT_MAPPER),
+    'complexity_translator': (ComplexityTranslator, KnowledgeAgentRole.COMPLEXITY_TRANSLATOR),
+    'academic_researcher': (ResearchAgent, KnowledgeAgentRole.ACADEMIC_RESEARCHER),
+    'industry_analyst': (ResearchAgent, KnowledgeAgentRole.INDUSTRY_ANALYST),
+    'contrarian_researcher': (ResearchAgent, KnowledgeAgentRole.CONTRARIAN_RESEARCHER),
+    'historical_analyst': (ResearchAgent, KnowledgeAgentRole.HISTORICAL_ANALYST),
+    'framework_builder': (ResearchAgent, KnowledgeAgentRole.FRAMEWORK_BUILDER),
+    'analogy_master': (ResearchAgent, KnowledgeAgentRole.ANALOGY_MASTER),
+    'fact_verificator': (ResearchAgent, KnowledgeAgentRole.FACT_VERIFICATOR),
+    'visual_explainer': (ResearchAgent, KnowledgeAgentRole.VISUAL_EXPLAINER),
+    'example_generator': (ResearchAgent, KnowledgeAgentRole.EXAMPLE_GENERATOR),
+    'question_anticipator': (ResearchAgent, KnowledgeAgentRole.QUESTION_ANTICIPATOR),
+    'summary_master': (ResearchAgent, KnowledgeAgentRole.SUMMARY_MASTER)
+}
+
 class KnowledgeArchitect:
     """Master orchestrator for knowledge-first content"""
     def __init__(self):
         self.knowledge_graph = KnowledgeGraph()
-        self.agents = self._initialize_agents()
+        self.agents = AgentRoster(KNOWLEDGE_AGENT_TABLE)
+        self.node_cache = NodeCache()
         
-    def _initialize_agents(self) -> Dict[str, ResearchAgent]:
-        """Initialize all knowledge agents"""
-        return {
-            'primary_researcher': PrimaryResearcher(KnowledgeAgentRole.PRIMARY_RESEARCHER, self.knowledge_graph),
-            'data_scientist': DataScientist(KnowledgeAgentRole.DATA_SCIENTIST, self.knowledge_graph),
-            'concept_mapper': ConceptMapper(KnowledgeAgentRole.CONCEPT_MAPPER, self.knowledge_graph),
-            'complexity_translator': ComplexityTranslator(KnowledgeAgentRole.COMPLEXITY_TRANSLATOR, self.knowledge_graph),
-            'academic_researcher': ResearchAgent(KnowledgeAgentRole.ACADEMIC_RESEARCHER, self.knowledge_graph),
-            'industry_analyst': ResearchAgent(KnowledgeAgentRole.INDUSTRY_ANALYST, self.knowledge_graph),
-            'contrarian_researcher': ResearchAgent(KnowledgeAgentRole.CONTRARIAN_RESEARCHER, self.knowledge_graph),
-            'historical_analyst': ResearchAgent(KnowledgeAgentRole.HISTORICAL_ANALYST, self.knowledge_graph),
-            'framework_builder': ResearchAgent(KnowledgeAgentRole.FRAMEWORK_BUILDER, self.knowledge_graph),
-            'analogy_master': ResearchAgent(KnowledgeAgentRole.ANALOGY_MASTER, self.knowledge_graph),
-            'fact_verificator': ResearchAgent(KnowledgeAgentRole.FACT_VERIFICATOR, self.knowledge_graph),
-            'visual_explainer': ResearchAgent(KnowledgeAgentRole.VISUAL_EXPLAINER, self.knowledge_graph),
-            'example_generator': ResearchAgent(KnowledgeAgentRole.EXAMPLE_GENERATOR, self.knowledge_graph),
-            'question_anticipator': ResearchAgent(KnowledgeAgentRole.QUESTION_ANTICIPATOR, self.knowledge_graph),
-            'summary_master': ResearchAgent(KnowledgeAgentRole.SUMMARY_MASTER, self.knowledge_graph)
-        }
-    
     async def create_knowledge_content(self, brief: KnowledgeBrief) -> Dict[str, Any]:
         """Orchestrate creation of knowledge-first content"""
-        print(f"\n📚 Creating Knowledge-First Content: {brief.topic}")
-        print(f"   Depth: {brief.depth_level}")
-        print(f"   Scope: {brief.scope}")
-        print("=" * 50)
-        
-        # Phase 1: Deep Research & Evidence Gathering
-        print("\n🔬 Phase 1: Primary Research & Evidence Collection")
-        primary_sources = await self.agents['primary_researcher'].find_primary_sources(brief.topic)
-        academic_research = await self.agents['academic_researcher'].research(
-            "Find academic papers and research",
-            brief
-        )
-        
-        # Phase 2: Data Analysis & Patterns
-        print("\n📊 Phase 2: Data Analysis & Pattern Recognition")
-        data_analysis = await self.agents['data_scientist'].analyze_data(
-            brief.topic,
-            brief.data_requirements
-        )
-        industry_trends = await self.agents['industry_analyst'].research(
-            "Analyze industry trends and patterns",
-            brief,
-            {'primary_sources': primary_sources}
-        )
-        
-        # Phase 3: Historical & Alternative Perspectives
-        print("\n🕰️ Phase 3: Historical Context & Alternative Views")
-        historical_context = await self.agents['historical_analyst'].research(
-            "Trace historical evolution and key milestones",
-            brief,
-            {'data': data_analysis}
-        )
-        contrarian_views = await self.agents['contrarian_researcher'].research(
-            "Find dissenting opinions and alternative theories",
-            brief,
-            {'mainstream': academic_research}
-        )
-        
-        # Phase 4: Concept Mapping & Relationships
-        print("\n🗺️ Phase 4: Concept Mapping & Knowledge Structure")
-        concept_map = await self.agents['concept_mapper'].map_concepts(
-            brief.topic,
-            self._extract_concepts(primary_sources, academic_research)
-        )
-        frameworks = await self.agents['framework_builder'].research(
-            "Build mental models and frameworks",
-            brief,
-            {'concepts': concept_map}
-        )
-        
-        # Phase 5: Multi-Level Understanding
-        print("\n🎓 Phase 5: Progressive Complexity & Explanations")
-        explanations = await self.agents['complexity_translator'].create_explanations(
-            brief.topic,
-            self._identify_core_concept(concept_map)
-        )
-        analogies = await self.agents['analogy_master'].research(
-            "Create powerful analogies and metaphors",
-            brief,
-            {'concepts': concept_map}
-        )
-        
-        # Phase 6: Concrete Applications
-        print("\n🔨 Phase 6: Examples & Applications")
-        examples = await self.agents['example_generator'].research(
-            "Generate concrete examples and case studies",
-            brief,
-            {'theory': explanations}
-        )
-        visuals = await self.agents['visual_explainer'].research(
-            "Design visualizations and diagrams",
-            brief,
-            {'data': data_analysis, 'concepts': concept_map}
-        )
-        
-        # Phase 7: Verification & Gaps
-        print("\n✅ Phase 7: Fact Verification & Gap Analysis")
-        verification = await self.agents['fact_verificator'].research(
-            "Verify all claims and cross-check sources",
-            brief,
-            {'claims': self._extract_claims(primary_sources, academic_research)}
-        )
-        questions = await self.agents['question_anticipator'].research(
-            "Anticipate reader questions and confusions",
-            brief,
-            {'content': explanations}
-        )
+        # Shared agents record concepts into the graph of whichever architect is running them
+        graph = _active_graph.set(self.knowledge_graph)
+        try:
+            with pipeline_run('knowledge', brief.topic):
+                return await self._create_knowledge_content(brief)
+        finally:
+            _active_graph.reset(graph)
+
+    async def _create_knowledge_content(self, brief: KnowledgeBrief) -> Dict[str, Any]:
+        emit('run.started', title='📚 Creating Knowledge-First Content', details={
+            'Depth': brief.depth_level,
+            'Scope': brief.scope
+        })
         
-        # Phase 8: Synthesis & Summary
-        print("\n📝 Phase 8: Knowledge Synthesis & Summaries")
-        synthesis = await self.agents['summary_master'].research(
-            "Create multi-level summaries and key takeaways",
+        outputs = await run_pipeline(
+            load_pipeline('knowledge'),
             brief,
-            {'all_research': {
-                'primary': primary_sources,
-                'academic': academic_research,
-                'data': data_analysis,
-                'concepts': concept_map
-            }}
+            self.agents,
+            ops={
+                'extract_concepts': self._extract_concepts,
+                'identify_core_concept': self._identify_core_concept,
+                'extract_claims': self._extract_claims
+            },
+            cache=self.node_cache
         )
         
         # Identify knowledge gaps
         knowledge_gaps = self.knowledge_graph.find_knowledge_gaps()
         
-        print("\n🎯 Knowledge Content Creation Complete!")
+        emit('run.finished', title='🎯 Knowledge Content Creation Complete!')
         
         return {
             'brief': asdict(brief),
-            'primary_sources': primary_sources,
-            'academic_research': academic_research,
-            'data_analysis': data_analysis,
-            'industry_trends': industry_trends,
-            'historical_context': historical_context,
-            'contrarian_views': contrarian_views,
-            'concept_map': concept_map,
-            'frameworks': frameworks,
-            'explanations': explanations,
-            'analogies': analogies,
-            'examples': examples,
-            'visuals': visuals,
-            'verification': verification,
-            'anticipated_questions': questions,
-            'synthesis': synthesis,
+            **outputs,
             'knowledge_gaps': knowledge_gaps,
             'metadata': {
                 'created': datetime.now().isoformat(),
@@ -611,13 +566,48 @@ class KnowledgeArchitect:
             }
         }
     
-    def _extract_concepts(self, *research_outputs) -> List[str]:
-        """Extract key concepts from research"""
-        concepts = []
+    def _extract_concepts(self, *research_outputs, limit: int = 20) -> List[str]:
+        """Extract key concepts from research, ranked by frequency and evidence"""
+        ranked = {}  # canonical key -> {'score', 'order', 'forms'}
         for output in research_outputs:
-            if isinstance(output, dict) and 'concepts' in output:
-                concepts.extend(output['concepts'])
-        return list(set(concepts))[:20]  # Top 20 unique concepts
+            if not isinstance(output, dict):
+                continue
+            for concept in output.get('concepts') or []:
+                if isinstance(concept, dict):
+                    name = str(concept.get('name', ''))
+                    evidence = concept.get('evidence_level', 0.5)
+                else:
+                    name, evidence = str(concept), 0.5
+                key = _canonical_concept(name)
+                if not key:
+                    continue
+                if key not in ranked:
+                    # Fold near-duplicates ("LLM" vs "LLMs", typos) into an existing entry
+                    match = get_close_matches(key, list(ranked), n=1, cutoff=CONCEPT_MATCH_CUTOFF)
+                    if match:
+                        key = match[0]
+                    else:
+                        ranked[key] = {'score': 0.0, 'order': len(ranked), 'forms': {}}
+                entry = ranked[key]
+                try:
+                    evidence = min(max(float(evidence), 0.0), 1.0)
+                except (TypeError, ValueError):
+                    evidence = 0.5
+                # Every mention counts once, weighted up by how well it is supported
+                entry['score'] += 0.5 + evidence
+                surface = name.strip()
+                entry['forms'][surface] = entry['forms'].get(surface, 0) + 1
+
+        top = heapq.nlargest(
+            limit,
+            ranked.values(),
+            key=lambda entry: (entry['score'], -entry['order'])
+        )
+        # Report each concept under its most common spelling (ties broken alphabetically)
+        return [
+            min(entry['forms'].items(), key=lambda form: (-form[1], form[0]))[0]
+            for entry in top
+        ]
     
     def _identify_core_concept(self, concept_map: Dict) -> str:
         """Identify the most central concept"""
@@ -676,6 +666,7 @@ async def generate_knowledge_content(topic: str, **kwargs) -> Dict[str, Any]:
 __all__ = [
     'KnowledgeBrief',
     'KnowledgeArchitect',
+    'KNOWLEDGE_AGENT_TABLE',
     'generate_knowledge_content',
     'create_knowledge_brief',
     'KnowledgeAgentRole',
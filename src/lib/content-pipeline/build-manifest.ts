@@ -0,0 +1,167 @@
+import { promises as fs } from 'fs';
+import { createHash } from 'crypto';
+import { join, dirname, basename } from 'path';
+
+/**
+ * Dependency-tracked writes for the per-slug output files
+ * (.astro, .md, .html, .meta.json, .score.json).
+ *
+ * Each artifact is fingerprinted from its inputs (the research request,
+ * the pipeline result and the artifact's template version). An artifact is
+ * only re-rendered when that fingerprint changes or its file is missing,
+ * and a file is only rewritten when its bytes actually differ, so reruns
+ * don't churn git or trigger redeploys.
+ */
+
+export const MANIFEST_FILE = '.build-manifest.json';
+const MANIFEST_VERSION = 1;
+
+// Fields that record when something ran rather than what it produced
+const VOLATILE_KEYS = new Set(['publishDate', 'timestamp', 'generatedAt', 'created', 'lastUpdated', 'processingTime']);
+
+export interface ArtifactSpec {
+  name: string;
+  path: string;
+  /** Bump when the renderer for this artifact changes its output */
+  templateVersion: string;
+  render: () => Promise<string> | string;
+}
+
+export type ArtifactStatus = 'built' | 'unchanged';
+
+export interface ArtifactBuildResult {
+  name: string;
+  path: string;
+  status: ArtifactStatus;
+}
+
+interface ManifestEntry {
+  inputs: string;
+  output: string;
+}
+
+interface ManifestData {
+  version: number;
+  artifacts: Record<string, ManifestEntry>;
+}
+
+function sha256(content: string): string {
+  return createHash('sha256').update(content).digest('hex');
+}
+
+/**
+ * JSON with sorted keys and volatile fields removed, so the same research
+ * always produces the same fingerprint.
+ */
+export function stableStringify(value: unknown): string {
+  return JSON.stringify(value, (key, val) => {
+    if (VOLATILE_KEYS.has(key)) {
+      return undefined;
+    }
+    if (val && typeof val === 'object' && !Array.isArray(val)) {
+      return Object.keys(val)
+        .sort()
+        .reduce<Record<string, unknown>>((sorted, k) => {
+          sorted[k] = val[k];
+          return sorted;
+        }, {});
+    }
+    return val;
+  });
+}
+
+export function fingerprintInputs(...inputs: unknown[]): string {
+  return sha256(stableStringify(inputs));
+}
+
+export class BuildManifest {
+  private filePath: string;
+  private data: ManifestData;
+
+  private constructor(filePath: string, data: ManifestData) {
+    this.filePath = filePath;
+    this.data = data;
+  }
+
+  static async load(outputDir: string): Promise<BuildManifest> {
+    const filePath = join(outputDir, MANIFEST_FILE);
+    try {
+      const data = JSON.parse(await fs.readFile(filePath, 'utf-8')) as ManifestData;
+      if (data.version === MANIFEST_VERSION && data.artifacts) {
+        return new BuildManifest(filePath, data);
+      }
+    } catch (error: any) {
+      if (error.code !== 'ENOENT') {
+        console.warn(`[BuildManifest] Ignoring unreadable manifest ${filePath}:`, error);
+      }
+    }
+    return new BuildManifest(filePath, { version: MANIFEST_VERSION, artifacts: {} });
+  }
+
+  async build(artifact: ArtifactSpec, inputsFingerprint: string): Promise<ArtifactStatus> {
+    const key = basename(artifact.path);
+    const inputs = sha256(`${inputsFingerprint}:${artifact.templateVersion}`);
+    const entry = this.data.artifacts[key];
+    const existing = await readIfExists(artifact.path);
+
+    if (entry && entry.inputs === inputs && existing !== null && sha256(existing) === entry.output) {
+      return 'unchanged';
+    }
+
+    const content = await artifact.render();
+    this.data.artifacts[key] = { inputs, output: sha256(content) };
+    if (existing === content) {
+      return 'unchanged';
+    }
+
+    await fs.mkdir(dirname(artifact.path), { recursive: true });
+    await fs.writeFile(artifact.path, content, 'utf-8');
+    return 'built';
+  }
+
+  async save(): Promise<void> {
+    const artifacts = Object.keys(this.data.artifacts)
+      .sort()
+      .reduce<Record<string, ManifestEntry>>((sorted, key) => {
+        sorted[key] = this.data.artifacts[key];
+        return sorted;
+      }, {});
+    const content = JSON.stringify({ version: MANIFEST_VERSION, artifacts }, null, 2) + '\n';
+    if ((await readIfExists(this.filePath)) !== content) {
+      await fs.mkdir(dirname(this.filePath), { recursive: true });
+      await fs.writeFile(this.filePath, content, 'utf-8');
+    }
+  }
+}
+
+async function readIfExists(filePath: string): Promise<string | null> {
+  try {
+    return await fs.readFile(filePath, 'utf-8');
+  } catch (error: any) {
+    if (error.code === 'ENOENT') {
+      return null;
+    }
+    throw error;
+  }
+}
+
+/**
+ * Render and write only the artifacts whose inputs changed since the last run.
+ */
+export async function buildArtifacts(
+  outputDir: string,
+  inputs: unknown[],
+  artifacts: ArtifactSpec[]
+): Promise<ArtifactBuildResult[]> {
+  const manifest = await BuildManifest.load(outputDir);
+  const inputsFingerprint = fingerprintInputs(...inputs);
+  const results: ArtifactBuildResult[] = [];
+
+  for (const artifact of artifacts) {
+    const status = await manifest.build(artifact, inputsFingerprint);
+    results.push({ name: artifact.name, path: artifact.path, status });
+  }
+
+  await manifest.save();
+  return results;
+}
@@ -1,5 +1,9 @@
 import type { SynthesisResult, ContentSection, Citation, Insight, ContentMeta } from './config';
 
+// Bump whenever toAstroComponent/toMarkdown/toHTML change their output, so
+// incremental builds (see build-manifest.ts) regenerate existing pages.
+export const FORMATTER_VERSION = '1';
+
 export class ContentFormatter {
   async format(synthesis: SynthesisResult): Promise<SynthesisResult> {
     // Apply formatting rules
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Pluggable backends behind the agents' _call_claude
+With no backend installed the agents return their placeholder output.
+Installing one (use_backend / set_backend) routes every agent call in that
+context through backend.complete(role, prompt), which is how benchmarks run
+against simulated latency instead of a real model.
+
+backend_identity() names the installed backend and its model; cached
+pipeline outputs are keyed on it, so placeholder or simulated output is
+never reused once a real model is wired in. Backends describe themselves
+with an `identity` attribute, or a `model` one.
+"""
+
+import asyncio
+import hashlib
+import random
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Dict, Any, Optional, Iterator
+
+ISO_TIMESTAMP = re.compile(r'\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(?:\.\d+)?')
+
+_backend: ContextVar[Optional[Any]] = ContextVar('llm_backend', default=None)
+
+def prompt_key(role: str, prompt: str) -> str:
+    """Stable identity of an agent call"""
+    # Timestamps from earlier outputs are echoed into later prompts; ignore them
+    normalized = ISO_TIMESTAMP.sub('', prompt)
+    return hashlib.sha256(f"{role}\n{normalized}".encode('utf-8')).hexdigest()
+
+def current_backend():
+    return _backend.get()
+
+def set_backend(backend):
+    """Install a backend for the current context (None restores placeholders)"""
+    _backend.set(backend)
+
+def backend_identity(backend=None) -> str:
+    """Name and model of backend (default: the installed one), 'placeholder' if none"""
+    backend = backend if backend is not None else current_backend()
+    if backend is None:
+        return 'placeholder'
+    identity = getattr(backend, 'identity', None)
+    if identity:
+        return identity
+    model = getattr(backend, 'model', None)
+    return f"{type(backend).__name__}:{model}" if model else type(backend).__name__
+
+@contextmanager
+def use_backend(backend) -> Iterator[Any]:
+    token = _backend.set(backend)
+    try:
+        yield backend
+    finally:
+        _backend.reset(token)
+
+class SimulatedLLMError(RuntimeError):
+    """Injected failure from the simulated backend"""
+
+class SimulatedBackend:
+    """
+    Fake model with configurable latency, failures and response size.
+
+    Latency is lognormal around latency_ms (jitter is the sigma of the
+    underlying normal; 0 gives a fixed latency). Responses carry a filler
+    body of about response_bytes plus a few concepts, so the knowledge
+    pipeline's concept extraction has work to do.
+
+    Each call draws from its own generator seeded by (seed, role, prompt),
+    so a given call gets the same latency, failure and response no matter
+    how concurrent calls interleave.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 200.0,
+        jitter: float = 0.5,
+        error_rate: float = 0.0,
+        response_bytes: int = 2000,
+        seed: Optional[int] = None
+    ):
+        self.latency_ms = latency_ms
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.response_bytes = response_bytes
+        self.seed = seed
+        self.calls = 0
+        self.errors = 0
+        self._seen: Dict[str, int] = {}
+
+    @property
+    def identity(self) -> str:
+        # Latency and failures do not change a successful response, so they are left out
+        return f"simulated:seed={self.seed}:bytes={self.response_bytes}"
+
+    def _random_for(self, role: str, prompt: str) -> random.Random:
+        key = f"{self.seed}:{prompt_key(role, prompt)}"
+        repeat = self._seen.get(key, 0)
+        self._seen[key] = repeat + 1
+        digest = hashlib.sha256(f"{key}:{repeat}".encode('utf-8')).digest()
+        return random.Random(int.from_bytes(digest[:8], 'big'))
+
+    async def complete(self, role: str, prompt: str) -> Dict[str, Any]:
+        self.calls += 1
+        rng = self._random_for(role, prompt)
+        latency = self.latency_ms / 1000
+        if self.jitter > 0:
+            latency *= rng.lognormvariate(0, self.jitter)
+        await asyncio.sleep(latency)
+        if self.error_rate and rng.random() < self.error_rate:
+            self.errors += 1
+            raise SimulatedLLMError(f"Simulated failure for {role}")
+
+        words = max(1, self.response_bytes // 8)
+        return {
+            "role": role,
+            "output": ' '.join(f"word{rng.randrange(1000):03d}" for _ in range(words)),
+            "concepts": [
+                {
+                    "name": f"Concept {rng.randrange(30)}",
+                    "definition": f"Definition from {role}",
+                    "evidence_level": round(rng.random(), 2)
+                }
+                for _ in range(3)
+            ],
+            "timestamp": datetime.now().isoformat()
+        }
+
+__all__ = [
+    'SimulatedBackend',
+    'SimulatedLLMError',
+    'backend_identity',
+    'current_backend',
+    'prompt_key',
+    'set_backend',
+    'use_backend'
+]
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Declarative pipeline definitions and a generic DAG executor
+A pipeline is data (JSON, or YAML with PyYAML installed): a list of nodes,
+each an agent role with a method call or a task, plus the inputs it reads.
+Inputs that reference other nodes ("@node") are the edges of the DAG. The
+executor starts every node as soon as its inputs are ready, runs
+independent nodes concurrently and caches node outputs by fingerprint.
+
+A node's fingerprint covers its definition, the brief fields it declares
+(brief_fields), the digests of its input nodes' outputs and the installed
+LLM backend and model. While a node runs, agents build their prompts from
+its declared fields only (brief_lines), so the fingerprint covers all the
+brief a prompt shows. After a brief edit only nodes whose fingerprint
+changed run again: a tone change reruns
+drafting and editing but reuses research, headlines and structure. With a
+persistent store (content_store.PhaseStore) this holds across processes.
+
+Input references:
+    "brief"          the brief itself
+    "brief.topic"    a brief field
+    "@seo_research"  another node's output
+    lists and dicts are resolved element by element; anything else is a literal
+
+Node kinds:
+    {"id": "headlines", "agent": "headline_optimizer", "call": "generate_headlines", "args": ["brief", "@seo_research"]}
+    {"id": "edited", "agent": "readability_editor", "task": "Edit for flow", "context": {"content": "@optimized"}}
+    {"id": "concepts", "op": "extract_concepts", "args": ["@primary_sources", "@academic_research"]}
+
+Built-in definitions live in pipelines/ (pillar, breaking-news, knowledge).
+
+Usage:
+    definition = load_pipeline('breaking-news')
+    outputs = await run_pipeline(definition, brief, editor.agents, cache=editor.node_cache)
+    python -m src.pipeline_dag pipelines/breaking-news.json      # validate and show the stages
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass, field, asdict, is_dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable, Mapping
+
+from src.events import emit
+from src.llm_backend import backend_identity
+from src.tracing import record, span
+
+PIPELINE_DIR = Path(__file__).resolve().parent.parent / 'pipelines'
+
+@dataclass
+class Node:
+    id: str
+    agent: Optional[str] = None
+    call: Optional[str] = None
+    task: Optional[str] = None
+    args: List[Any] = field(default_factory=list)
+    context: Dict[str, Any] = field(default_factory=dict)
+    op: Optional[str] = None
+    phase: Optional[str] = None
+    cache: bool = True
+    brief_fields: Optional[List[str]] = None  # brief fields "brief" stands for here (None: all of them)
+
+    @property
+    def inputs(self) -> List[str]:
+        """Ids of the nodes this node reads"""
+        found: List[str] = []
+        _references([self.args, self.context], found)
+        return found
+
+@dataclass
+class PipelineDefinition:
+    name: str
+    nodes: List[Node]
+    result: Dict[str, Any]
+    phases: Dict[str, str] = field(default_factory=dict)  # phase name -> console title
+    task_method: str = 'generate'
+    concurrency: Optional[int] = None
+    description: str = ''
+
+    def node(self, node_id: str) -> Node:
+        for node in self.nodes:
+            if node.id == node_id:
+                return node
+        raise KeyError(node_id)
+
+    def stages(self) -> List[List[str]]:
+        """Node ids grouped by dependency depth (each stage can run concurrently)"""
+        depth: Dict[str, int] = {}
+        for node in self.nodes:  # validate() guarantees inputs come first
+            depth[node.id] = 1 + max((depth[name] for name in node.inputs), default=-1)
+        stages: List[List[str]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+        for node in self.nodes:
+            stages[depth[node.id]].append(node.id)
+        return stages
+
+def _references(value: Any, found: List[str]):
+    if isinstance(value, str) and value.startswith('@'):
+        if value[1:] not in found:
+            found.append(value[1:])
+    elif isinstance(value, dict):
+        for item in value.values():
+            _references(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            _references(item, found)
+
+def parse_pipeline(data: Dict[str, Any]) -> PipelineDefinition:
+    """Build and validate a definition from its JSON/YAML form"""
+    known = {name for name in Node.__dataclass_fields__}
+    nodes = []
+    for spec in data.get('nodes', []):
+        unknown = set(spec) - known
+        if unknown:
+            raise ValueError(f"Pipeline {data.get('name')!r}: node {spec.get('id')!r} has unknown keys {sorted(unknown)}")
+        nodes.append(Node(**spec))
+    definition = PipelineDefinition(
+        name=data['name'],
+        nodes=nodes,
+        result=data.get('result') or {node.id: f"@{node.id}" for node in nodes},
+        phases=data.get('phases', {}),
+        task_method=data.get('task_method', 'generate'),
+        concurrency=data.get('concurrency'),
+        description=data.get('description', '')
+    )
+    validate(definition)
+    return definition
+
+def validate(definition: PipelineDefinition):
+    """Reject duplicate ids, dangling references, cycles and malformed nodes"""
+    seen: Dict[str, Node] = {}
+    for node in definition.nodes:
+        if node.id in seen:
+            raise ValueError(f"Pipeline {definition.name!r}: duplicate node {node.id!r}")
+        if bool(node.op) == bool(node.agent):
+            raise ValueError(f"Pipeline {definition.name!r}: node {node.id!r} needs exactly one of agent or op")
+        if node.agent and bool(node.call) == bool(node.task):
+            raise ValueError(f"Pipeline {definition.name!r}: node {node.id!r} needs exactly one of call or task")
+        if node.brief_fields is not None and not all(isinstance(name, str) for name in node.brief_fields):
+            raise ValueError(f"Pipeline {definition.name!r}: node {node.id!r} brief_fields must be field names")
+        seen[node.id] = node
+
+    ids = set(seen)
+    for node in definition.nodes:
+        missing = [name for name in node.inputs if name not in ids]
+        if missing:
+            raise ValueError(f"Pipeline {definition.name!r}: node {node.id!r} reads unknown nodes {missing}")
+    found: List[str] = []
+    _references(definition.result, found)
+    missing = [name for name in found if name not in ids]
+    if missing:
+        raise ValueError(f"Pipeline {definition.name!r}: result reads unknown nodes {missing}")
+
+    # Order nodes so every node follows its inputs (Kahn); leftovers form a cycle
+    ordered: List[Node] = []
+    placed: set = set()
+    remaining = list(definition.nodes)
+    while remaining:
+        ready = [node for node in remaining if all(name in placed for name in node.inputs)]
+        if not ready:
+            raise ValueError(f"Pipeline {definition.name!r}: cycle through {[node.id for node in remaining]}")
+        for node in ready:
+            ordered.append(node)
+            placed.add(node.id)
+        remaining = [node for node in remaining if node.id not in placed]
+    definition.nodes = ordered
+
+def load_pipeline_file(path: str) -> PipelineDefinition:
+    source = Path(path)
+    if source.suffix in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError(f"{path}: YAML pipelines need PyYAML (pip install pyyaml)")
+        data = yaml.safe_load(source.read_text(encoding='utf-8'))
+    else:
+        data = json.loads(source.read_text(encoding='utf-8'))
+    return parse_pipeline(data)
+
+@lru_cache(maxsize=None)
+def load_pipeline(name: str) -> PipelineDefinition:
+    """A definition by name from pipelines/, or by path"""
+    if Path(name).suffix:
+        return load_pipeline_file(name)
+    for suffix in ('.json', '.yaml', '.yml'):
+        candidate = PIPELINE_DIR / f"{name}{suffix}"
+        if candidate.exists():
+            return load_pipeline_file(str(candidate))
+    raise ValueError(f"Unknown pipeline {name!r} (looked in {PIPELINE_DIR})")
+
+def available_pipelines() -> List[str]:
+    return sorted({path.stem for path in PIPELINE_DIR.glob('*') if path.suffix in ('.json', '.yaml', '.yml')})
+
+# Bump when what goes into a fingerprint changes, so stored phases stop matching
+FINGERPRINT_VERSION = 2
+
+# brief_fields of the node whose agent call is running in this task (None: the whole brief)
+_visible_fields: ContextVar[Optional[List[str]]] = ContextVar('visible_brief_fields', default=None)
+
+def brief_lines(brief: Any, labels: Mapping[str, str]) -> str:
+    """Prompt lines ("- Label: value") for the brief fields the running node declared"""
+    visible = _visible_fields.get()
+    lines = []
+    for name, label in labels.items():
+        if visible is not None and name not in visible:
+            continue
+        value = getattr(brief, name)
+        lines.append(f"- {label}: {', '.join(value) if isinstance(value, list) else value}")
+    return '\n'.join(lines)
+
+class NodeCache:
+    """In-memory LRU of node outputs keyed by fingerprint"""
+
+    def __init__(self, size: int = 256):
+        self.size = size
+        self.entries: 'OrderedDict[str, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any:
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: str, value: Any):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+@dataclass
+class NodeLedger:
+    """What a run did: every node's fingerprint, and which nodes ran or were reused"""
+    fingerprints: Dict[str, str] = field(default_factory=dict)
+    ran: List[str] = field(default_factory=list)
+    reused: List[str] = field(default_factory=list)
+
+def _canonical(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    return str(value)
+
+def digest(value: Any) -> str:
+    """sha256 of a value's canonical JSON"""
+    payload = json.dumps(value, sort_keys=True, separators=(',', ':'), default=_canonical)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def _fingerprint_inputs(value: Any, node: Node, brief: Any, digests: Mapping[str, str]) -> Any:
+    """A node's inputs with outputs replaced by digests and the brief by its declared fields"""
+    if isinstance(value, str):
+        if value.startswith('@'):
+            return {'@': digests[value[1:]]}
+        if value == 'brief':
+            if node.brief_fields is None:
+                return asdict(brief) if is_dataclass(brief) else brief
+            return {name: getattr(brief, name, None) for name in node.brief_fields}
+        if value.startswith('brief.'):
+            return getattr(brief, value[len('brief.'):])
+        return value
+    if isinstance(value, dict):
+        return {key: _fingerprint_inputs(item, node, brief, digests) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_fingerprint_inputs(item, node, brief, digests) for item in value]
+    return value
+
+def fingerprint(
+    node: Node,
+    brief: Any,
+    digests: Mapping[str, str],
+    task_method: str = 'generate',
+    backend: Optional[str] = None
+) -> str:
+    """Identity of a node's work: its definition, declared brief fields, input digests and backend"""
+    # Task nodes see the brief through the agent's prompt, so it counts as an input
+    brief_input = [] if node.call or node.op else ['brief']
+    return digest({
+        'version': FINGERPRINT_VERSION,
+        'backend': backend or backend_identity(),
+        'node': [node.agent, node.op, node.call or f"{task_method}:{node.task}"],
+        'inputs': _fingerprint_inputs([node.args, node.context, brief_input], node, brief, digests)
+    })
+
+def resolve(value: Any, brief: Any, outputs: Mapping[str, Any]) -> Any:
+    """Substitute brief and node references in a node's inputs"""
+    if isinstance(value, str):
+        if value.startswith('@'):
+            return outputs[value[1:]]
+        if value == 'brief':
+            return brief
+        if value.startswith('brief.'):
+            return getattr(brief, value[len('brief.'):])
+        return value
+    if isinstance(value, dict):
+        return {key: resolve(item, brief, outputs) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve(item, brief, outputs) for item in value]
+    return value
+
+async def run_pipeline(
+    definition: PipelineDefinition,
+    brief: Any,
+    agents: Mapping[str, Any],
+    ops: Optional[Mapping[str, Callable]] = None,
+    cache: Optional[NodeCache] = None,
+    concurrency: Optional[int] = None,
+    given: Optional[Mapping[str, Any]] = None,
+    ledger: Optional[NodeLedger] = None
+) -> Dict[str, Any]:
+    """
+    Run every node of definition for brief; returns the definition's result mapping.
+
+    Nodes named in given (shared research, say) take that output and do not
+    run. cache is anything with get(fingerprint)/put(fingerprint, output):
+    a NodeCache, or a PhaseStore to reuse phases across processes.
+    """
+    ops = ops or {}
+    ledger = ledger if ledger is not None else NodeLedger()
+    limit = concurrency or definition.concurrency
+    semaphore = asyncio.Semaphore(limit) if limit else None
+    outputs: Dict[str, Any] = {node_id: value for node_id, value in (given or {}).items()}
+    digests: Dict[str, str] = {node_id: digest(value) for node_id, value in outputs.items()}
+    backend = backend_identity()
+
+    # Phases bracket groups of nodes: started by their first node, finished by their last
+    phase_nodes: Dict[str, int] = {}
+    for node in definition.nodes:
+        if node.phase and node.id not in outputs:
+            phase_nodes[node.phase] = phase_nodes.get(node.phase, 0) + 1
+    phase_started: Dict[str, float] = {}
+
+    def node_started(node: Node):
+        if node.phase and node.phase not in phase_started:
+            phase_started[node.phase] = time.perf_counter()
+            emit('phase.started', phase=node.phase, title=definition.phases.get(node.phase, node.phase))
+
+    def node_finished(node: Node):
+        if not node.phase:
+            return
+        phase_nodes[node.phase] -= 1
+        if phase_nodes[node.phase] == 0:
+            emit('phase.finished', phase=node.phase,
+                 seconds=round(time.perf_counter() - phase_started[node.phase], 4))
+
+    async def execute(node: Node) -> Any:
+        args = resolve(node.args, brief, outputs)
+        context = resolve(node.context, brief, outputs)
+        if node.op:
+            return ops[node.op](*args, **context)
+
+        agent = agents[node.agent]
+        key = ledger.fingerprints[node.id]
+        if cache is not None and node.cache:
+            cached = cache.get(key)
+            if cached is not None:
+                emit('cache.hit', what=f"{definition.name}.{node.id}")
+                record(cache_hit=True)
+                ledger.reused.append(node.id)
+                return cached
+        ledger.ran.append(node.id)
+        visible = _visible_fields.set(node.brief_fields)
+        try:
+            if node.call:
+                output = await getattr(agent, node.call)(*args)
+            else:
+                output = await getattr(agent, definition.task_method)(node.task, brief, context or None)
+        finally:
+            _visible_fields.reset(visible)
+        if cache is not None and node.cache:
+            cache.put(key, output)
+        return output
+
+    async def run_node(node: Node) -> Any:
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            node_started(node)
+            if node.op:
+                output = await execute(node)
+            else:
+                with span(node.phase or node.id, node=node.id):
+                    output = await execute(node)
+            node_finished(node)
+            return output
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    pending = {node.id: node for node in definition.nodes if node.id not in outputs}
+    running: Dict[asyncio.Task, str] = {}
+    try:
+        while pending or running:
+            for node_id, node in list(pending.items()):
+                if all(name in outputs for name in node.inputs):
+                    ledger.fingerprints[node_id] = fingerprint(node, brief, digests, definition.task_method, backend)
+                    running[asyncio.ensure_future(run_node(node))] = node_id
+                    del pending[node_id]
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                node_id = running.pop(task)
+                outputs[node_id] = task.result()  # re-raises a failed node
+                digests[node_id] = digest(outputs[node_id])
+    finally:
+        for task in running:
+            task.cancel()
+    return resolve(definition.result, brief, outputs)
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate a pipeline definition and show its stages")
+    parser.add_argument('pipeline', nargs='?', help='pipeline name or path (default: list built-in pipelines)')
+    args = parser.parse_args()
+
+    if not args.pipeline:
+        for name in available_pipelines():
+            print(f"{name:<16} {load_pipeline(name).description}")
+        return
+    definition = load_pipeline(args.pipeline)
+    agents = sorted({node.agent for node in definition.nodes if node.agent})
+    print(f"✅ {definition.name}: {len(definition.nodes)} nodes, {len(agents)} agents ({', '.join(agents)})")
+    for number, stage in enumerate(definition.stages(), 1):
+        print(f"   stage {number}: {', '.join(stage)}")
+
+__all__ = [
+    'Node',
+    'NodeCache',
+    'NodeLedger',
+    'PipelineDefinition',
+    'available_pipelines',
+    'brief_lines',
+    'fingerprint',
+    'load_pipeline',
+    'load_pipeline_file',
+    'parse_pipeline',
+    'run_pipeline'
+]
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Profiling mode for the content and knowledge pipelines
+Measures wall time, CPU time and peak traced memory for every phase and
+agent call (using the tracing spans as boundaries), and samples the Python
+stack of the pipeline thread to find CPU hot spots in prompt building, JSON
+serialization and rendering between LLM waits.
+
+Writes to the output directory:
+    phases.json        per-span wall/CPU seconds and peak memory
+    stacks.collapsed   "frame;frame;frame count" lines for flamegraph.pl or speedscope
+
+Usage:
+    python -m src.profiling content "AI SEO Automation"
+    python -m src.profiling knowledge "Vector databases" --output profiles/vector-db
+    python generate_content.py --batch briefs.jsonl --profile profiles/batch
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from src import events, tracing
+
+SAMPLE_INTERVAL = 0.005  # seconds between stack samples
+MAX_STACK_DEPTH = 64
+
+class StackSampler(threading.Thread):
+    """Samples one thread's Python stack at a fixed interval into collapsed-stack counts"""
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL):
+        super().__init__(name='stack-sampler', daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                code = frame.f_code
+                stack.append(f"{Path(code.co_filename).name}:{code.co_name}")
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(stack))] += 1
+            self.samples += 1
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+    def collapsed(self) -> str:
+        return ''.join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+class Profiler:
+    """
+    Span listener that records wall time, CPU time and tracemalloc peak per span.
+
+    CPU time and peak memory are process-wide, so they are exact when one
+    brief runs at a time and approximate when runs overlap.
+    """
+
+    def __init__(self, output_dir: str, interval: float = SAMPLE_INTERVAL):
+        self.output_dir = Path(output_dir)
+        self.interval = interval
+        self.records: List[Dict[str, Any]] = []
+        self._open: Dict[str, Dict[str, float]] = {}
+        self._sampler: Optional[StackSampler] = None
+        self._started_tracer = False
+        self._started_tracemalloc = False
+        self._began = 0.0
+        self._cpu_began = 0.0
+        self._peak = 0
+
+    def start(self):
+        if tracing.current_tracer() is None:
+            tracing.configure(keep=False)
+            self._started_tracer = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        tracing.add_listener(self)
+        self._sampler = StackSampler(threading.get_ident(), self.interval)
+        self._sampler.start()
+        self._began = time.perf_counter()
+        self._cpu_began = time.process_time()
+
+    def stop(self) -> Dict[str, Any]:
+        wall = time.perf_counter() - self._began
+        cpu = time.process_time() - self._cpu_began
+        self._sampler.stop()
+        tracing.remove_listener(self)
+        self._fold_peak()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        if self._started_tracer:
+            tracing.disable()
+
+        report = {
+            'wall_seconds': round(wall, 6),
+            'cpu_seconds': round(cpu, 6),
+            'peak_memory_mb': round(self._peak / 1024 / 1024, 3),
+            'stack_samples': self._sampler.samples,
+            'sample_interval': self.interval,
+            'spans': self.records
+        }
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        (self.output_dir / 'phases.json').write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+        (self.output_dir / 'stacks.collapsed').write_text(self._sampler.collapsed(), encoding='utf-8')
+        return report
+
+    def _fold_peak(self):
+        """Credit the peak since the last reset to every open span, then reset it"""
+        current, peak = tracemalloc.get_traced_memory()
+        self._peak = max(self._peak, peak)
+        for began in self._open.values():
+            began['peak'] = max(began['peak'], peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def on_span_start(self, span: tracing.Span):
+        current = self._fold_peak()
+        self._open[span.span_id] = {
+            'wall': time.perf_counter(),
+            'cpu': time.process_time(),
+            'memory': current,
+            'peak': current
+        }
+
+    def on_span_end(self, span: tracing.Span):
+        self._fold_peak()
+        began = self._open.pop(span.span_id, None)
+        if began is None:
+            return
+        self.records.append({
+            'pipeline': span.pipeline,
+            'kind': span.kind,
+            'name': span.name,
+            'wall_seconds': round(time.perf_counter() - began['wall'], 6),
+            'cpu_seconds': round(time.process_time() - began['cpu'], 6),
+            # Highest memory in use during the span, above what was in use when it started
+            'peak_memory_mb': round((began['peak'] - began['memory']) / 1024 / 1024, 3)
+        })
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        print_report(self.stop(), self.output_dir)
+
+def print_report(report: Dict[str, Any], output_dir: Path):
+    print(f"\n⏱️ Profile: {report['wall_seconds']:.3f}s wall, {report['cpu_seconds']:.3f}s CPU, "
+          f"{report['peak_memory_mb']:.1f}MB peak, {report['stack_samples']} stack samples")
+    totals: Dict[tuple, Dict[str, float]] = {}
+    for record in report['spans']:
+        if record['kind'] == 'run':
+            continue
+        key = (record['pipeline'], record['kind'], record['name'])
+        total = totals.setdefault(key, {'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'peak': 0.0})
+        total['calls'] += 1
+        total['wall'] += record['wall_seconds']
+        total['cpu'] += record['cpu_seconds']
+        total['peak'] = max(total['peak'], record['peak_memory_mb'])
+
+    header = f"{'kind':<6} {'name':<44} {'calls':>5} {'wall s':>9} {'cpu s':>9} {'cpu %':>6} {'peak MB':>8}"
+    print(header)
+    print('-' * len(header))
+    for (pipeline, kind, name), total in sorted(totals.items(), key=lambda item: item[1]['cpu'], reverse=True):
+        share = total['cpu'] / total['wall'] if total['wall'] else 0.0
+        print(f"{kind:<6} {name[:44]:<44} {total['calls']:>5} {total['wall']:>9.4f} {total['cpu']:>9.4f} "
+              f"{share:>6.0%} {total['peak']:>8.2f}")
+    print(f"\n🔥 Flamegraph input: {output_dir / 'stacks.collapsed'}")
+    print(f"📊 Phase data: {output_dir / 'phases.json'}")
+
+async def profile_pipeline(pipeline: str, topic: str, output_dir: str, interval: float = SAMPLE_INTERVAL):
+    """Run one brief through a pipeline under the profiler"""
+    if pipeline == 'knowledge':
+        from src.knowledge_agents import KnowledgeArchitect, create_knowledge_brief
+        runner = KnowledgeArchitect()
+        run = lambda: runner.create_knowledge_content(create_knowledge_brief(topic))
+    else:
+        from src.content_agents import ContentEditorInChief, create_content_brief
+        runner = ContentEditorInChief()
+        run = lambda: runner.create_blog_post(create_content_brief(topic))
+
+    with Profiler(output_dir, interval):
+        result = await run()
+        events.flush()  # Let progress output finish before the report prints
+        return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile a content or knowledge pipeline run")
+    parser.add_argument('pipeline', choices=['content', 'knowledge'])
+    parser.add_argument('topic')
+    parser.add_argument('--output', default=None, help='profile directory (default: profiles/<pipeline>-<time>)')
+    parser.add_argument('--interval', type=float, default=SAMPLE_INTERVAL, help='seconds between stack samples')
+    events.add_arguments(parser)
+    args = parser.parse_args()
+    events.subscribe_from_args(args)
+
+    output = args.output or os.path.join('profiles', f"{args.pipeline}-{time.strftime('%Y%m%d_%H%M%S')}")
+    asyncio.run(profile_pipeline(args.pipeline, args.topic, output, args.interval))
+
+__all__ = [
+    'Profiler',
+    'StackSampler',
+    'profile_pipeline'
+]
+
+if __name__ == "__main__":
+    main()
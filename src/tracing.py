@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Tracing for the content and knowledge pipelines
+Each pipeline run is a trace; each phase and each agent call inside it is a
+span recording start/end time, queue wait, estimated prompt/response tokens
+and cost, cache hits and errors. Finished traces are appended to a JSON
+Lines file and can be summarized per role.
+
+Tracing is off until configure() is called (or CONTENT_TRACE_FILE is set),
+and costs one context variable lookup per span while off.
+
+Usage:
+    CONTENT_TRACE_FILE=generated_content/traces.jsonl python generate_content.py --batch briefs.jsonl
+    python -m src.tracing generated_content/traces.jsonl        # per-role summary table
+"""
+
+import argparse
+import functools
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterator
+
+# Rough token estimate until real usage numbers come back from the API
+CHARS_PER_TOKEN = 4
+# USD per 1K tokens; override with configure() to match the model in use
+PROMPT_COST_PER_1K = 0.003
+RESPONSE_COST_PER_1K = 0.015
+
+@dataclass
+class Span:
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    name: str
+    kind: str  # "run", "phase" or "agent"
+    pipeline: str
+    role: Optional[str] = None
+    start: float = 0.0
+    end: float = 0.0
+    queue_wait: float = 0.0
+    prompt_tokens: int = 0
+    response_tokens: int = 0
+    cost: float = 0.0
+    cache_hit: bool = False
+    error: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), 'duration': round(self.duration, 6)}
+
+class Tracer:
+    """Collects finished traces and appends them to the export file"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        keep: bool = True,
+        prompt_cost: float = PROMPT_COST_PER_1K,
+        response_cost: float = RESPONSE_COST_PER_1K
+    ):
+        self.path = Path(path) if path else None
+        self.keep = keep
+        self.prompt_cost = prompt_cost
+        self.response_cost = response_cost
+        self.spans: List[Span] = []
+
+    def finish(self, spans: List[Span]):
+        if self.keep:
+            self.spans.extend(spans)
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                for span in spans:
+                    f.write(json.dumps(span.to_dict(), default=str) + '\n')
+
+_tracer: Optional[Tracer] = None
+# Objects with on_span_start(span) / on_span_end(span), e.g. the profiler
+_listeners: List[Any] = []
+_trace: ContextVar[Optional[List[Span]]] = ContextVar('trace', default=None)
+_span: ContextVar[Optional[Span]] = ContextVar('span', default=None)
+
+def configure(path: Optional[str] = None, keep: bool = True, **costs) -> Tracer:
+    """Turn tracing on for this process"""
+    global _tracer
+    _tracer = Tracer(path, keep, **costs)
+    return _tracer
+
+def disable():
+    global _tracer
+    _tracer = None
+
+def current_tracer() -> Optional[Tracer]:
+    return _tracer
+
+def add_listener(listener):
+    _listeners.append(listener)
+
+def remove_listener(listener):
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+if os.environ.get('CONTENT_TRACE_FILE'):
+    configure(os.environ['CONTENT_TRACE_FILE'], keep=False)
+
+@contextmanager
+def trace_run(pipeline: str, topic: str, queue_wait: float = 0.0, **attributes) -> Iterator[Optional[Span]]:
+    """Span for a whole pipeline run; starts a new trace unless one is already open"""
+    if _tracer is None:
+        yield None
+        return
+    if _trace.get() is not None:
+        with span(pipeline, kind='run', queue_wait=queue_wait, topic=topic, **attributes) as run:
+            yield run
+        return
+
+    spans: List[Span] = []
+    trace_token = _trace.set(spans)
+    try:
+        with span(pipeline, kind='run', pipeline=pipeline, queue_wait=queue_wait, topic=topic, **attributes) as run:
+            yield run
+    finally:
+        _trace.reset(trace_token)
+        _tracer.finish(spans)
+
+@contextmanager
+def span(name: str, kind: str = 'phase', role: Optional[str] = None, pipeline: Optional[str] = None,
+         queue_wait: float = 0.0, **attributes) -> Iterator[Optional[Span]]:
+    """Child span of the current span; a no-op outside a trace"""
+    spans = _trace.get()
+    if spans is None:
+        yield None
+        return
+    parent = _span.get()
+    current = Span(
+        trace_id=parent.trace_id if parent else uuid.uuid4().hex[:16],
+        span_id=uuid.uuid4().hex[:16],
+        parent_id=parent.span_id if parent else None,
+        name=name,
+        kind=kind,
+        pipeline=pipeline or (parent.pipeline if parent else name),
+        role=role,
+        queue_wait=queue_wait,
+        attributes=attributes
+    )
+    spans.append(current)
+    span_token = _span.set(current)
+    for listener in _listeners:
+        listener.on_span_start(current)
+    current.start = time.time()
+    try:
+        yield current
+    except BaseException as error:
+        current.error = f"{type(error).__name__}: {error}"
+        raise
+    finally:
+        current.end = time.time()
+        _span.reset(span_token)
+        for listener in _listeners:
+            listener.on_span_end(current)
+
+def record(**values):
+    """Set fields (cache_hit, tokens...) on the current span; unknown keys go to attributes"""
+    current = _span.get()
+    if current is None:
+        return
+    for key, value in values.items():
+        if hasattr(current, key) and key != 'attributes':
+            setattr(current, key, value)
+        else:
+            current.attributes[key] = value
+
+def estimate_tokens(value: Any) -> int:
+    text = value if isinstance(value, str) else json.dumps(value, default=str)
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+def agent_call(method):
+    """Trace an agent's async _call_claude(self, prompt) as an agent span"""
+    @functools.wraps(method)
+    async def traced(self, prompt: str, *args, **kwargs):
+        if _trace.get() is None:
+            return await method(self, prompt, *args, **kwargs)
+        with span(self.role.value, kind='agent', role=self.role.value) as current:
+            output = await method(self, prompt, *args, **kwargs)
+            if not current.prompt_tokens:
+                current.prompt_tokens = estimate_tokens(prompt)
+            if not current.response_tokens:
+                current.response_tokens = estimate_tokens(output)
+            tracer = _tracer
+            if tracer:
+                current.cost = (
+                    current.prompt_tokens * tracer.prompt_cost + current.response_tokens * tracer.response_cost
+                ) / 1000
+            return output
+    return traced
+
+# Summaries
+
+def load_spans(path: str) -> List[Dict[str, Any]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def summarize(spans: List[Dict[str, Any]], kind: str = 'agent') -> List[Dict[str, Any]]:
+    """Aggregate spans of one kind by (pipeline, name), slowest total first"""
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for item in spans:
+        if item['kind'] == kind:
+            groups.setdefault((item['pipeline'], item['name']), []).append(item)
+
+    total_time = sum(item['duration'] for group in groups.values() for item in group) or 1.0
+    rows = []
+    for (pipeline, name), group in groups.items():
+        durations = [item['duration'] for item in group]
+        rows.append({
+            'pipeline': pipeline,
+            'name': name,
+            'calls': len(group),
+            'total': sum(durations),
+            'mean': sum(durations) / len(durations),
+            'p95': _percentile(durations, 0.95),
+            'queue_wait': sum(item['queue_wait'] for item in group),
+            'prompt_tokens': sum(item['prompt_tokens'] for item in group),
+            'response_tokens': sum(item['response_tokens'] for item in group),
+            'cost': sum(item['cost'] for item in group),
+            'cache_hits': sum(1 for item in group if item['cache_hit']),
+            'errors': sum(1 for item in group if item['error']),
+            'share': sum(durations) / total_time
+        })
+    return sorted(rows, key=lambda row: row['total'], reverse=True)
+
+def format_summary(rows: List[Dict[str, Any]]) -> str:
+    header = (f"{'pipeline':<10} {'name':<36} {'calls':>5} {'total s':>9} {'mean ms':>9} {'p95 ms':>9} "
+              f"{'tok in':>8} {'tok out':>8} {'cost $':>8} {'cache':>5} {'share':>6}")
+    lines = [header, '-' * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['pipeline'][:10]:<10} {row['name'][:36]:<36} {row['calls']:>5} {row['total']:>9.3f} "
+            f"{row['mean'] * 1000:>9.1f} {row['p95'] * 1000:>9.1f} {row['prompt_tokens']:>8} "
+            f"{row['response_tokens']:>8} {row['cost']:>8.4f} {row['cache_hits']:>5} "
+            f"{row['share']:>6.1%}"
+        )
+    return '\n'.join(lines)
+
+def print_summary(spans: List[Dict[str, Any]]):
+    for kind, title in (('agent', 'Agent calls'), ('phase', 'Phases')):
+        rows = summarize(spans, kind)
+        if rows:
+            print(f"\n📈 {title}")
+            print(format_summary(rows))
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize pipeline trace spans")
+    parser.add_argument('path', help='JSON Lines span export')
+    parser.add_argument('--pipeline', help='only spans from this pipeline (content or knowledge)')
+    args = parser.parse_args()
+
+    spans = load_spans(args.path)
+    if args.pipeline:
+        spans = [item for item in spans if item['pipeline'] == args.pipeline]
+    print_summary(spans)
+
+__all__ = [
+    'Span',
+    'Tracer',
+    'add_listener',
+    'agent_call',
+    'configure',
+    'disable',
+    'load_spans',
+    'print_summary',
+    'record',
+    'remove_listener',
+    'span',
+    'summarize',
+    'trace_run'
+]
+
+if __name__ == "__main__":
+    main()
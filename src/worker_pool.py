@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Multi-process worker pool for pipeline jobs
+Starts several scheduler processes against one job queue so JSON parsing,
+rendering and graph work spread across cores. Each process leases jobs,
+heartbeats them while they run, and picks up jobs abandoned by a process
+that died (see src/job_queue.py).
+
+Other machines can join by running the same command against a queue
+database they share; SQLite needs a filesystem with working locks for
+that, so prefer local disks and one database per host over NFS.
+
+Usage:
+    python -m src.worker_pool --processes 4 --workers 2
+    python -m src.worker_pool --processes 8 --until-idle --db generated_content/jobs.db
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import time
+from typing import List
+
+from src.job_queue import JobQueue, PriorityScheduler, LEASE_SECONDS, POLL_SECONDS
+
+def _worker_main(db: str, workers: int, until_idle: bool, lease_seconds: float, poll_seconds: float):
+    """Entry point of one worker process"""
+    # The parent handles Ctrl+C and stops workers with SIGTERM
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    scheduler = PriorityScheduler(
+        JobQueue(db),
+        workers=workers,
+        poll_seconds=poll_seconds,
+        lease_seconds=lease_seconds
+    )
+    asyncio.run(scheduler.run(until_idle=until_idle))
+
+def run_pool(
+    db: str = "generated_content/jobs.db",
+    processes: int = os.cpu_count() or 2,
+    workers: int = 2,
+    until_idle: bool = False,
+    lease_seconds: float = LEASE_SECONDS,
+    poll_seconds: float = POLL_SECONDS
+) -> int:
+    """Run worker processes until they finish (until_idle) or Ctrl+C; returns failed exit count"""
+    JobQueue(db)  # Create the schema once before workers race for it
+    context = multiprocessing.get_context('spawn')
+    pool: List[multiprocessing.Process] = []
+    for number in range(processes):
+        process = context.Process(
+            target=_worker_main,
+            args=(db, workers, until_idle, lease_seconds, poll_seconds),
+            name=f"content-worker-{number}"
+        )
+        process.start()
+        pool.append(process)
+
+    print(f"🏭 {processes} worker processes x {workers} jobs each on {db}")
+    started = time.perf_counter()
+    try:
+        for process in pool:
+            process.join()
+    except KeyboardInterrupt:
+        print("\n🛑 Stopping workers; their running jobs are requeued once leases expire")
+        for process in pool:
+            process.terminate()
+        for process in pool:
+            process.join()
+
+    failed = sum(1 for process in pool if process.exitcode not in (0, -signal.SIGTERM))
+    print(f"🏁 Worker pool stopped after {time.perf_counter() - started:.1f}s")
+    return failed
+
+def main():
+    parser = argparse.ArgumentParser(description="Run pipeline jobs across several processes")
+    parser.add_argument('--db', default="generated_content/jobs.db", help='job queue database')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 2, help='worker processes to start')
+    parser.add_argument('--workers', type=int, default=2, help='concurrent jobs per process')
+    parser.add_argument('--until-idle', action='store_true', help='exit once no jobs are queued or running')
+    parser.add_argument('--lease', type=float, default=LEASE_SECONDS, help='seconds before an unrenewed job is retried')
+    args = parser.parse_args()
+
+    failed = run_pool(args.db, max(1, args.processes), max(1, args.workers), args.until_idle, args.lease)
+    raise SystemExit(1 if failed else 0)
+
+__all__ = [
+    'run_pool'
+]
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import json
+import shutil
+
+from conftest import load_script
+
+search = load_script('build-search-index')
+
+def build(tmp_path, **kwargs):
+    return search.build_index(
+        str(tmp_path / 'generated'), str(tmp_path / 'index'), str(tmp_path / 'state.json'), **kwargs
+    )
+
+def write_draft(tmp_path, slug, text):
+    source = tmp_path / 'generated'
+    source.mkdir(exist_ok=True)
+    (source / f'{slug}.md').write_text(text, encoding='utf-8')
+
+def shard(tmp_path, key):
+    return json.loads((tmp_path / 'index' / f'{key}.json').read_text(encoding='utf-8'))
+
+def test_builds_sharded_postings(tmp_path):
+    write_draft(tmp_path, 'ai-seo', 'AI search rewards original research')
+    assert build(tmp_path) > 0
+    docs = json.loads((tmp_path / 'index' / 'docs.json').read_text(encoding='utf-8'))
+    assert [doc['slug'] for doc in docs.values()] == ['ai-seo']
+    assert 'research' in shard(tmp_path, 're')
+
+def test_unchanged_drafts_rewrite_nothing(tmp_path):
+    write_draft(tmp_path, 'ai-seo', 'AI search rewards original research')
+    build(tmp_path)
+    assert build(tmp_path) == 0
+
+def test_edit_replaces_stale_postings(tmp_path):
+    write_draft(tmp_path, 'ai-seo', 'AI search rewards original research')
+    build(tmp_path)
+    write_draft(tmp_path, 'ai-seo', 'AI search rewards fresh data')
+    build(tmp_path)
+    assert 'research' not in shard(tmp_path, 're')
+    assert 'fresh' in shard(tmp_path, 'fr')
+
+def test_deleted_index_is_rebuilt_despite_state(tmp_path):
+    write_draft(tmp_path, 'ai-seo', 'AI search rewards original research')
+    build(tmp_path)
+    shutil.rmtree(tmp_path / 'index')
+    assert build(tmp_path) > 0
+    assert search.index_intact(tmp_path / 'index')
+    assert 'research' in shard(tmp_path, 're')
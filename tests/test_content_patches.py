@@ -0,0 +1,112 @@
+import pytest
+
+from src.content_patches import EditError, apply_edits, locate
+
+DRAFT = """# AI ROI
+
+Teams expect quick wins. Teams expect quick wins.
+
+## Why it matters
+
+Budgets are tight.
+
+## Next steps
+
+Start small.
+"""
+
+def test_edits_applied_in_one_pass():
+    result = apply_edits(DRAFT, [
+        {'op': 'replace', 'find': 'Budgets are tight.', 'replace': 'Budgets are tighter than ever.'},
+        {'op': 'delete', 'find': ' Teams expect quick wins.'},
+        {'op': 'insert_after_heading', 'heading': '## why it matters', 'text': 'Boards ask for numbers.'},
+        {'op': 'insert_before_heading', 'heading': 'Next steps', 'text': 'Measure first.\n'},
+        {'op': 'append', 'text': 'Questions? Get in touch.'}
+    ])
+    assert result.rejected == []
+    assert len(result.applied) == 5
+    assert result.text == """# AI ROI
+
+Teams expect quick wins.
+
+## Why it matters
+
+Boards ask for numbers.
+
+Budgets are tighter than ever.
+
+Measure first.
+
+## Next steps
+
+Start small.
+
+Questions? Get in touch.
+"""
+
+def test_ambiguous_find_needs_occurrence():
+    edit = {'op': 'replace', 'find': 'quick wins', 'replace': 'results'}
+    result = apply_edits(DRAFT, [edit])
+    assert result.text == DRAFT
+    assert result.rejected == [{**edit, 'reason': 'find text is ambiguous (2 matches); give occurrence'}]
+
+    result = apply_edits(DRAFT, [{**edit, 'occurrence': 2}])
+    assert result.applied == [{**edit, 'occurrence': 2}]
+    assert 'Teams expect quick wins. Teams expect results.' in result.text
+
+@pytest.mark.parametrize('edit, reason', [
+    ({'op': 'replace', 'find': 'quick wins', 'replace': 'x', 'occurrence': 3}, 'out of range'),
+    ({'op': 'replace', 'find': 'quick wins', 'replace': 'x', 'occurrence': '1'}, 'out of range'),
+    ({'op': 'replace', 'find': 'not in the draft', 'replace': 'x'}, 'not in document'),
+    ({'op': 'replace', 'find': '', 'replace': 'x'}, 'empty find'),
+    ({'op': 'replace', 'find': 'Start small.'}, 'replace must be a string'),
+    ({'op': 'rewrite', 'text': 'everything'}, 'unknown op'),
+    ({'op': 'insert_after_heading', 'heading': 'Conclusion', 'text': 'x'}, 'heading not found'),
+    ({'op': 'append', 'text': '  '}, 'non-empty'),
+])
+def test_invalid_edits_rejected(edit, reason):
+    with pytest.raises(EditError, match=reason):
+        locate(DRAFT, edit)
+    result = apply_edits(DRAFT, [edit])
+    assert result.text == DRAFT
+    assert result.applied == []
+    assert reason in result.rejected[0]['reason']
+
+def test_non_object_edit_rejected():
+    result = apply_edits(DRAFT, ['delete everything'])
+    assert result.text == DRAFT
+    assert result.rejected == [{'edit': 'delete everything', 'reason': 'edit is not an object'}]
+
+def test_overlapping_edit_rejected():
+    first = {'op': 'replace', 'find': 'Budgets are tight.', 'replace': 'Money is short.'}
+    overlapping = {'op': 'delete', 'find': 'are tight'}
+    result = apply_edits(DRAFT, [first, overlapping])
+    assert result.applied == [first]
+    assert result.rejected == [{**overlapping, 'reason': 'overlaps an earlier edit'}]
+    assert 'Money is short.' in result.text
+
+def test_insert_inside_replaced_text_rejected():
+    document = "# Title\n\nIntro.\n"
+    first = {'op': 'replace', 'find': '# Title\n\nIntro.', 'replace': 'Intro.'}
+    insert = {'op': 'insert_after_heading', 'heading': 'Title', 'text': 'New'}
+    result = apply_edits(document, [first, insert])
+    assert result.applied == [first]
+    assert result.rejected[0]['reason'] == 'overlaps an earlier edit'
+
+def test_adjacent_inserts_keep_edit_order():
+    result = apply_edits(DRAFT, [
+        {'op': 'append', 'text': 'First.'},
+        {'op': 'append', 'text': 'Second.'}
+    ])
+    assert result.rejected == []
+    assert result.text.endswith('Start small.\n\nFirst.\n\nSecond.\n')
+
+def test_edits_located_against_original():
+    # The second edit's find text only exists before the first edit runs
+    result = apply_edits(DRAFT, [
+        {'op': 'replace', 'find': 'Start small.', 'replace': 'Pilot one workflow.'},
+        {'op': 'replace', 'find': 'Budgets', 'replace': 'Start small.'}
+    ])
+    assert result.rejected == []
+    assert result.text.count('Start small.') == 1
+    assert 'Pilot one workflow.' in result.text
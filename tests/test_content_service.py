@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from src.content_service import FINISHED, ContentService
+
+async def request(port, data):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(data)
+    await writer.drain()
+    reply = await reader.read()
+    writer.close()
+    return reply.split(b'\r\n', 1)[0]
+
+async def with_server(service, scenario):
+    server = await asyncio.start_server(service.handle, '127.0.0.1', 0)
+    try:
+        return await scenario(server.sockets[0].getsockname()[1])
+    finally:
+        server.close()
+        await server.wait_closed()
+
+@pytest.mark.parametrize('data', [
+    b'GARBAGE\r\n\r\n',
+    b'POST /jobs HTTP/1.1\r\nContent-Length: abc\r\n\r\n',
+    b'POST /jobs HTTP/1.1\r\nContent-Length: -3\r\n\r\n',
+])
+def test_malformed_requests_get_400(data):
+    async def scenario(port):
+        return await request(port, data), await request(port, b'GET /health HTTP/1.1\r\n\r\n')
+
+    assert asyncio.run(with_server(ContentService(), scenario)) == \
+        (b'HTTP/1.1 400 Bad Request', b'HTTP/1.1 200 OK')
+
+def test_finished_jobs_are_evicted_and_tasks_released():
+    async def scenario():
+        service = ContentService(job_ttl=0)
+        job = service.submit({'topic': 'Edge SEO'})
+        assert len(service.tasks) == 1
+        while job.status not in FINISHED:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
+        assert not service.tasks
+        service.submit({'topic': 'Edge SEO'})
+        return job.id in service.jobs, len(service.jobs)
+
+    assert asyncio.run(scenario()) == (False, 1)
+
+def test_breaking_news_jobs_run_the_fast_pipeline():
+    async def scenario():
+        service = ContentService()
+        jobs = [
+            service.submit({'kind': 'breaking-news', 'news': 'Model launch', 'implications': ['Act now']}),
+            service.submit({'topic': 'Edge SEO'})
+        ]
+        while any(job.status not in FINISHED for job in jobs):
+            await asyncio.sleep(0.01)
+        return [job.result['metadata']['pipeline'] for job in jobs]
+
+    assert asyncio.run(scenario()) == ['breaking-news', 'pillar']
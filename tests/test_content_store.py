@@ -0,0 +1,52 @@
+import gzip
+import json
+
+from src.content_store import BLOB_REF, ContentArchive
+
+def post(topic, draft):
+    return {
+        'brief': {'topic': topic, 'tone': 'expert-guide'},
+        'research': {'sources': ['a', 'b']},
+        'draft': draft
+    }
+
+def blob_count(archive):
+    return len(list(archive.blobs.root.glob('*/*.json.gz')))
+
+def test_append_find_load_round_trip(tmp_path):
+    archive = ContentArchive(str(tmp_path))
+    first = archive.append(post('AI ROI', 'first draft'), kind='blog')
+    second = archive.append(post('Data Mesh', 'second draft'), kind='blog')
+    batch = archive.append([{'day': 'Monday', 'type': 'blog', 'content': post('AI ROI', 'third draft')}], kind='weekly')
+
+    assert [entry['run_id'] for entry in archive.entries()] == [first['run_id'], second['run_id'], batch['run_id']]
+    assert archive.find(run_id=second['run_id'])[0]['slug'] == 'data-mesh'
+    assert [entry['kind'] for entry in archive.find(slug='ai-roi')] == ['blog', 'weekly']
+    assert archive.find(kind='weekly', since=first['date']) == [batch]
+
+    assert archive.get(first['run_id']) == post('AI ROI', 'first draft')
+    assert archive.load(batch)[0]['content']['draft'] == 'third draft'
+    assert archive.latest('ai-roi')[0]['day'] == 'Monday'
+    assert archive.latest('unknown') is None
+
+def test_blobs_deduplicated_across_runs(tmp_path):
+    archive = ContentArchive(str(tmp_path))
+    archive.append(post('AI ROI', 'first draft'), kind='blog')
+    assert blob_count(archive) == 3
+
+    # Same brief and research, new draft: only the draft is stored again
+    entry = archive.append(post('AI ROI', 'second draft'), kind='blog')
+    assert blob_count(archive) == 4
+
+    with open(tmp_path / entry['segment'], 'rb') as raw:
+        raw.seek(entry['offset'])
+        record = json.loads(gzip.decompress(raw.read(entry['length'])))
+    assert set(record['content']['draft']) == {BLOB_REF}
+    assert archive.get(entry['run_id'])['draft'] == 'second draft'
+
+def test_dedupe_off_stores_inline(tmp_path):
+    archive = ContentArchive(str(tmp_path), dedupe=False)
+    entry = archive.append(post('AI ROI', 'draft'), kind='blog')
+    assert blob_count(archive) == 0
+    assert BLOB_REF not in str(archive.get(entry['run_id']))
+    assert archive.get(entry['run_id']) == post('AI ROI', 'draft')
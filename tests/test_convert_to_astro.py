@@ -0,0 +1,82 @@
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from conftest import load_script
+
+convert = load_script('convert-to-astro')
+FIXTURES = Path(__file__).parent / 'fixtures'
+LINK = 'class="text-accent hover:text-primary-glow underline"'
+STRONG = '<strong class="text-accent">'
+
+def normalize(html):
+    return re.sub(r'\s+', ' ', html).strip()
+
+# Expected values are the output of the original line-walking converter
+@pytest.mark.parametrize('markdown, html', [
+    ('*a* and *b*', '<em>a</em> and <em>b</em>'),
+    ('_a_ and _b_', '<em>a</em> and <em>b</em>'),
+    ('2*3*4 and [l](x) **b**', f'2<em>3</em>4 and <a href="x" {LINK}>l</a> {STRONG}b</strong>'),
+    ('*a **b** c*', f'<em>a {STRONG}b</strong> c</em>'),
+    ('**bold** and *em*', f'{STRONG}bold</strong> and <em>em</em>'),
+    ('[**x**](y)', f'<a href="y" {LINK}>{STRONG}x</strong></a>'),
+    ('Only __5%__ of pilots, and _most_ stall', f'Only {STRONG}5%</strong> of pilots, and <em>most</em> stall'),
+    ('plain text', 'plain text'),
+])
+def test_inline_matches_original_converter(markdown, html):
+    assert convert.process_inline_markdown(markdown) == html
+
+def test_inline_code_is_escaped():
+    assert convert.process_inline_markdown('use `a < {b}` *now*') == \
+        'use <code>a &lt; &#123;b&#125;</code> <em>now</em>'
+
+@pytest.mark.parametrize('token', ['*a ', '_a ', '**a '])
+def test_unclosed_markers_scan_in_linear_time(token):
+    started = time.perf_counter()
+    convert.process_inline_markdown(token * 16000)
+    assert time.perf_counter() - started < 1.0
+
+def test_blocks_match_original_converter():
+    rules = convert.load_section_rules(convert.AI_ROI_SECTION_STYLES)
+    html = convert.markdown_to_astro_html((FIXTURES / 'draft.md').read_text(), rules)
+    assert normalize(html) == normalize((FIXTURES / 'draft.html').read_text())
+
+def layout_import(page):
+    return re.search(r"import PageLayout from '([^']+)'", page).group(1)
+
+def test_bulk_pages_import_the_layout_from_their_location(tmp_path):
+    drafts = tmp_path / 'drafts'
+    drafts.mkdir()
+    (drafts / 'post.md').write_text('# Post\nIntro line\n\n## Section\nBody *text*\n')
+    output_dir = tmp_path / 'out'
+    converted, failed = convert.bulk_convert([str(drafts)], str(output_dir), workers=1)
+    assert (converted, failed) == (1, [])
+
+    page = next(output_dir.rglob('post.astro'))
+    assert (page.parent / layout_import(page.read_text())).resolve() == convert.PAGE_LAYOUT
+    assert (output_dir / convert.BULK_MANIFEST).exists()
+
+    # Unchanged drafts are skipped on the next run
+    assert convert.bulk_convert([str(drafts)], str(output_dir), workers=1) == (0, [])
+
+def test_pages_under_src_pages_keep_the_short_import():
+    assert layout_import(convert.create_astro_page('## The Hook\nHi')) == '../layouts/PageLayout.astro'
+
+def test_section_rules_allow_their_own_groups():
+    rules = convert.SectionRules([
+        {'match': r'(?P<word>Stakes)', 'style': 'feature'},
+        {'match': r'(\d+)/\1', 'style': 'callout'},
+        {'match': r'Proof', 'style': 'feature', 'title_html': 'The Proof'},
+    ])
+    assert rules.classify('The Stakes')['style'] == 'feature'
+    assert rules.classify('The 5/5 split')['style'] == 'callout'
+    assert rules.classify('The 95/6 Divide') is None
+    # Earliest match in the heading wins; ties go to the earlier rule
+    assert rules.classify('Proof of Stakes')['title_html'] == 'The Proof'
+    assert rules.classify('Nothing here') is None
+
+def test_section_rules_reject_bad_patterns():
+    with pytest.raises(ValueError, match='Invalid match pattern'):
+        convert.SectionRules([{'match': '(unclosed', 'style': 'feature'}])
@@ -0,0 +1,35 @@
+import asyncio
+import json
+
+import generate_content
+
+class FlakyEditor:
+    def __init__(self, node_cache=None):
+        pass
+
+    async def create_blog_post(self, brief, pipeline='pillar'):
+        await asyncio.sleep(0)
+        if brief.topic == 'model outage':
+            raise RuntimeError('backend unavailable')
+        return {'brief': {'topic': brief.topic}}
+
+def test_batch_failures_name_their_brief_and_do_not_stop_the_batch(tmp_path, monkeypatch, capsys):
+    manifest = tmp_path / 'briefs.jsonl'
+    manifest.write_text('\n'.join(json.dumps({'topic': topic}) for topic in ('first', 'model outage', 'disk full', 'last')))
+    saved = []
+
+    def save_content(post, kind):
+        if post['brief']['topic'] == 'disk full':
+            raise OSError('No space left on device')
+        saved.append(post['brief']['topic'])
+        return {'slug': post['brief']['topic']}
+
+    monkeypatch.setattr(generate_content, 'ContentEditorInChief', FlakyEditor)
+    monkeypatch.setattr(generate_content, 'save_content', save_content)
+
+    assert asyncio.run(generate_content.run_batch(str(manifest), workers=2)) == 2
+    assert sorted(saved) == ['first', 'last']
+    output = capsys.readouterr().out
+    assert '❌ model outage: backend unavailable' in output
+    assert '❌ disk full: No space left on device' in output
+    assert '2/4 briefs completed' in output
@@ -0,0 +1,106 @@
+import asyncio
+
+from src.content_agents import create_content_brief
+from src.job_queue import AGING_FLOOR, JobQueue, PriorityScheduler
+
+def brief(topic, urgency):
+    quick = create_content_brief(topic)
+    quick.urgency_level = urgency
+    return quick
+
+def backdate(queue, job_id, seconds):
+    queue.db.execute("UPDATE jobs SET enqueued_at = enqueued_at - ? WHERE id = ?", (seconds, job_id))
+
+def test_claims_by_urgency_then_age(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.db'))
+    low = queue.enqueue(brief('low', 'low'))
+    first = queue.enqueue(brief('first medium', 'medium'))
+    second = queue.enqueue(brief('second medium', 'medium'))
+    news = queue.enqueue(brief('news', 'breaking-news'))
+    assert [queue.claim('w')['id'] for _ in range(4)] == [news, first, second, low]
+    assert queue.claim('w') is None
+
+def test_waiting_jobs_age_past_fresher_ones(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.db'), aging_seconds=10)
+    old_batch = queue.enqueue(brief('old batch', 'batch'))
+    backdate(queue, old_batch, 25)  # 4 - 2.5 = 1.5, ahead of a fresh medium job
+    medium = queue.enqueue(brief('medium', 'medium'))
+    assert queue.peek()['id'] == old_batch
+    assert queue.peek()['aged_priority'] < 2
+    assert queue.claim('w')['id'] == old_batch
+    assert queue.claim('w')['id'] == medium
+
+def test_backlog_never_ages_past_a_late_urgent_job(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.db'), aging_seconds=0.5)
+    backlog = [queue.enqueue(brief(f"backlog {n}", 'medium')) for n in range(3)]
+    for job_id in backlog:
+        backdate(queue, job_id, 600)
+    news = queue.enqueue(brief('news', 'breaking-news'))
+    waiting = queue.peek()
+    assert waiting['id'] == news
+    assert waiting['aged_priority'] == 0
+    assert all(job['aged_priority'] == AGING_FLOOR for job in queue.jobs('queued') if job['id'] != news)
+    assert queue.claim('w')['id'] == news
+
+def test_lease_expiry_requeues_then_fails(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.db'))
+    job_id = queue.enqueue(brief('flaky', 'medium'))
+    requeued = []
+    for _ in range(2):
+        assert queue.claim('w', lease_seconds=-1)['id'] == job_id
+        requeued.append(queue.reap_expired(max_attempts=2))
+    assert requeued == [1, 0]
+    assert queue.counts() == {'failed': 1}
+
+class SlowEditor:
+    def __init__(self):
+        self.started = []
+        self.pipelines = {}
+
+    async def create_blog_post(self, brief, pipeline='pillar'):
+        self.started.append(brief.topic)
+        self.pipelines[brief.topic] = pipeline
+        await asyncio.sleep(0 if brief.urgency_level == 'breaking-news' else 60)
+        return {'brief': {'topic': brief.topic}}
+
+class MemoryArchive:
+    def append(self, content, kind, topic=None):
+        return {'run_id': topic}
+
+def test_late_urgent_job_preempts_aged_backlog(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.db'), aging_seconds=0.5)
+    backlog = [queue.enqueue(brief(f"backlog {n}", 'medium')) for n in range(4)]
+    for job_id in backlog:
+        backdate(queue, job_id, 600)
+    editor = SlowEditor()
+    scheduler = PriorityScheduler(queue, workers=2, editor=editor, archive=MemoryArchive(), poll_seconds=0.01)
+
+    async def scenario():
+        scheduler._fill_slots()
+        await asyncio.sleep(0)
+        news = queue.enqueue(brief('news', 'breaking-news'))
+        scheduler._preempt()
+        await asyncio.sleep(0.05)
+        return news
+
+    news = asyncio.run(scenario())
+    assert editor.started[:2] == ['backlog 0', 'backlog 1']
+    assert 'news' in editor.started
+    assert editor.pipelines == {'backlog 0': 'pillar', 'backlog 1': 'pillar', 'news': 'breaking-news'}
+    assert queue.db.execute("SELECT status FROM jobs WHERE id = ?", (news,)).fetchone()[0] == 'completed'
+    assert queue.db.execute("SELECT SUM(preemptions) FROM jobs").fetchone()[0] == 1
+
+class QuickEditor:
+    async def create_blog_post(self, brief, pipeline='pillar'):
+        await asyncio.sleep(0.05)
+        return {'brief': {'topic': brief.topic}}
+
+def test_aged_backlog_of_one_tier_never_preempts(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.db'), aging_seconds=0.01)
+    for n in range(6):
+        queue.enqueue(brief(f"backlog {n}", 'medium'))
+    scheduler = PriorityScheduler(queue, workers=2, editor=QuickEditor(), archive=MemoryArchive(), poll_seconds=0.01)
+
+    asyncio.run(asyncio.wait_for(scheduler.run(until_idle=True), timeout=5))
+    assert queue.counts() == {'completed': 6}
+    assert queue.db.execute("SELECT SUM(preemptions) FROM jobs").fetchone()[0] == 0
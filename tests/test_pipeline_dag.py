@@ -0,0 +1,153 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+
+from src.content_store import PhaseStore
+from src.llm_backend import SimulatedBackend, prompt_key, use_backend
+from src.pipeline_dag import NodeCache, NodeLedger, load_pipeline, parse_pipeline, run_pipeline
+
+@dataclass
+class Brief:
+    topic: str
+    tone: str = 'expert-guide'
+    keywords: List[str] = field(default_factory=list)
+
+class EchoAgent:
+    """Deterministic agent: output depends only on its inputs"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def work(self, *args):
+        self.calls.append(args)
+        return {'output': repr(args)}
+
+    async def generate(self, task, brief, context):
+        self.calls.append((task, context))
+        return {'output': f"{task}:{brief.topic}:{context}"}
+
+DIAMOND = {
+    'name': 'diamond',
+    'nodes': [
+        {'id': 'research', 'agent': 'a', 'call': 'work', 'args': ['brief.topic']},
+        {'id': 'outline', 'agent': 'a', 'call': 'work', 'args': ['brief', '@research'], 'brief_fields': ['topic']},
+        {'id': 'evidence', 'agent': 'a', 'call': 'work', 'args': ['brief', '@research'], 'brief_fields': ['keywords']},
+        {'id': 'draft', 'agent': 'a', 'call': 'work', 'args': ['brief', '@outline', '@evidence'],
+         'brief_fields': ['topic', 'tone', 'keywords']}
+    ]
+}
+
+def run(definition, brief, agent, cache=None, ledger=None):
+    return asyncio.run(run_pipeline(definition, brief, {'a': agent}, cache=cache, ledger=ledger))
+
+def test_stages_group_independent_nodes():
+    assert parse_pipeline(DIAMOND).stages() == [['research'], ['outline', 'evidence'], ['draft']]
+
+@pytest.mark.parametrize('change, message', [
+    ({'nodes': DIAMOND['nodes'] + [DIAMOND['nodes'][0]]}, 'duplicate node'),
+    ({'nodes': [{'id': 'x', 'agent': 'a', 'call': 'work', 'args': ['@missing']}]}, 'unknown nodes'),
+    ({'nodes': [
+        {'id': 'x', 'agent': 'a', 'call': 'work', 'args': ['@y']},
+        {'id': 'y', 'agent': 'a', 'call': 'work', 'args': ['@x']}
+    ]}, 'cycle'),
+    ({'nodes': [{'id': 'x', 'agent': 'a', 'call': 'work', 'task': 'both'}]}, 'call or task'),
+])
+def test_invalid_definitions_are_rejected(change, message):
+    with pytest.raises(ValueError, match=message):
+        parse_pipeline({**DIAMOND, **change})
+
+def test_builtin_pipelines_validate():
+    assert load_pipeline('pillar').stages()[0] == ['seo_research']
+    assert len(load_pipeline('breaking-news').nodes) == 3
+
+def test_cached_rerun_makes_no_calls():
+    definition, agent, cache = parse_pipeline(DIAMOND), EchoAgent(), NodeCache()
+    first = run(definition, Brief('AI SEO'), agent, cache)
+    calls = len(agent.calls)
+    ledger = NodeLedger()
+    assert run(definition, Brief('AI SEO'), agent, cache, ledger) == first
+    assert len(agent.calls) == calls == 4
+    assert sorted(ledger.reused) == ['draft', 'evidence', 'outline', 'research']
+
+def test_edit_reruns_only_dependent_nodes():
+    definition, agent, cache = parse_pipeline(DIAMOND), EchoAgent(), NodeCache()
+    run(definition, Brief('AI SEO', keywords=['a']), agent, cache)
+    ledger = NodeLedger()
+    run(definition, Brief('AI SEO', keywords=['b']), agent, cache, ledger)
+    assert sorted(ledger.reused) == ['outline', 'research']
+    assert sorted(ledger.ran) == ['draft', 'evidence']
+
+def test_backend_identity_is_part_of_the_key(tmp_path):
+    definition, agent, store = parse_pipeline(DIAMOND), EchoAgent(), PhaseStore(str(tmp_path))
+    run(definition, Brief('AI SEO'), agent, store)
+    with use_backend(SimulatedBackend(seed=1)):
+        ledger = NodeLedger()
+        run(definition, Brief('AI SEO'), agent, store, ledger)
+    assert ledger.reused == []
+
+def test_phase_store_persists_and_refreshes(tmp_path):
+    definition, agent = parse_pipeline(DIAMOND), EchoAgent()
+    run(definition, Brief('AI SEO'), agent, PhaseStore(str(tmp_path)))
+    ledger = NodeLedger()
+    run(definition, Brief('AI SEO'), agent, PhaseStore(str(tmp_path)), ledger)
+    assert len(ledger.reused) == 4
+    ledger = NodeLedger()
+    run(definition, Brief('AI SEO'), agent, PhaseStore(str(tmp_path), refresh=True), ledger)
+    assert ledger.reused == [] and len(ledger.ran) == 4
+
+class PromptLog:
+    """Backend that records each role's prompt; output depends only on the prompt"""
+    identity = 'prompt-log'
+
+    def __init__(self):
+        self.prompts = {}
+
+    async def complete(self, role, prompt):
+        self.prompts[role] = prompt
+        return {'output': f"{role} {prompt_key(role, prompt)}"}
+
+def test_prompts_show_only_declared_brief_fields(tmp_path):
+    from src.content_agents import ContentAgentRole, ContentEditorInChief, create_content_brief
+
+    backend = PromptLog()
+    with use_backend(backend):
+        asyncio.run(ContentEditorInChief(node_cache=PhaseStore(str(tmp_path))).create_blog_post(
+            create_content_brief('AI SEO')))
+    headlines = backend.prompts[ContentAgentRole.HEADLINE_OPTIMIZER.value]
+    draft = backend.prompts[ContentAgentRole.TECHNICAL_WRITER.value]
+    assert '- Secondary Keywords:' in headlines
+    assert '- Tone:' not in headlines and '- Word Count Target:' not in headlines
+    assert '- Tone: expert-guide' in draft
+
+def test_pillar_tone_edit_reuses_planning_phases(tmp_path):
+    from src.content_agents import ContentEditorInChief, create_content_brief
+
+    store = PhaseStore(str(tmp_path))
+    brief = create_content_brief('AI SEO')
+    with use_backend(PromptLog()):
+        asyncio.run(ContentEditorInChief(node_cache=store).create_blog_post(brief))
+        brief.tone = 'contrarian'
+        post = asyncio.run(ContentEditorInChief(node_cache=store).create_blog_post(brief))
+    assert post['metadata']['reused_phases'] == ['seo_research', 'headlines', 'structure', 'data']
+
+def test_cluster_posts_share_research_without_touching_caller_briefs():
+    from src.content_agents import ContentAgentRole, ContentEditorInChief, create_content_brief
+
+    class CountingLog(PromptLog):
+        def __init__(self):
+            super().__init__()
+            self.research_calls = 0
+
+        async def complete(self, role, prompt):
+            self.research_calls += role == ContentAgentRole.SEO_RESEARCHER.value
+            return await super().complete(role, prompt)
+
+    briefs = [create_content_brief('AI SEO'), create_content_brief('AI content ops')]
+    backend = CountingLog()
+    with use_backend(backend):
+        posts = asyncio.run(ContentEditorInChief().create_cluster_posts('Enterprise AI', briefs))
+    assert backend.research_calls == 1
+    assert [post['brief']['topic_cluster'] for post in posts] == ['Enterprise AI', 'Enterprise AI']
+    assert [brief.topic_cluster for brief in briefs] == [None, None]